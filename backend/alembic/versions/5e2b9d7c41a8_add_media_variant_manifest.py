@@ -0,0 +1,26 @@
+"""Add variant manifest to media assets
+
+Stores the resized variants generated for uploaded images.
+
+Revision ID: 5e2b9d7c41a8
+Revises: a7c3e91f2b54
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2b9d7c41a8'
+down_revision = 'a7c3e91f2b54'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('media_assets', sa.Column('variant_manifest', sa.JSON(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('media_assets', 'variant_manifest')
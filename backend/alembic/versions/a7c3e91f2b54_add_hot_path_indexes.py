@@ -0,0 +1,84 @@
+"""Add indexes for hot filter paths
+
+Composite indexes for the country, departure, price chart, media and review
+lookups, partial indexes over active rows for the featured and newest listings,
+and indexes on the second primary key column of the association tables (the
+primary key only covers lookups by its first column).
+
+On PostgreSQL the indexes are built with CREATE INDEX CONCURRENTLY so the tables
+stay writable; that can't run in a transaction, hence the autocommit blocks.
+
+Revision ID: a7c3e91f2b54
+Revises: 3c1d8a5e7f20
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c3e91f2b54'
+down_revision = '3c1d8a5e7f20'
+branch_labels = None
+depends_on = None
+
+# (name, table, columns, partial index predicate)
+INDEXES = [
+    ('ix_packages_country_id_is_active', 'packages', ['country_id', 'is_active'], None),
+    ('ix_packages_active_is_featured', 'packages', ['is_featured'], 'is_active = true'),
+    ('ix_packages_active_created_at', 'packages', ['created_at'], 'is_active = true'),
+    ('ix_group_trips_country_id_is_active', 'group_trips', ['country_id', 'is_active'], None),
+    ('ix_group_trips_active_is_featured', 'group_trips', ['is_featured'], 'is_active = true'),
+    ('ix_hotels_country_id_is_active', 'hotels', ['country_id', 'is_active'], None),
+    ('ix_attractions_country_id_is_active', 'attractions', ['country_id', 'is_active'], None),
+    ('ix_accommodations_country_id_is_active', 'accommodations', ['country_id', 'is_active'], None),
+    ('ix_group_trip_departures_group_trip_id_start_date', 'group_trip_departures', ['group_trip_id', 'start_date'], None),
+    ('ix_package_price_charts_package_id_dates', 'package_price_charts', ['package_id', 'start_date', 'end_date'], None),
+    ('ix_media_assets_entity_type_entity_id', 'media_assets', ['entity_type', 'entity_id'], None),
+    ('ix_reviews_package_id_is_approved', 'reviews', ['package_id', 'is_approved'], None),
+    ('ix_reviews_group_trip_id_is_approved', 'reviews', ['group_trip_id', 'is_approved'], None),
+    ('ix_blog_posts_published_created_at', 'blog_posts', ['created_at'], 'is_active = true AND is_published = true'),
+    # Association tables
+    ('ix_package_holiday_types_holiday_type_id', 'package_holiday_types', ['holiday_type_id'], None),
+    ('ix_group_trip_holiday_types_holiday_type_id', 'group_trip_holiday_types', ['holiday_type_id'], None),
+    ('ix_country_activities_activity_id', 'country_activities', ['activity_id'], None),
+    ('ix_activity_media_media_asset_id', 'activity_media', ['media_asset_id'], None),
+    ('ix_package_attractions_attraction_id', 'package_attractions', ['attraction_id'], None),
+    ('ix_group_trip_attractions_attraction_id', 'group_trip_attractions', ['attraction_id'], None),
+    ('ix_package_hotels_hotel_id', 'package_hotels', ['hotel_id'], None),
+    ('ix_group_trip_hotels_hotel_id', 'group_trip_hotels', ['hotel_id'], None),
+    ('ix_package_inclusions_inclusion_id', 'package_inclusions', ['inclusion_id'], None),
+    ('ix_package_exclusions_exclusion_id', 'package_exclusions', ['exclusion_id'], None),
+    ('ix_group_trip_inclusions_inclusion_id', 'group_trip_inclusions', ['inclusion_id'], None),
+    ('ix_group_trip_exclusions_exclusion_id', 'group_trip_exclusions', ['exclusion_id'], None),
+    ('ix_blog_post_tags_tag_id', 'blog_post_tags', ['tag_id'], None),
+    ('ix_itinerary_hotels_hotel_id', 'itinerary_hotels', ['hotel_id'], None),
+    ('ix_itinerary_attractions_attraction_id', 'itinerary_attractions', ['attraction_id'], None),
+    ('ix_itinerary_item_activities_activity_id', 'itinerary_item_activities', ['activity_id'], None),
+    ('ix_hotel_media_media_asset_id', 'hotel_media', ['media_asset_id'], None),
+    ('ix_attraction_media_media_asset_id', 'attraction_media', ['media_asset_id'], None),
+    ('ix_accommodation_media_media_asset_id', 'accommodation_media', ['media_asset_id'], None),
+    ('ix_package_media_media_asset_id', 'package_media', ['media_asset_id'], None),
+    ('ix_group_trip_media_media_asset_id', 'group_trip_media', ['media_asset_id'], None),
+    ('ix_blog_post_media_media_asset_id', 'blog_post_media', ['media_asset_id'], None),
+    ('ix_user_roles_role_id', 'user_roles', ['role_id'], None),
+    ('ix_role_permissions_permission_id', 'role_permissions', ['permission_id'], None),
+]
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name, table, columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
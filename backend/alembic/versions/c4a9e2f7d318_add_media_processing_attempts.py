@@ -0,0 +1,27 @@
+"""Add processing attempts to media assets
+
+Counts image processing runs so assets whose dimensions can't be read stop
+being picked up by the batch processing task.
+
+Revision ID: c4a9e2f7d318
+Revises: 5e2b9d7c41a8
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a9e2f7d318'
+down_revision = '5e2b9d7c41a8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('media_assets', sa.Column('processing_attempts', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    op.drop_column('media_assets', 'processing_attempts')
@@ -24,6 +24,10 @@ from app.api.api_v1.endpoints import (
     exclusions,
     package_price_charts,
     stats,
+    tasks,
+    diagnostics,
+    batch,
+    pages,
 )
 
 api_router = APIRouter()
@@ -44,6 +48,8 @@ api_router.include_router(exclusions.router, prefix="/exclusions", tags=["Exclus
 api_router.include_router(blog.router, prefix="/blog", tags=["Blog"])
 api_router.include_router(search.router, prefix="/search", tags=["Search"])
 api_router.include_router(stats.router, prefix="/stats", tags=["Stats"])
+api_router.include_router(batch.router, prefix="/batch", tags=["Batch"])
+api_router.include_router(pages.router, prefix="/pages", tags=["Pages"])
 
 # Media APIs
 api_router.include_router(media.router, prefix="/media", tags=["Media"])
@@ -56,3 +62,5 @@ api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(users.router, prefix="/users", tags=["Users"])
 api_router.include_router(itinerary.router, prefix="/itinerary", tags=["Itinerary"])
 api_router.include_router(package_price_charts.router, prefix="", tags=["Package Price Charts"])
+api_router.include_router(tasks.router, prefix="/tasks", tags=["Tasks"])
+api_router.include_router(diagnostics.router, prefix="/diagnostics", tags=["Diagnostics"])
@@ -3,10 +3,13 @@ from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
+from app.api.api_v1.endpoints.batch import parse_batch_keys
+from app.core.serialization import render_orm
 from app.db.database import get_db
 from app.models.user import User
 from app.schemas.accommodation import AccommodationResponse, AccommodationCreate, AccommodationUpdate, AccommodationWithCountryResponse
 from app.services.accommodation import accommodation_service
+from app.services.batch import batch_service
 from app.auth.dependencies import get_current_user, has_permission
 
 router = APIRouter()
@@ -16,10 +19,16 @@ def get_accommodations(
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
+    ids: str = Query(None, description="Comma-separated IDs to fetch, formatted as by /{id}, e.g. 1,2,3"),
+    slugs: str = Query(None, description="Comma-separated slugs to fetch, formatted as by /slug/{slug}"),
 ) -> Any:
     """
-    Retrieve all accommodations.
+    Retrieve all accommodations, or the accommodations with the given IDs and slugs.
     """
+    if ids or slugs:
+        accommodation_ids, accommodation_slugs = parse_batch_keys(ids, slugs)
+        accommodations = batch_service.get_many(db, "accommodations", ids=accommodation_ids, slugs=accommodation_slugs)
+        return render_orm(accommodations, AccommodationWithCountryResponse)
     accommodations = accommodation_service.get_accommodations(db, skip=skip, limit=limit)
     return accommodations
 
@@ -4,12 +4,15 @@ from pydantic import BaseModel
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
+from app.api.api_v1.endpoints.batch import parse_batch_keys
+from app.core.serialization import render_orm
 from app.db.database import get_db
 from app.models.user import User
 from app.schemas.attraction import AttractionResponse, AttractionCreate, AttractionUpdate, AttractionWithCountryResponse, AttractionWithRelationshipsResponse
 from app.schemas.package import PackageWithCountryResponse
 from app.schemas.group_trip import GroupTripWithCountryResponse
 from app.services.attraction import attraction_service
+from app.services.batch import batch_service
 from app.auth.dependencies import get_current_user, has_permission
 
 class SetCoverImageRequest(BaseModel):
@@ -24,10 +27,16 @@ def get_attractions(
     skip: int = 0,
     limit: int = 100,
     country: str = Query(None, description="Filter attractions by country name"),
+    ids: str = Query(None, description="Comma-separated IDs to fetch, formatted as by /{id}, e.g. 1,2,3"),
+    slugs: str = Query(None, description="Comma-separated slugs to fetch, formatted as by /slug/{slug}"),
 ) -> Any:
     """
-    Retrieve all attractions.
+    Retrieve all attractions, or the attractions with the given IDs and slugs.
     """
+    if ids or slugs:
+        attraction_ids, attraction_slugs = parse_batch_keys(ids, slugs)
+        attractions = batch_service.get_many(db, "attractions", ids=attraction_ids, slugs=attraction_slugs)
+        return render_orm(attractions, AttractionWithCountryResponse)
     if country:
         # Find country by name and get attractions for that country
         from app.models.country import Country
@@ -64,32 +73,7 @@ def get_attraction(
     attraction = attraction_service.get_attraction(db, attraction_id=attraction_id)
     if attraction is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Attraction not found")
-    
-    # Add gallery images from media service
-    from app.services.media import media_service
-    gallery_images = media_service.get_media_assets_by_entity(db, entity_type="attraction", entity_id=attraction.id)
-    
-    # Create gallery images list
-    gallery_images_list = []
-    for media_asset in gallery_images:
-        # Generate proper image URL
-        image_url = media_service.get_presigned_url(db, media_asset.id)
-        if not image_url and media_asset.file_path.startswith("cloudflare://"):
-            from app.core.cloudflare_config import cloudflare_settings
-            image_url = f"{cloudflare_settings.delivery_url}/{media_asset.storage_key}/medium"
-        elif not image_url:
-            image_url = media_asset.file_path
-            
-        gallery_images_list.append({
-            'id': media_asset.id,
-            'file_path': image_url,
-            'alt_text': media_asset.alt_text,
-            'caption': media_asset.caption
-        })
-    
-    # Add gallery_images to the attraction object
-    attraction.gallery_images = gallery_images_list
-    
+    attraction_service.set_gallery_images([attraction])
     return attraction
 
 @router.get("/slug/{slug}", response_model=AttractionWithCountryResponse)
@@ -103,32 +87,7 @@ def get_attraction_by_slug(
     attraction = attraction_service.get_attraction_by_slug(db, slug=slug)
     if attraction is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Attraction not found")
-    
-    # Add gallery images from media service
-    from app.services.media import media_service
-    gallery_images = media_service.get_media_assets_by_entity(db, entity_type="attraction", entity_id=attraction.id)
-    
-    # Create gallery images list
-    gallery_images_list = []
-    for media_asset in gallery_images:
-        # Generate proper image URL
-        image_url = media_service.get_presigned_url(db, media_asset.id)
-        if not image_url and media_asset.file_path.startswith("cloudflare://"):
-            from app.core.cloudflare_config import cloudflare_settings
-            image_url = f"{cloudflare_settings.delivery_url}/{media_asset.storage_key}/medium"
-        elif not image_url:
-            image_url = media_asset.file_path
-            
-        gallery_images_list.append({
-            'id': media_asset.id,
-            'file_path': image_url,
-            'alt_text': media_asset.alt_text,
-            'caption': media_asset.caption
-        })
-    
-    # Add gallery_images to the attraction object
-    attraction.gallery_images = gallery_images_list
-    
+    attraction_service.set_gallery_images([attraction])
     return attraction
 
 @router.post("/", response_model=AttractionResponse)
@@ -296,11 +255,14 @@ def get_trips_by_attraction(
     from app.services.media import media_service
     gallery_images = media_service.get_media_assets_by_entity(db, entity_type="attraction", entity_id=attraction.id)
     
+    # Generate all gallery image URLs in one batch
+    image_urls = media_service.get_media_urls(gallery_images)
+    
     # Create gallery images list
     gallery_images_list = []
     for media_asset in gallery_images:
         # Generate proper image URL
-        image_url = media_service.get_presigned_url(db, media_asset.id)
+        image_url = image_urls.get(media_asset.id)
         if not image_url and media_asset.file_path.startswith("cloudflare://"):
             from app.core.cloudflare_config import cloudflare_settings
             image_url = f"{cloudflare_settings.delivery_url}/{media_asset.storage_key}/medium"
@@ -349,11 +311,14 @@ def get_trips_by_attraction_slug(
     from app.services.media import media_service
     gallery_images = media_service.get_media_assets_by_entity(db, entity_type="attraction", entity_id=attraction.id)
     
+    # Generate all gallery image URLs in one batch
+    image_urls = media_service.get_media_urls(gallery_images)
+    
     # Create gallery images list
     gallery_images_list = []
     for media_asset in gallery_images:
         # Generate proper image URL
-        image_url = media_service.get_presigned_url(db, media_asset.id)
+        image_url = image_urls.get(media_asset.id)
         if not image_url and media_asset.file_path.startswith("cloudflare://"):
             from app.core.cloudflare_config import cloudflare_settings
             image_url = f"{cloudflare_settings.delivery_url}/{media_asset.storage_key}/medium"
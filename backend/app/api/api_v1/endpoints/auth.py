@@ -4,7 +4,10 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.auth.password_hashing import PasswordHashPoolFull
+from app.core.metrics import LOGIN_ATTEMPTS
 from app.db.database import get_db
 from app.schemas.token import Token
 from app.schemas.user import UserCreate, UserResponse
@@ -15,22 +18,32 @@ from app.models.user import User
 router = APIRouter()
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests.
     """
-    user = auth_service.authenticate_user(db, form_data.username, form_data.password)
+    try:
+        user = await auth_service.authenticate_user_async(db, form_data.username, form_data.password)
+    except PasswordHashPoolFull:
+        LOGIN_ATTEMPTS.labels(result="rejected").inc()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many logins in progress, try again shortly",
+            headers={"Retry-After": "1"},
+        )
     if not user:
+        LOGIN_ATTEMPTS.labels(result="failure").inc()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Update last login timestamp
-    auth_service.update_last_login(db, user)
+    # Update last login timestamp (also saves a rehashed password)
+    await run_in_threadpool(auth_service.update_last_login, db, user)
+    LOGIN_ATTEMPTS.labels(result="success").inc()
     
     # Generate tokens
     tokens = auth_service.generate_tokens(user.id)
@@ -0,0 +1,65 @@
+from typing import Any, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.serialization import PrerenderedJSONResponse, serialize_orm
+from app.db.database import get_db
+from app.schemas.batch import BatchGetRequest, BatchGetResponse
+from app.services.batch import BATCH_TYPES, batch_service
+
+router = APIRouter()
+
+def _check_key_count(count: int) -> None:
+    if count > settings.BATCH_MAX_KEYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BATCH_MAX_KEYS} ids and slugs can be requested at once",
+        )
+
+def parse_batch_keys(ids: Optional[str], slugs: Optional[str]) -> Tuple[List[int], List[str]]:
+    """
+    Parse `ids=` and `slugs=` query parameters of list endpoints.
+
+    Args:
+        ids: Comma-separated entity IDs
+        slugs: Comma-separated entity slugs
+
+    Returns:
+        The IDs and slugs
+
+    Raises:
+        HTTPException: 400 if an ID isn't an integer or too many keys are requested
+    """
+    slug_list = [slug.strip() for slug in (slugs or "").split(",") if slug.strip()]
+    try:
+        id_list = [int(id) for id in (ids or "").split(",") if id.strip()]
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids must be comma-separated integers")
+    _check_key_count(len(id_list) + len(slug_list))
+    return id_list, slug_list
+
+@router.post("/get", response_model=BatchGetResponse, response_model_exclude_none=True)
+def batch_get(
+    request: BatchGetRequest,
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    Retrieve entities of several types by ID or slug in one request.
+
+    Each type is read with a single query and formatted as by its single-item
+    endpoint (e.g. `/packages/{id}`). Only the requested types are returned, with
+    entities in the order requested; unknown or inactive ones are left out.
+    """
+    requested = {
+        entity_type: keys for entity_type, keys in request if keys is not None
+    }
+    _check_key_count(sum(len(keys.ids) + len(keys.slugs) for keys in requested.values()))
+
+    content = {}
+    for entity_type, keys in requested.items():
+        schema = BATCH_TYPES[entity_type].schema
+        entities = batch_service.get_many(db, entity_type, ids=keys.ids, slugs=keys.slugs)
+        content[entity_type] = [serialize_orm(entity, schema) for entity in entities]
+    return PrerenderedJSONResponse(content)
@@ -5,13 +5,14 @@ from typing import Any, List, Optional
 from datetime import datetime, timedelta
 import io
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form, Query, status
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
 from app.models.user import User
 from app.auth.dependencies import get_current_user, has_permission
 from app.services.cloudflare_images import cloudflare_images_service
+from app.tasks.media_tasks import process_media_image
 from app.schemas.cloudflare_images import (
     DirectUploadRequest, DirectUploadResponse,
     ImageUploadResponse, ImageListResponse,
@@ -84,7 +85,7 @@ async def upload_image(
                 )
         
         # Upload image to Cloudflare
-        response = cloudflare_images_service.upload_image(
+        response = await cloudflare_images_service.upload_image_async(
             file_data=file_content,
             file_name=file.filename,
             require_signed_urls=require_signed_urls,
@@ -111,6 +112,7 @@ async def upload_image(
 
 @router.post("/upload-and-create-media", response_model=dict)
 async def upload_image_and_create_media(
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     file: UploadFile = File(...),
     entity_type: str = Form("activity"),
@@ -124,6 +126,9 @@ async def upload_image_and_create_media(
 ) -> Any:
     """
     Upload an image to Cloudflare Images and create a corresponding MediaAsset record.
+    
+    Image processing (dimensions and resized variants) runs in the background after
+    the response is sent.
     """
     try:
         # Read file content
@@ -142,7 +147,7 @@ async def upload_image_and_create_media(
                 )
         
         # Upload image to Cloudflare
-        cf_response = cloudflare_images_service.upload_image(
+        cf_response = await cloudflare_images_service.upload_image_async(
             file_data=file_content,
             file_name=file.filename,
             require_signed_urls=require_signed_urls,
@@ -187,6 +192,8 @@ async def upload_image_and_create_media(
         if entity_type and entity_id:
             media_service.associate_media_with_entity(db, db_media.id, entity_type, entity_id)
         
+        background_tasks.add_task(process_media_image, db_media.id)
+        
         # Ensure we're returning valid JSON by using a proper response model
         from fastapi.responses import JSONResponse
         
@@ -1,8 +1,9 @@
 from typing import Any, List
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.orm import Session
 
+from app.core.response_cache import response_cache
 from app.db.database import get_db
 from app.models.user import User
 from app.schemas.country import CountryResponse, CountryCreate, CountryUpdate, CountryWithRegionResponse
@@ -13,6 +14,12 @@ from app.auth.dependencies import get_current_user, has_permission
 
 router = APIRouter()
 
+# Tables country details are read from, for invalidating cached responses
+COUNTRY_DETAILS_TABLES = frozenset({
+    "countries", "regions", "packages", "group_trips", "group_trip_departures",
+    "attractions", "accommodations", "hotels", "country_visit_info",
+})
+
 @router.get("/", response_model=List[CountryResponse])
 @router.get("", response_model=List[CountryResponse])
 def get_countries(
@@ -121,15 +128,20 @@ def get_country_by_slug(
 @router.get("/slug/{slug}/details", response_model=Any)
 def get_country_details_by_slug(
     slug: str,
+    request: Request,
     db: Session = Depends(get_db),
 ) -> Any:
     """
     Retrieve a specific country by slug with all related destinations data.
     """
-    country_details = country_service.get_country_details_by_slug(db, slug=slug)
-    if country_details is None:
+    cached = response_cache.get_or_build(
+        f"country-details:{slug}",
+        lambda: country_service.get_country_details_by_slug(db, slug=slug),
+        COUNTRY_DETAILS_TABLES,
+    )
+    if cached is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Country not found")
-    return country_details
+    return cached.to_response(request)
 
 @router.post("/", response_model=CountryResponse)
 def create_country(
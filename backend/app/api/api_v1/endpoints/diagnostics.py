@@ -0,0 +1,177 @@
+import asyncio
+import os
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.auth.dependencies import has_permission
+from app.core.config import settings
+from app.core.latency_budget import get_slow_requests
+from app.core.memory import (
+    get_memory_summary, get_top_allocations, reset_allocation_baseline,
+    start_allocation_tracing, stop_allocation_tracing
+)
+from app.core.profiling import (
+    SamplingProfiler, create_profile_token, get_request_profile, list_request_profiles
+)
+from app.models.user import User
+from app.schemas.diagnostics import (
+    AllocationReport, MemorySummary, ProfileTokenResponse, RequestProfileList, SlowRequestList
+)
+
+router = APIRouter()
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile_worker(
+    seconds: float = Query(10, gt=0, le=settings.PROFILER_MAX_SECONDS),
+    interval_ms: float = Query(settings.PROFILER_INTERVAL_MS, ge=1, le=1000),
+    worker_pid: Optional[int] = Query(None, description="Only profile if this worker handles the request"),
+    current_user: User = Depends(has_permission("system:profile")),
+) -> Any:
+    """
+    Profile the worker handling this request for a number of seconds.
+    
+    Returns flamegraph-compatible collapsed stacks. Requests are load-balanced
+    across workers, so pass `worker_pid` (see the X-Worker-PID response header)
+    to target a specific worker; other workers answer 409 and the call can be retried.
+    """
+    headers = {"X-Worker-PID": str(os.getpid())}
+    if worker_pid is not None and worker_pid != os.getpid():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Request was handled by worker {os.getpid()}, not {worker_pid}",
+            headers=headers,
+        )
+    
+    profiler = SamplingProfiler(interval=interval_ms / 1000)
+    if not profiler.start():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profiling session is already running in this worker",
+            headers=headers,
+        )
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        collapsed = profiler.stop()
+    
+    headers["X-Profile-Samples"] = str(profiler.samples)
+    return PlainTextResponse(collapsed, headers=headers)
+
+@router.post("/profile/token", response_model=ProfileTokenResponse)
+async def create_request_profile_token(
+    expires_in: int = Query(300, gt=0, le=3600),
+    current_user: User = Depends(has_permission("system:profile")),
+) -> Any:
+    """
+    Create a token that enables per-request profiling.
+    
+    Requests sent with the token in the X-Profile-Token header are profiled; the
+    response carries an X-Profile-ID header and the collapsed stacks are logged and
+    can be fetched from the worker via GET /diagnostics/profile/requests/{profile_id}.
+    """
+    token, expires_at = create_profile_token(expires_in)
+    return {"token": token, "expires_at": expires_at, "worker_pid": os.getpid()}
+
+@router.get("/profile/requests", response_model=RequestProfileList)
+async def get_request_profiles(
+    current_user: User = Depends(has_permission("system:profile")),
+) -> Any:
+    """
+    List the request profiles stored in the worker handling this request.
+    """
+    return {"worker_pid": os.getpid(), "profiles": list_request_profiles()}
+
+@router.get("/profile/requests/{profile_id}", response_class=PlainTextResponse)
+async def get_request_profile_stacks(
+    profile_id: str,
+    current_user: User = Depends(has_permission("system:profile")),
+) -> Any:
+    """
+    Get the collapsed stacks of a profiled request.
+    """
+    collapsed = get_request_profile(profile_id)
+    if collapsed is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found in this worker; it is also available in the logs",
+            headers={"X-Worker-PID": str(os.getpid())},
+        )
+    return PlainTextResponse(collapsed)
+
+@router.get("/slow-requests", response_model=SlowRequestList)
+async def get_slow_request_captures(
+    limit: int = Query(20, ge=1, le=100),
+    sort: str = Query("duration", pattern="^(duration|recent)$"),
+    current_user: User = Depends(has_permission("system:diagnostics")),
+) -> Any:
+    """
+    Get the recent requests that exceeded their route's latency budget.
+    
+    Captures are kept per worker; `sort` is "duration" for the slowest first or
+    "recent" for the newest first.
+    """
+    return {"worker_pid": os.getpid(), "requests": get_slow_requests(limit=limit, sort=sort)}
+
+@router.get("/memory", response_model=MemorySummary)
+async def get_memory_usage(
+    current_user: User = Depends(has_permission("system:diagnostics")),
+) -> Any:
+    """
+    Get the memory usage and GC stats of the worker handling this request.
+    """
+    return get_memory_summary()
+
+@router.post("/memory/tracing", response_model=MemorySummary)
+async def start_memory_tracing(
+    frames: int = Query(1, ge=1, le=50, description="Stack frames stored per allocation"),
+    current_user: User = Depends(has_permission("system:diagnostics")),
+) -> Any:
+    """
+    Start tracing allocations in this worker and take a baseline snapshot.
+    
+    Tracing slows down the worker, so stop it once done. Allocation diffs
+    against the baseline are available from GET /diagnostics/memory/allocations?diff=true.
+    """
+    if not start_allocation_tracing(frames):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Allocation tracing is already running in this worker",
+            headers={"X-Worker-PID": str(os.getpid())},
+        )
+    return get_memory_summary()
+
+@router.delete("/memory/tracing", response_model=MemorySummary)
+async def stop_memory_tracing(
+    current_user: User = Depends(has_permission("system:diagnostics")),
+) -> Any:
+    """
+    Stop tracing allocations in this worker.
+    """
+    stop_allocation_tracing()
+    return get_memory_summary()
+
+@router.get("/memory/allocations", response_model=AllocationReport)
+async def get_memory_allocations(
+    limit: int = Query(20, ge=1, le=200),
+    group_by: str = Query("lineno", pattern="^(lineno|filename|traceback)$"),
+    diff: bool = Query(False, description="Compare against the baseline snapshot"),
+    reset_baseline: bool = Query(False, description="Make the current allocations the new baseline"),
+    current_user: User = Depends(has_permission("system:diagnostics")),
+) -> Any:
+    """
+    Get the allocation sites holding the most memory in this worker.
+    
+    Requires allocation tracing to be running (POST /diagnostics/memory/tracing).
+    """
+    report = get_top_allocations(limit=limit, group_by=group_by, diff=diff)
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Allocation tracing isn't running in this worker",
+            headers={"X-Worker-PID": str(os.getpid())},
+        )
+    if reset_baseline:
+        reset_allocation_baseline()
+    return report
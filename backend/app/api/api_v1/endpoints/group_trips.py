@@ -3,6 +3,8 @@ from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
+from app.api.api_v1.endpoints.batch import parse_batch_keys
+from app.core.serialization import parse_fields, render_orm
 from app.db.database import get_db
 from app.models.user import User
 from app.schemas.group_trip import (
@@ -12,6 +14,7 @@ from app.schemas.group_trip import (
 )
 from app.schemas.media import MediaAssetResponse
 from pydantic import BaseModel
+from app.services.batch import batch_service
 from app.services.group_trip import group_trip_service
 from app.auth.dependencies import get_current_user, has_permission
 
@@ -24,20 +27,29 @@ def get_group_trips(
     limit: int = 100,
     country_id: int = Query(None, description="Filter group trips by country ID"),
     featured: bool = Query(None, description="Filter group trips by featured status"),
+    fields: str = Query(None, description="Comma-separated fields to return, e.g. id,name,slug,price,duration_days,image_id"),
+    ids: str = Query(None, description="Comma-separated IDs to fetch, formatted as by /{id}, e.g. 1,2,3"),
+    slugs: str = Query(None, description="Comma-separated slugs to fetch, formatted as by /slug/{slug}"),
 ) -> Any:
     """
-    Retrieve all group trips.
+    Retrieve all group trips, or the group trips with the given IDs and slugs.
     """
+    if ids or slugs:
+        trip_ids, trip_slugs = parse_batch_keys(ids, slugs)
+        group_trips = batch_service.get_many(db, "group_trips", ids=trip_ids, slugs=trip_slugs)
+        selected = parse_fields(fields, GroupTripWithCountryResponse.model_fields)
+        return render_orm(group_trips, GroupTripWithCountryResponse, selected)
+    selected = parse_fields(fields, GroupTripResponse.model_fields)
     if country_id:
-        group_trips = group_trip_service.get_group_trips_by_country(db, country_id=country_id, skip=skip, limit=limit)
+        group_trips = group_trip_service.get_group_trips_by_country(db, country_id=country_id, skip=skip, limit=limit, fields=selected)
     elif featured is not None:
         if featured:
-            group_trips = group_trip_service.get_featured_group_trips(db, skip=skip, limit=limit)
+            group_trips = group_trip_service.get_featured_group_trips(db, skip=skip, limit=limit, fields=selected)
         else:
-            group_trips = group_trip_service.get_group_trips(db, skip=skip, limit=limit)
+            group_trips = group_trip_service.get_group_trips(db, skip=skip, limit=limit, fields=selected)
     else:
-        group_trips = group_trip_service.get_group_trips(db, skip=skip, limit=limit)
-    return group_trips
+        group_trips = group_trip_service.get_group_trips(db, skip=skip, limit=limit, fields=selected)
+    return render_orm(group_trips, GroupTripResponse, selected)
 
 @router.get("/{group_trip_id}", response_model=GroupTripWithCountryResponse)
 def get_group_trip(
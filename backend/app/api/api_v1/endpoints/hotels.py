@@ -3,10 +3,13 @@ from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
+from app.api.api_v1.endpoints.batch import parse_batch_keys
+from app.core.serialization import PrerenderedJSONResponse, parse_fields, render_orm
 from app.db.database import get_db
 from app.models.user import User
 from app.schemas.hotel import HotelResponse, HotelCreate, HotelUpdate, HotelWithCountryResponse, HotelWithRelationshipsResponse
-from app.services.hotel import hotel_service
+from app.services.batch import batch_service
+from app.services.hotel import HOTEL_LIST_FIELDS, hotel_service
 from app.auth.dependencies import get_current_user, has_permission
 
 router = APIRouter()
@@ -19,12 +22,20 @@ def get_hotels(
     limit: int = 100,
     recommended: bool = Query(None, description="Filter for recommended hotels"),
     country: str = Query(None, description="Filter by country name"),
+    fields: str = Query(None, description="Comma-separated fields to return, e.g. id,name,slug,city,stars,image_url,country"),
+    ids: str = Query(None, description="Comma-separated IDs to fetch, formatted as by /{id}, e.g. 1,2,3"),
+    slugs: str = Query(None, description="Comma-separated slugs to fetch, formatted as by /slug/{slug}"),
 ) -> Any:
     """
-    Retrieve all hotels with optional filtering.
+    Retrieve all hotels with optional filtering, or the hotels with the given IDs and slugs.
     """
-    hotels = hotel_service.get_hotels(db, skip=skip, limit=limit, recommended=recommended, country=country)
-    return hotels
+    if ids or slugs:
+        hotel_ids, hotel_slugs = parse_batch_keys(ids, slugs)
+        hotels = batch_service.get_many(db, "hotels", ids=hotel_ids, slugs=hotel_slugs)
+        return render_orm(hotels, HotelWithCountryResponse, parse_fields(fields, HotelWithCountryResponse.model_fields))
+    selected = parse_fields(fields, HOTEL_LIST_FIELDS)
+    hotels = hotel_service.get_hotels(db, skip=skip, limit=limit, recommended=recommended, country=country, fields=selected)
+    return PrerenderedJSONResponse(hotels)
 
 @router.get("/country/{country_id}")
 def get_hotels_by_country(
@@ -37,7 +48,7 @@ def get_hotels_by_country(
     Retrieve hotels by country ID with cover images.
     """
     hotels = hotel_service.get_hotels_by_country(db, country_id=country_id, skip=skip, limit=limit)
-    return hotels
+    return PrerenderedJSONResponse(hotels)
 
 @router.get("/{hotel_id}", response_model=HotelWithCountryResponse)
 def get_hotel(
@@ -76,7 +87,7 @@ def get_hotel_details_by_slug(
     hotel_details = hotel_service.get_hotel_details_by_slug(db, slug=slug)
     if hotel_details is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Hotel not found")
-    return hotel_details
+    return PrerenderedJSONResponse(hotel_details)
 
 @router.post("/", response_model=HotelResponse)
 def create_hotel(
@@ -1,14 +1,19 @@
 from typing import Any, List, Dict
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File, Form, Query
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
 from app.models.user import User
-from app.schemas.media import MediaAssetResponse, MediaAssetUpdate, MediaAssetConfirm, PresignedUploadResponse
+from app.core.config import settings
+from app.schemas.media import (
+    MediaAssetResponse, MediaAssetUpdate, MediaAssetConfirm, PresignedUploadResponse,
+    MediaDirectUploadRequest, MediaDirectUploadResponse, MediaDirectUploadConfirm
+)
 from app.services.media import media_service
 from app.auth.dependencies import get_current_user, has_permission
 from app.api.api_v1.endpoints.media_response import MediaAssetResponseWrapper
+from app.tasks.media_tasks import process_media_image
 
 router = APIRouter()
 
@@ -28,11 +33,14 @@ def get_media_assets(
         db, entity_type=entity_type, entity_id=entity_id, skip=skip, limit=limit
     )
     
+    # Generate all image URLs in one batch
+    image_urls = media_service.get_media_urls(media_assets)
+    
     # Convert media assets to response format for gallery
     result = []
     for asset in media_assets:
         # Generate proper image URL
-        image_url = media_service.get_presigned_url(db, asset.id)
+        image_url = image_urls.get(asset.id)
         if not image_url and asset.file_path.startswith("cloudflare://"):
             # Fallback to direct Cloudflare URL construction
             from app.core.cloudflare_config import cloudflare_settings
@@ -49,6 +57,7 @@ def get_media_assets(
             "caption": asset.caption,
             "width": asset.width,
             "height": asset.height,
+            "srcset": media_service.get_srcset(asset),
         })
     
     return result
@@ -73,6 +82,7 @@ def get_media_asset(
 
 @router.post("/upload", response_model=Dict[str, Any])
 def upload_media_asset(
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     file: UploadFile = File(...),
     entity_type: str = Form(...),
@@ -84,6 +94,9 @@ def upload_media_asset(
 ) -> Any:
     """
     Upload a new media asset for gallery.
+    
+    Image processing (dimensions and resized variants) runs in the background after
+    the response is sent.
     """
     media_asset = media_service.create_media_asset(
         db, file, entity_type, entity_id, alt_text, title, caption, current_user.id
@@ -99,6 +112,9 @@ def upload_media_asset(
     if entity_type and entity_id:
         media_service.associate_media_with_entity(db, media_asset.id, entity_type, entity_id)
     
+    if media_asset.width is None:
+        background_tasks.add_task(process_media_image, media_asset.id)
+    
     # Generate proper image URL for response
     image_url = media_service.get_presigned_url(db, media_asset.id)
     if not image_url and media_asset.file_path.startswith("cloudflare://"):
@@ -118,6 +134,7 @@ def upload_media_asset(
         "caption": media_asset.caption,
         "width": media_asset.width,
         "height": media_asset.height,
+        "srcset": media_service.get_srcset(media_asset),
     }
 
 @router.post("/presigned-url", response_model=PresignedUploadResponse)
@@ -173,6 +190,94 @@ def confirm_upload(
     
     return MediaAssetResponseWrapper.convert(media_asset, url)
 
+@router.post("/direct-upload", response_model=MediaDirectUploadResponse)
+async def create_direct_upload(
+    *,
+    upload_in: MediaDirectUploadRequest,
+    current_user: User = Depends(has_permission("media:create")),
+) -> Any:
+    """
+    Get an upload ticket so the browser can upload a file directly to storage.
+    
+    The browser uploads the file to `upload_url` (a multipart form with a `file` field
+    for Cloudflare Images, a PUT of the raw bytes for R2) and then calls
+    `/direct-upload/confirm` with the ticket.
+    """
+    upload = await media_service.create_direct_upload(
+        current_user.id,
+        upload_in.filename,
+        upload_in.content_type,
+        upload_in.provider,
+        upload_in.entity_type,
+        upload_in.entity_id,
+        upload_in.alt_text,
+        upload_in.title,
+        upload_in.caption
+    )
+    
+    if upload is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create direct upload URL"
+        )
+    
+    return upload
+
+@router.post("/direct-upload/confirm", response_model=Dict[str, Any])
+def confirm_direct_upload(
+    *,
+    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    confirm_in: MediaDirectUploadConfirm,
+    current_user: User = Depends(has_permission("media:create")),
+) -> Any:
+    """
+    Confirm a direct upload and create its media asset.
+    
+    Only the user the ticket was issued to can confirm it. MEDIA_UPLOAD_MAX_BYTES is
+    only checked for R2 uploads: Cloudflare Images doesn't report image sizes, and
+    rejects uploads over its own 10 MB limit instead.
+    
+    Image processing (dimensions and resized variants) runs in the background after
+    the response is sent.
+    """
+    ticket_data = media_service.decode_upload_ticket(confirm_in.ticket)
+    if ticket_data is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid or expired upload ticket"
+        )
+    
+    if ticket_data.get("sub") != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Upload ticket was issued to another user"
+        )
+    
+    file_size = media_service.get_direct_upload_size(
+        ticket_data["provider"], ticket_data["storage_key"]
+    )
+    if file_size is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload has not been completed"
+        )
+    
+    if file_size > settings.MEDIA_UPLOAD_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Uploaded file is too large"
+        )
+    
+    media_asset = media_service.record_direct_upload(db, ticket_data, current_user.id, file_size)
+    
+    if media_asset.width is None:
+        background_tasks.add_task(process_media_image, media_asset.id)
+    
+    url = media_service.get_presigned_url(db, media_asset.id)
+    
+    return MediaAssetResponseWrapper.convert(media_asset, url)
+
 @router.put("/{media_id}", response_model=Dict[str, Any])
 def update_media_asset(
     *,
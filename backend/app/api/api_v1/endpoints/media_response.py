@@ -2,6 +2,8 @@ from typing import Dict, Any, Optional
 from fastapi import Response
 from pydantic import BaseModel
 
+from app.core.config import settings
+from app.media.variants import build_srcset
 from app.models.media import MediaAsset
 
 class MediaAssetResponseWrapper:
@@ -26,6 +28,9 @@ class MediaAssetResponseWrapper:
             "entity_id": media_asset.entity_id,
             "alt_text": media_asset.alt_text,
             "title": media_asset.title,
+            "width": media_asset.width,
+            "height": media_asset.height,
+            "srcset": build_srcset(media_asset.variant_manifest, settings.R2_PUBLIC_URL),
             "is_active": media_asset.is_active,
             "created_by_id": media_asset.created_by_id,
             "created_at": media_asset.created_at,
@@ -1,12 +1,16 @@
 from typing import Any, List
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
+from app.api.api_v1.endpoints.batch import parse_batch_keys
+from app.core.response_cache import response_cache
+from app.core.serialization import parse_fields, render_orm
 from app.db.database import get_db
 from app.models.user import User
 from app.schemas.package import PackageResponse, PackageCreate, PackageUpdate, PackageWithCountryResponse, PackageHolidayTypeCreate
+from app.services.batch import batch_service
 from app.services.package import package_service
 from app.auth.dependencies import get_current_user, has_permission
 
@@ -15,6 +19,12 @@ class SetCoverImageRequest(BaseModel):
 
 router = APIRouter()
 
+# Tables package details are read from, for invalidating cached responses
+PACKAGE_DETAILS_TABLES = frozenset({
+    "packages", "package_holiday_types", "media_assets", "countries",
+    "holiday_types", "inclusions", "exclusions",
+})
+
 @router.get("/", response_model=List[PackageWithCountryResponse])
 def get_packages(
     db: Session = Depends(get_db),
@@ -24,25 +34,33 @@ def get_packages(
     order: str = "desc",
     popular: bool = Query(False, description="Get popular (featured) packages"),
     country: str = Query(None, description="Filter by country name"),
+    fields: str = Query(None, description="Comma-separated fields to return, e.g. id,name,slug,price,duration_days,image_id,country"),
+    ids: str = Query(None, description="Comma-separated IDs to fetch, formatted as by /{id}, e.g. 1,2,3"),
+    slugs: str = Query(None, description="Comma-separated slugs to fetch, formatted as by /slug/{slug}"),
 ) -> Any:
     """
-    Retrieve all packages with optional ordering and filtering.
+    Retrieve all packages with optional ordering and filtering, or the packages
+    with the given IDs and slugs.
     order_by options: created_at, name, price
     order options: asc, desc
     """
-    if country:
+    selected = parse_fields(fields, PackageWithCountryResponse.model_fields)
+    if ids or slugs:
+        package_ids, package_slugs = parse_batch_keys(ids, slugs)
+        packages = batch_service.get_many(db, "packages", ids=package_ids, slugs=package_slugs)
+    elif country:
         # Find country by name and get packages for that country
         from app.models.country import Country
         country_obj = db.query(Country).filter(Country.name == country, Country.is_active == True).first()
         if country_obj:
-            packages = package_service.get_packages_by_country(db, country_id=country_obj.id, skip=skip, limit=limit)
+            packages = package_service.get_packages_by_country(db, country_id=country_obj.id, skip=skip, limit=limit, fields=selected)
         else:
             packages = []
     elif popular:
-        packages = package_service.get_featured_packages(db, skip=skip, limit=limit)
+        packages = package_service.get_featured_packages(db, skip=skip, limit=limit, fields=selected)
     else:
-        packages = package_service.get_packages(db, skip=skip, limit=limit, order_by=order_by, order=order)
-    return packages
+        packages = package_service.get_packages(db, skip=skip, limit=limit, order_by=order_by, order=order, fields=selected)
+    return render_orm(packages, PackageWithCountryResponse, selected)
 
 @router.get("/country/{country_id}", response_model=List[PackageWithCountryResponse])
 def get_packages_by_country(
@@ -50,24 +68,28 @@ def get_packages_by_country(
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
+    fields: str = Query(None, description="Comma-separated fields to return, e.g. id,name,slug,price,duration_days,image_id,country"),
 ) -> Any:
     """
     Retrieve packages by country ID.
     """
-    packages = package_service.get_packages_by_country(db, country_id=country_id, skip=skip, limit=limit)
-    return packages
+    selected = parse_fields(fields, PackageWithCountryResponse.model_fields)
+    packages = package_service.get_packages_by_country(db, country_id=country_id, skip=skip, limit=limit, fields=selected)
+    return render_orm(packages, PackageWithCountryResponse, selected)
 
 @router.get("/featured", response_model=List[PackageWithCountryResponse])
 def get_featured_packages(
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
+    fields: str = Query(None, description="Comma-separated fields to return, e.g. id,name,slug,price,duration_days,image_id,country"),
 ) -> Any:
     """
     Retrieve featured packages.
     """
-    packages = package_service.get_featured_packages(db, skip=skip, limit=limit)
-    return packages
+    selected = parse_fields(fields, PackageWithCountryResponse.model_fields)
+    packages = package_service.get_featured_packages(db, skip=skip, limit=limit, fields=selected)
+    return render_orm(packages, PackageWithCountryResponse, selected)
 
 @router.get("/{package_id}", response_model=PackageWithCountryResponse)
 def get_package(
@@ -98,15 +120,20 @@ def get_package_by_slug(
 @router.get("/details/{slug}")
 def get_package_details_by_slug(
     slug: str,
+    request: Request,
     db: Session = Depends(get_db),
 ) -> Any:
     """
     Retrieve package details with gallery images by slug.
     """
-    package_details = package_service.get_package_details_by_slug(db, slug=slug)
-    if package_details is None:
+    cached = response_cache.get_or_build(
+        f"package-details:{slug}",
+        lambda: package_service.get_package_details_by_slug(db, slug=slug),
+        PACKAGE_DETAILS_TABLES,
+    )
+    if cached is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Package not found")
-    return package_details
+    return cached.to_response(request)
 
 @router.post("/", response_model=PackageResponse)
 def create_package(
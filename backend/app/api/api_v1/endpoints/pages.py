@@ -0,0 +1,35 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.response_cache import response_cache
+from app.db.database import get_db
+from app.services.pages import HOME_SECTIONS, HOME_TABLES, page_service
+
+router = APIRouter()
+
+@router.get("/home")
+async def get_home_page(
+    request: Request,
+    limit: int = Query(8, ge=1, le=50, description="Number of items per list section"),
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    Retrieve all homepage sections in one request.
+
+    Returns featured packages and group trips, trending destinations, stats,
+    recommended hotels and blog posts, formatted as by their own endpoints.
+    Sections that time out or fail are returned with an empty value and listed
+    under `degraded`; pages with degraded sections aren't cached.
+    """
+    cached = await response_cache.get_or_build_async(
+        f"page:home:{limit}",
+        lambda: page_service.assemble(db, "home", HOME_SECTIONS, limit),
+        HOME_TABLES,
+        cacheable=lambda page: not page["degraded"],
+    )
+    # The first request for an encoding compresses the page at a high level,
+    # which mustn't block the event loop
+    return await run_in_threadpool(cached.to_response, request)
@@ -1,35 +1,43 @@
-from fastapi import APIRouter, Depends
+from typing import Dict, Optional
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 
 from app.db.database import get_db
-from app.models.group_trip import GroupTrip
-from app.models.activity import Activity
-from app.models.hotel import Hotel
-from app.models.attraction import Attraction
+from app.services.stats import stats_service
 from pydantic import BaseModel
 
 router = APIRouter()
 
+class CountryStatsResponse(BaseModel):
+    packages: int
+    group_trips: int
+    hotels: int
+    attractions: int
+    accommodations: int
+
 class StatsResponse(BaseModel):
     group_trips: int
     activities: int
     hotels: int
     attractions: int
+    packages: int
+    accommodations: int
+    countries: int
+    by_country: Optional[Dict[int, CountryStatsResponse]] = None
 
-@router.get("/", response_model=StatsResponse)
-def get_stats(db: Session = Depends(get_db)):
-    """
-    Get basic statistics for the platform.
+@router.get("/", response_model=StatsResponse, response_model_exclude_none=True)
+def get_stats(
+    db: Session = Depends(get_db),
+    by_country: bool = Query(False, description="Include active counts per country ID"),
+):
     """
-    group_trips_count = db.query(func.count(GroupTrip.id)).scalar()
-    activities_count = db.query(func.count(Activity.id)).scalar()
-    hotels_count = db.query(func.count(Hotel.id)).scalar()
-    attractions_count = db.query(func.count(Attraction.id)).scalar()
+    Get the number of active entities on the platform.
 
-    return StatsResponse(
-        group_trips=group_trips_count,
-        activities=activities_count,
-        hotels=hotels_count,
-        attractions=attractions_count
-    )
\ No newline at end of file
+    Counts are kept in memory and reloaded periodically, so they don't scan the
+    tables on every call.
+    """
+    stats = stats_service.get_stats(db)
+    if by_country:
+        stats["by_country"] = stats_service.get_country_stats(db)
+    return StatsResponse(**stats)
@@ -8,7 +8,10 @@ from app.models.user import User
 from app.schemas.task import TaskInfo, TaskList, TaskCreationResponse, TaskStatusResponse
 from app.tasks.task_manager import task_manager
 from app.tasks.search_tasks import index_all_entities, index_entity
-from app.tasks.media_tasks import process_uploaded_media, download_and_upload_external_media
+from app.tasks.media_tasks import (
+    process_uploaded_media, download_and_upload_external_media,
+    process_media_image, process_unprocessed_media
+)
 from app.auth.dependencies import get_current_user, has_permission
 
 router = APIRouter()
@@ -117,6 +120,34 @@ async def start_download_media_task(
         "status": "pending"
     }
 
+@router.post("/process-media-image/{media_id}", response_model=TaskCreationResponse)
+async def start_process_media_image_task(
+    media_id: int,
+    current_user: User = Depends(has_permission("media:manage")),
+) -> Any:
+    """
+    Start a task to read image dimensions and generate resized variants for a media asset.
+    """
+    task_id = await task_manager.add_task(process_media_image, media_id)
+    return {
+        "task_id": task_id,
+        "status": "pending"
+    }
+
+@router.post("/process-media-images", response_model=TaskCreationResponse)
+async def start_process_media_images_task(
+    limit: int = 500,
+    current_user: User = Depends(has_permission("media:manage")),
+) -> Any:
+    """
+    Start a task to process all media assets that have no dimensions yet.
+    """
+    task_id = await task_manager.add_task(process_unprocessed_media, limit)
+    return {
+        "task_id": task_id,
+        "status": "pending"
+    }
+
 @router.delete("/clear-completed", response_model=dict)
 async def clear_completed_tasks(
     current_user: User = Depends(has_permission("tasks:admin")),
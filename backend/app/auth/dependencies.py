@@ -1,10 +1,11 @@
-from typing import Optional, List
+from typing import Callable, Optional, List, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session
 
+from app.auth.principal_cache import Principal, principal_cache
 from app.core.config import settings
 from app.db.database import get_db
 from app.models.user import User, Role, Permission
@@ -12,28 +13,32 @@ from app.schemas.token import TokenPayload
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
-async def get_current_user(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+async def get_current_principal(
     db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
+) -> Principal:
     """
-    Get the current user from the JWT token.
+    Get the authorization data of the current user from the JWT token.
+    
+    The principal is cached (see app.auth.principal_cache), so this usually
+    doesn't query the database.
     
     Args:
         db: Database session
         token: JWT token
         
     Returns:
-        The current user
+        The current user's principal
         
     Raises:
-        HTTPException: If the token is invalid or the user doesn't exist
+        HTTPException: If the token is invalid, the user doesn't exist or is inactive
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
     try:
         payload = jwt.decode(
             token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
@@ -41,30 +46,88 @@ async def get_current_user(
         token_data = TokenPayload(**payload)
         
         if token_data.type != "access":
-            raise credentials_exception
+            raise _credentials_exception()
             
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+    
+    principal = principal_cache.get(db, int(token_data.sub))
+    if principal is None:
+        raise _credentials_exception()
+    
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user"
+        )
+    
+    return principal
+
+def _load_user(db: Session, principal: Principal) -> Tuple[User, Principal]:
+    """
+    Load the user of an authenticated principal.
     
-    user = db.query(User).filter(User.id == int(token_data.sub)).first()
-    if not user:
-        raise credentials_exception
+    The row is authoritative: if its flags differ from the cached principal (e.g.
+    they were changed by another worker), the principal is reloaded.
+    
+    Returns:
+        Tuple of the user and the up-to-date principal
+    """
+    user = db.get(User, principal.user_id)
+    if user is None:
+        principal_cache.invalidate_user(principal.user_id)
+        raise _credentials_exception()
+    
+    if user.is_active != principal.is_active or user.is_superuser != principal.is_superuser:
+        principal_cache.invalidate_user(principal.user_id)
+        principal = principal_cache.get(db, principal.user_id) or principal
     
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user"
         )
+    return user, principal
+
+async def get_current_user(
+    db: Session = Depends(get_db), principal: Principal = Depends(get_current_principal)
+) -> User:
+    """
+    Get the current user from the JWT token.
     
+    Args:
+        db: Database session
+        principal: The current user's principal
+        
+    Returns:
+        The current user
+        
+    Raises:
+        HTTPException: If the token is invalid or the user doesn't exist
+    """
+    user, _ = _load_user(db, principal)
     return user
 
+def _authorize(db: Session, principal: Principal, is_allowed: Callable[[Principal], bool],
+               detail: str) -> User:
+    """
+    Check a principal before and after loading its user.
+    
+    Denied requests are rejected from the cached principal without any query.
+    """
+    if is_allowed(principal):
+        user, principal = _load_user(db, principal)
+        if is_allowed(principal):
+            return user
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
 async def get_current_active_superuser(
-    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db), principal: Principal = Depends(get_current_principal)
 ) -> User:
     """
     Get the current user and verify that they are a superuser.
     
     Args:
-        current_user: The current user
+        db: Database session
+        principal: The current user's principal
         
     Returns:
         The current superuser
@@ -72,12 +135,9 @@ async def get_current_active_superuser(
     Raises:
         HTTPException: If the user is not a superuser
     """
-    if not current_user.is_superuser:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="The user doesn't have enough privileges",
-        )
-    return current_user
+    return _authorize(
+        db, principal, lambda p: p.is_superuser, "The user doesn't have enough privileges"
+    )
 
 def has_permission(required_permission: str):
     """
@@ -90,25 +150,13 @@ def has_permission(required_permission: str):
         A dependency function that checks for the permission
     """
     async def check_permission(
-        db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+        db: Session = Depends(get_db), principal: Principal = Depends(get_current_principal)
     ) -> User:
-        # Superusers have all permissions
-        if current_user.is_superuser:
-            return current_user
-        
-        # Check if the user has the required permission through their roles
-        user_permissions = set()
-        for role in current_user.roles:
-            for permission in role.permissions:
-                user_permissions.add(permission.name)
-        
-        if required_permission not in user_permissions:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Permission denied: {required_permission} is required",
-            )
-        
-        return current_user
+        # Superusers have all permissions; roles' permissions are flattened in the principal
+        return _authorize(
+            db, principal, lambda p: p.has_permission(required_permission),
+            f"Permission denied: {required_permission} is required",
+        )
     
     return check_permission
 
@@ -123,21 +171,12 @@ def has_role(required_role: str):
         A dependency function that checks for the role
     """
     async def check_role(
-        db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+        db: Session = Depends(get_db), principal: Principal = Depends(get_current_principal)
     ) -> User:
         # Superusers have all roles
-        if current_user.is_superuser:
-            return current_user
-        
-        # Check if the user has the required role
-        user_roles = {role.name for role in current_user.roles}
-        
-        if required_role not in user_roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Role denied: {required_role} is required",
-            )
-        
-        return current_user
+        return _authorize(
+            db, principal, lambda p: p.has_role(required_role),
+            f"Role denied: {required_role} is required",
+        )
     
     return check_role
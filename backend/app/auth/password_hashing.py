@@ -0,0 +1,125 @@
+"""
+Bounded pool for password hashing.
+
+bcrypt is deliberately slow, so hashing and verifying passwords on the shared
+request threadpool lets a burst of logins (or a credential stuffing attempt) take
+the threads that serve everything else. Password operations run on a small
+dedicated pool instead, and once PASSWORD_HASH_MAX_PENDING operations are queued
+or running new ones are rejected right away rather than queued.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+from app.auth.security import pwd_context
+from app.core.config import settings
+from app.core.metrics import (
+    PASSWORD_HASH_DURATION, PASSWORD_HASH_PENDING, PASSWORD_HASH_QUEUE_WAIT, PASSWORD_HASH_REJECTED,
+)
+
+class PasswordHashPoolFull(Exception):
+    """
+    Raised when too many password hashing operations are pending.
+    """
+
+class PasswordHashPool:
+    """
+    Dedicated thread pool for password hashing with a limit on pending operations.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        """
+        Initialize the pool.
+
+        Args:
+            workers: Number of hashing threads
+            max_pending: Maximum number of operations queued or running
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="password-hash"
+                    )
+        return self._executor
+
+    async def _run(self, operation: str, func: Callable, *args: Any) -> Any:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                PASSWORD_HASH_REJECTED.labels(operation=operation).inc()
+                raise PasswordHashPoolFull(f"{self.pending} password hashing operations pending")
+            self.pending += 1
+
+        queued_at = time.perf_counter()
+
+        def timed() -> Any:
+            started_at = time.perf_counter()
+            PASSWORD_HASH_QUEUE_WAIT.labels(operation=operation).observe(started_at - queued_at)
+            try:
+                return func(*args)
+            finally:
+                PASSWORD_HASH_DURATION.labels(operation=operation).observe(time.perf_counter() - started_at)
+
+        def release(_: Future) -> None:
+            with self._lock:
+                self.pending -= 1
+
+        # Released when the operation finishes, even if the caller stopped waiting
+        future = self._get_executor().submit(timed)
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password against a hash.
+
+        Args:
+            plain_password: The plain text password
+            hashed_password: The hashed password
+
+        Returns:
+            Tuple of whether the password matches and, if it does and the hash uses
+            outdated settings (e.g. a different BCRYPT_ROUNDS), a new hash to store
+
+        Raises:
+            PasswordHashPoolFull: If too many operations are pending
+        """
+        return await self._run("verify", pwd_context.verify_and_update, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password.
+
+        Args:
+            password: The plain text password
+
+        Returns:
+            The hashed password
+
+        Raises:
+            PasswordHashPoolFull: If too many operations are pending
+        """
+        return await self._run("hash", pwd_context.hash, password)
+
+    def shutdown(self) -> None:
+        """
+        Wait for running operations and stop the hashing threads.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+password_hash_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+PASSWORD_HASH_PENDING.set_function(lambda: password_hash_pool.pending)
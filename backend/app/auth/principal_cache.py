@@ -0,0 +1,154 @@
+"""
+Cache of authenticated principals.
+
+A principal is the part of a user that authorization needs: the active and
+superuser flags and the flattened role and permission names. Loading it takes a
+single query; it is then cached per worker for PRINCIPAL_CACHE_TTL_SECONDS, so
+permission checks don't lazy-load the user's roles and each role's permissions
+on every request.
+
+Entries are stamped with a permissions version. Changes to a single user's
+roles or flags invalidate that user's entry; changes to roles or permissions
+bump the version, which invalidates every entry. Other workers pick up changes
+when their entries expire.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import FrozenSet, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import track_cache_hit, track_cache_miss
+from app.models.user import Permission, Role, User
+
+class Principal:
+    """
+    Authorization data of a user.
+    """
+    __slots__ = ("user_id", "is_active", "is_superuser", "roles", "permissions")
+
+    def __init__(self, user_id: int, is_active: bool, is_superuser: bool,
+                 roles: FrozenSet[str], permissions: FrozenSet[str]):
+        self.user_id = user_id
+        self.is_active = is_active
+        self.is_superuser = is_superuser
+        self.roles = roles
+        self.permissions = permissions
+
+    def has_permission(self, permission: str) -> bool:
+        """
+        Check if the user has a permission; superusers have all permissions.
+        """
+        return self.is_superuser or permission in self.permissions
+
+    def has_role(self, role: str) -> bool:
+        """
+        Check if the user has a role; superusers have all roles.
+        """
+        return self.is_superuser or role in self.roles
+
+def load_principal(db: Session, user_id: int) -> Optional[Principal]:
+    """
+    Load a user's principal from the database in a single query.
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        The principal, or None if the user doesn't exist
+    """
+    rows = (
+        db.query(User.is_active, User.is_superuser, Role.name, Permission.name)
+        .outerjoin(User.roles)
+        .outerjoin(Role.permissions)
+        .filter(User.id == user_id)
+        .all()
+    )
+    if not rows:
+        return None
+    is_active, is_superuser = rows[0][0], rows[0][1]
+    roles = frozenset(row[2] for row in rows if row[2] is not None)
+    permissions = frozenset(row[3] for row in rows if row[3] is not None)
+    return Principal(user_id, bool(is_active), bool(is_superuser), roles, permissions)
+
+class PrincipalCache:
+    """
+    Bounded TTL cache of principals by user ID.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a principal is cached
+            max_size: Maximum number of cached principals; the least recently
+                used are evicted first
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.version = 0
+        # Incremented on every invalidation
+        self._generation = 0
+        self._entries: "OrderedDict[int, Tuple[Principal, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, user_id: int) -> Optional[Principal]:
+        """
+        Get a user's principal, loading it on a miss.
+
+        Args:
+            db: Database session used on a miss
+            user_id: User ID
+
+        Returns:
+            The principal, or None if the user doesn't exist
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[1] > now and entry[2] == self.version:
+                self._entries.move_to_end(user_id)
+                track_cache_hit("principal")
+                return entry[0]
+            version = self.version
+            generation = self._generation
+
+        track_cache_miss("principal")
+        principal = load_principal(db, user_id)
+        if principal is None:
+            return None
+
+        with self._lock:
+            # Don't cache a principal that may have been loaded before an invalidation
+            if generation == self._generation:
+                self._entries[user_id] = (principal, now + self.ttl, version)
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return principal
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Drop a user's cached principal, e.g. after their roles or flags changed.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(user_id, None)
+
+    def invalidate_all(self) -> None:
+        """
+        Bump the permissions version, e.g. after a role's permissions changed.
+        """
+        with self._lock:
+            self.version += 1
+            self._generation += 1
+            self._entries.clear()
+
+principal_cache = PrincipalCache(
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+)
@@ -28,7 +28,28 @@ class CloudflareSettings(BaseSettings):
     
     # Signing key for private images (if using signed URLs)
     signing_key: str = ""
-    
+
+    # Signed URL expiries are rounded up to this window so URLs can be shared and cached
+    signed_url_window_seconds: int = 300
+    signed_url_cache_size: int = 4096
+
+    # HTTP client timeouts in seconds
+    connect_timeout: float = 5.0
+    request_timeout: float = 30.0
+
+    # HTTP connection pool sizing
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+
+    # Client-side rate limit (Cloudflare allows 1200 requests per 5 minutes)
+    rate_limit_per_second: float = 4.0
+    rate_limit_burst: int = 10
+
+    # Retries for rate-limited (429), server errors and transport failures
+    max_retries: int = 3
+    retry_backoff: float = 0.5
+    max_retry_delay: float = 30.0
+
     # Model configuration
     model_config = SettingsConfigDict(
         env_file=".env",
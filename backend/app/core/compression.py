@@ -0,0 +1,195 @@
+"""
+Response compression.
+
+CompressionMiddleware compresses responses of compressible types once they are
+at least COMPRESSION_MIN_SIZE bytes, using the best encoding the client accepts
+out of COMPRESSION_ENCODINGS. gzip is always available; brotli ("br") and
+zstandard ("zstd") are used when the `brotli` and `zstandard` packages are
+installed.
+
+Responses that already carry a Content-Encoding are passed through untouched, so
+endpoints can send precompressed bodies (see app.core.response_cache), which are
+compressed once at a higher level instead of on every request.
+"""
+import gzip
+import zlib
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+# Levels for compressing on every request, and for bodies compressed once and cached
+STREAMING_LEVELS = {"gzip": 6, "br": 4, "zstd": 3}
+PRECOMPRESSED_LEVELS = {"gzip": 9, "br": 11, "zstd": 19}
+
+def available_encodings() -> List[str]:
+    """
+    Get the configured encodings that can be used, in order of preference.
+    """
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    return [
+        name for name in (encoding.strip() for encoding in settings.COMPRESSION_ENCODINGS.split(","))
+        if installed.get(name)
+    ]
+
+def negotiate_encoding(accept_encoding: str, encodings: Optional[List[str]] = None) -> Optional[str]:
+    """
+    Choose a content encoding for an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Accept-Encoding header value
+        encodings: Encodings to choose from in order of preference
+            (available_encodings() by default)
+
+    Returns:
+        The preferred encoding the client accepts, or None for identity
+    """
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in encodings if encodings is not None else available_encodings():
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    Compress a complete body.
+
+    Args:
+        body: Raw bytes
+        encoding: "gzip", "br" or "zstd"
+        level: Compression level (PRECOMPRESSED_LEVELS by default)
+
+    Returns:
+        Compressed bytes
+    """
+    level = PRECOMPRESSED_LEVELS[encoding] if level is None else level
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(body)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+class _StreamCompressor:
+    """
+    Incremental compressor for streamed response bodies.
+    """
+
+    def __init__(self, encoding: str):
+        level = STREAMING_LEVELS[encoding]
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=level)
+            self._compress, self._finish = self._compressor.process, self._compressor.finish
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+            self._compress, self._finish = self._compressor.compress, self._compressor.flush
+        else:
+            # wbits=31 writes a gzip header and trailer
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+            self._compress, self._finish = self._compressor.compress, self._compressor.flush
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compress(chunk)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware compressing responses the client accepts compressed.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        compressor: Optional[_StreamCompressor] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if ("content-encoding" in headers or message["status"] in (204, 304)
+                        or not content_type.startswith(COMPRESSIBLE_TYPES)):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # Held back until the first body chunk shows the response size
+                    start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                headers = MutableHeaders(scope=start_message)
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                headers["Content-Encoding"] = encoding
+                del headers["Content-Length"]
+                if not more_body:
+                    # Whole body in one message: compress it in one go
+                    compressed = compress(body, encoding, STREAMING_LEVELS[encoding])
+                    headers["Content-Length"] = str(len(compressed))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                compressor = _StreamCompressor(encoding)
+                await send(start_message)
+
+            chunk = compressor.compress(body)
+            if not more_body:
+                chunk += compressor.finish()
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
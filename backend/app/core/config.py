@@ -31,9 +31,38 @@ class Settings(BaseSettings):
     R2_ACCESS_KEY: Optional[str] = os.getenv("R2_ACCESS_KEY")
     R2_SECRET_KEY: Optional[str] = os.getenv("R2_SECRET_KEY")
     R2_BUCKET_NAME: str = os.getenv("R2_BUCKET_NAME", "allbounds")
+    R2_PUBLIC_URL: Optional[str] = os.getenv("R2_PUBLIC_URL")
+    R2_MAX_POOL_CONNECTIONS: int = int(os.getenv("R2_MAX_POOL_CONNECTIONS", "50"))
+    R2_CONNECT_TIMEOUT: float = float(os.getenv("R2_CONNECT_TIMEOUT", "5"))
+    R2_READ_TIMEOUT: float = float(os.getenv("R2_READ_TIMEOUT", "60"))
+    R2_MAX_ATTEMPTS: int = int(os.getenv("R2_MAX_ATTEMPTS", "5"))
+    R2_MULTIPART_THRESHOLD_MB: int = int(os.getenv("R2_MULTIPART_THRESHOLD_MB", "8"))
+    R2_MULTIPART_CHUNKSIZE_MB: int = int(os.getenv("R2_MULTIPART_CHUNKSIZE_MB", "8"))
+    R2_MAX_CONCURRENCY: int = int(os.getenv("R2_MAX_CONCURRENCY", "10"))
+    R2_EXECUTOR_WORKERS: int = int(os.getenv("R2_EXECUTOR_WORKERS", "16"))
+    
+    # Direct (browser-to-storage) media upload settings
+    MEDIA_UPLOAD_TICKET_EXPIRE_MINUTES: int = int(os.getenv("MEDIA_UPLOAD_TICKET_EXPIRE_MINUTES", "30"))
+    # Checked for R2 uploads only; Cloudflare Images enforces its own 10 MB limit
+    MEDIA_UPLOAD_MAX_BYTES: int = int(os.getenv("MEDIA_UPLOAD_MAX_BYTES", str(20 * 1024 * 1024)))
+    
+    # Local image variant pipeline (requires Pillow; variants are stored in R2)
+    MEDIA_VARIANTS_ENABLED: bool = os.getenv("MEDIA_VARIANTS_ENABLED", "false").lower() == "true"
+    MEDIA_VARIANT_WIDTHS: str = os.getenv("MEDIA_VARIANT_WIDTHS", "320,640,1024,1600")
+    MEDIA_VARIANT_FORMATS: str = os.getenv("MEDIA_VARIANT_FORMATS", "webp,avif")
+    MEDIA_VARIANT_QUALITY: int = int(os.getenv("MEDIA_VARIANT_QUALITY", "80"))
+    MEDIA_VARIANT_WORKERS: int = int(os.getenv("MEDIA_VARIANT_WORKERS", "2"))
+    # Batch processing gives up on images whose dimensions still can't be read
+    MEDIA_PROCESSING_MAX_ATTEMPTS: int = int(os.getenv("MEDIA_PROCESSING_MAX_ATTEMPTS", "3"))
     
     # Logging settings
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    # Per-logger sampling of records below WARNING, e.g. "api.request=0.1,app=0.5"
+    LOG_SAMPLE_RATES: str = os.getenv("LOG_SAMPLE_RATES", "")
+    # Records are dropped (and counted) rather than blocking when the queue is full
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    # Requests slower than this are logged as warnings, bypassing sampling
+    REQUEST_LOG_SLOW_SECONDS: float = float(os.getenv("REQUEST_LOG_SLOW_SECONDS", "1.0"))
     
     # Project settings
     PROJECT_NAME: str = "Allbounds API"
@@ -41,7 +70,76 @@ class Settings(BaseSettings):
     # Observability settings
     ENABLE_TRACING: bool = os.getenv("ENABLE_TRACING", "false").lower() == "true"
     OTLP_ENDPOINT: Optional[str] = os.getenv("OTLP_ENDPOINT")
+    # Tail sampling keeps slow and errored traces and this fraction of the rest
+    TRACE_SAMPLE_RATE: float = float(os.getenv("TRACE_SAMPLE_RATE", "0.1"))
+    TRACE_SLOW_THRESHOLD_MS: float = float(os.getenv("TRACE_SLOW_THRESHOLD_MS", "500"))
+    TRACE_TAIL_MAX_TRACES: int = int(os.getenv("TRACE_TAIL_MAX_TRACES", "5000"))
+    TRACE_MAX_SPANS_PER_TRACE: int = int(os.getenv("TRACE_MAX_SPANS_PER_TRACE", "1000"))
+    # Batched OTLP export from a background thread
+    OTLP_MAX_QUEUE_SIZE: int = int(os.getenv("OTLP_MAX_QUEUE_SIZE", "2048"))
+    OTLP_MAX_EXPORT_BATCH_SIZE: int = int(os.getenv("OTLP_MAX_EXPORT_BATCH_SIZE", "512"))
+    OTLP_SCHEDULE_DELAY_MS: int = int(os.getenv("OTLP_SCHEDULE_DELAY_MS", "5000"))
+    OTLP_EXPORT_TIMEOUT_SECONDS: int = int(os.getenv("OTLP_EXPORT_TIMEOUT_SECONDS", "10"))
     PROMETHEUS_ENABLED: bool = os.getenv("PROMETHEUS_ENABLED", "true").lower() == "true"
+    # Adds Server-Timing headers with per-request database stats
+    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+    # Requests running more queries than this are flagged as likely N+1s
+    DB_QUERY_COUNT_THRESHOLD: int = int(os.getenv("DB_QUERY_COUNT_THRESHOLD", "30"))
+    # Per-route latency budgets, e.g. "/api/v1/search/=300,/api/v1/packages/details/{slug}=500"
+    ROUTE_LATENCY_BUDGETS: str = os.getenv("ROUTE_LATENCY_BUDGETS", "")
+    LATENCY_BUDGET_DEFAULT_MS: float = float(os.getenv("LATENCY_BUDGET_DEFAULT_MS", "1000"))
+    # Capture of requests that exceed their budget
+    SLOW_REQUEST_CAPTURES_KEPT: int = int(os.getenv("SLOW_REQUEST_CAPTURES_KEPT", "100"))
+    SLOW_REQUEST_SAMPLE_INTERVAL_MS: float = float(os.getenv("SLOW_REQUEST_SAMPLE_INTERVAL_MS", "50"))
+    SLOW_REQUEST_MAX_SAMPLES: int = int(os.getenv("SLOW_REQUEST_MAX_SAMPLES", "100"))
+    # Dependency probes behind /health/ready
+    HEALTH_PROBE_INTERVAL_SECONDS: float = float(os.getenv("HEALTH_PROBE_INTERVAL_SECONDS", "5"))
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = float(os.getenv("HEALTH_PROBE_TIMEOUT_SECONDS", "2"))
+    # Comma-separated dependencies (database, search, storage) that must be healthy to be ready
+    HEALTH_READY_DEPENDENCIES: str = os.getenv("HEALTH_READY_DEPENDENCIES", "database")
+    # Seconds between SIGTERM and shutdown during which readiness reports draining
+    HEALTH_DRAIN_SECONDS: float = float(os.getenv("HEALTH_DRAIN_SECONDS", "5"))
+    # Cached authorization data (active flag, roles, permissions) per user
+    PRINCIPAL_CACHE_TTL_SECONDS: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+    PRINCIPAL_CACHE_MAX_SIZE: int = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", "10000"))
+    # Render hot read endpoints straight from ORM objects with orjson, skipping
+    # response model validation; false falls back to validating every response
+    FAST_SERIALIZATION: bool = os.getenv("FAST_SERIALIZATION", "true").lower() == "true"
+    # Response compression; encodings in order of preference (br and zstd need the
+    # brotli and zstandard packages)
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_ENCODINGS: str = os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip")
+    # Cache of rendered (and precompressed) responses of large detail endpoints
+    RESPONSE_CACHE_TTL_SECONDS: float = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "60"))
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "500"))
+    # Maximum IDs plus slugs per batch read (`?ids=` on list endpoints and /batch/get)
+    BATCH_MAX_KEYS: int = int(os.getenv("BATCH_MAX_KEYS", "100"))
+    # Default time a composite page section (/pages/home) may take before its fallback is used
+    PAGE_SECTION_TIMEOUT_SECONDS: float = float(os.getenv("PAGE_SECTION_TIMEOUT_SECONDS", "2"))
+    # Seconds between reloads of the in-memory active entity counts served by /stats
+    STATS_RECONCILE_SECONDS: float = float(os.getenv("STATS_RECONCILE_SECONDS", "300"))
+    # bcrypt cost factor; existing hashes are rehashed on login when it changes
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    # Dedicated threads for password hashing, and the number of hashing operations
+    # allowed to be queued or running before logins are rejected with 503
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))
+    # Worker recycling; 0 disables the limit
+    MAX_REQUESTS: int = int(os.getenv("MAX_REQUESTS", "0"))
+    MAX_REQUESTS_JITTER: int = int(os.getenv("MAX_REQUESTS_JITTER", "0"))
+    MAX_WORKER_RSS_MB: int = int(os.getenv("MAX_WORKER_RSS_MB", "0"))
+    # Finished background tasks kept for status queries
+    TASKS_MAX_KEPT: int = int(os.getenv("TASKS_MAX_KEPT", "1000"))
+    # Sampling profiler for diagnosing hot paths in running workers
+    PROFILER_INTERVAL_MS: float = float(os.getenv("PROFILER_INTERVAL_MS", "5"))
+    PROFILER_MAX_SECONDS: int = int(os.getenv("PROFILER_MAX_SECONDS", "60"))
+    PROFILER_REQUEST_PROFILES_KEPT: int = int(os.getenv("PROFILER_REQUEST_PROFILES_KEPT", "20"))
+    METRICS_LATENCY_BUCKETS: str = os.getenv(
+        "METRICS_LATENCY_BUCKETS", "0.005,0.01,0.025,0.05,0.075,0.1,0.25,0.5,0.75,1,2.5,5,7.5,10,30"
+    )
+    METRICS_SIZE_BUCKETS: str = os.getenv(
+        "METRICS_SIZE_BUCKETS", "100,1000,10000,100000,1000000,10000000"
+    )
     BACKEND_CORS_ORIGINS: List[str] = [
         origin.strip()
         for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8000").split(",")
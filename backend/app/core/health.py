@@ -0,0 +1,245 @@
+"""
+Liveness and readiness checks.
+
+Dependency checks (database, Meilisearch, R2) are run periodically by a background
+prober instead of on every probe request. The readiness response is rendered once
+per probe round, so `/health/ready` only returns pre-built bytes.
+
+On SIGTERM the worker starts draining: readiness turns 503 so load balancers stop
+sending new requests, and the server is only asked to shut down after
+HEALTH_DRAIN_SECONDS.
+"""
+import asyncio
+import json
+import logging
+import os
+import signal
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.metrics import DEPENDENCY_CHECK_LATENCY, DEPENDENCY_UP
+
+logger = logging.getLogger(__name__)
+
+# A check returns True if the dependency is healthy, False if it isn't and None if
+# the dependency isn't configured
+DependencyCheck = Callable[[], Optional[bool]]
+
+class HealthProber:
+    """
+    Background prober that caches the health of the service's dependencies.
+    """
+
+    def __init__(self, interval: float, timeout: float, required: Set[str]):
+        """
+        Initialize the prober.
+
+        Args:
+            interval: Seconds between probe rounds
+            timeout: Seconds after which a check is considered failed
+            required: Dependencies that must be healthy for the service to be ready
+        """
+        self.interval = interval
+        self.timeout = timeout
+        self.required = required
+        self.draining = False
+        self._checks: Dict[str, DependencyCheck] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._running_checks: Set[str] = set()
+        self._last_probe: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._ready_response: Tuple[int, bytes] = self._render()
+
+    def register(self, name: str, check: DependencyCheck) -> None:
+        """
+        Add a dependency check.
+
+        Args:
+            name: Dependency name
+            check: Blocking function checking the dependency
+        """
+        self._checks[name] = check
+
+    async def start(self) -> None:
+        """
+        Run a first probe round and keep probing in the background.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the background prober.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.probe()
+            except Exception as e:
+                logger.error(f"Error probing dependencies: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def probe(self) -> None:
+        """
+        Run all dependency checks concurrently and cache the results.
+        """
+        await asyncio.gather(*(self._probe_one(name, check) for name, check in self._checks.items()))
+        self._last_probe = time.monotonic()
+        self._ready_response = self._render()
+
+    async def _probe_one(self, name: str, check: DependencyCheck) -> None:
+        # A check that is still hanging from an earlier round stays failed instead
+        # of piling up more threads
+        if name in self._running_checks:
+            self._set_result(name, False, self.timeout, "Previous check still running")
+            return
+
+        self._running_checks.add(name)
+        start_time = time.perf_counter()
+        future = asyncio.get_running_loop().run_in_executor(None, check)
+        future.add_done_callback(lambda _: self._running_checks.discard(name))
+        try:
+            healthy = await asyncio.wait_for(asyncio.shield(future), timeout=self.timeout)
+            error = None if healthy is not False else "Check failed"
+        except asyncio.TimeoutError:
+            healthy, error = False, f"Timed out after {self.timeout}s"
+        except Exception as e:
+            healthy, error = False, str(e)
+        self._set_result(name, healthy, time.perf_counter() - start_time, error)
+
+    def _set_result(self, name: str, healthy: Optional[bool], duration: float,
+                    error: Optional[str]) -> None:
+        if healthy is None:
+            status = "not_configured"
+        else:
+            status = "ok" if healthy else "failing"
+            DEPENDENCY_UP.labels(dependency=name).set(1 if healthy else 0)
+            DEPENDENCY_CHECK_LATENCY.labels(dependency=name).observe(duration)
+        result = {
+            "status": status,
+            "latency_ms": round(duration * 1000, 1),
+            "checked_at": datetime.utcnow().isoformat(),
+        }
+        if error is not None:
+            result["error"] = error
+        # Only log changes so a failing dependency doesn't log every round
+        previous = self._results.get(name)
+        if previous is not None and previous["status"] != status:
+            if error is not None:
+                logger.warning(f"Dependency {name} is {status}: {error}")
+            else:
+                logger.info(f"Dependency {name} is {status}")
+        self._results[name] = result
+
+    def start_draining(self) -> None:
+        """
+        Report the service as not ready so it is taken out of load balancing.
+        """
+        self.draining = True
+        self._ready_response = self._render()
+
+    def _render(self) -> Tuple[int, bytes]:
+        if self.draining:
+            status = "draining"
+        elif self._last_probe is None:
+            status = "starting"
+        elif all(self._results.get(name, {}).get("status") == "ok" for name in self.required):
+            status = "ready"
+        else:
+            status = "not_ready"
+        status_code = 200 if status == "ready" else 503
+        return status_code, json.dumps({"status": status, "checks": self._results}).encode()
+
+    def ready_response(self) -> Tuple[int, bytes]:
+        """
+        Get the cached readiness status code and JSON body.
+
+        Results older than three probe intervals are reported as stale, which
+        happens if the prober stopped or is stuck.
+        """
+        if (self._last_probe is not None and not self.draining
+                and time.monotonic() - self._last_probe > 3 * self.interval + self.timeout):
+            return 503, json.dumps({"status": "stale", "checks": self._results}).encode()
+        return self._ready_response
+
+def check_database() -> bool:
+    """
+    Check out a connection from the pool and run a trivial query.
+    """
+    from app.db.database import engine
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    return True
+
+def check_search() -> Optional[bool]:
+    """
+    Check that Meilisearch is available.
+    """
+    from app.search.meilisearch import meilisearch_client
+
+    if not meilisearch_client.is_configured():
+        return None
+    return meilisearch_client.health_check()
+
+def check_storage() -> Optional[bool]:
+    """
+    Check that the R2 bucket is reachable.
+    """
+    from app.media.r2 import r2_client
+
+    if not r2_client.is_configured():
+        return None
+    return r2_client.health_check()
+
+health_prober = HealthProber(
+    interval=settings.HEALTH_PROBE_INTERVAL_SECONDS,
+    timeout=settings.HEALTH_PROBE_TIMEOUT_SECONDS,
+    required={name.strip() for name in settings.HEALTH_READY_DEPENDENCIES.split(",") if name.strip()},
+)
+health_prober.register("database", check_database)
+health_prober.register("search", check_search)
+health_prober.register("storage", check_storage)
+
+def install_drain_handler() -> None:
+    """
+    Delay the server's shutdown on SIGTERM until the worker has been drained.
+
+    On SIGTERM readiness turns 503 right away, and SIGINT (which uvicorn handles
+    like SIGTERM) is sent to the worker after HEALTH_DRAIN_SECONDS to start the
+    graceful shutdown. A second SIGTERM shuts down immediately.
+
+    Must be called from the running event loop of the main thread after the
+    server has installed its own signal handlers (e.g. in a startup handler).
+    """
+    if settings.HEALTH_DRAIN_SECONDS <= 0 or threading.current_thread() is not threading.main_thread():
+        return
+
+    loop = asyncio.get_running_loop()
+
+    def handle_sigterm() -> None:
+        if health_prober.draining:
+            os.kill(os.getpid(), signal.SIGINT)
+            return
+        logger.info(f"Draining for {settings.HEALTH_DRAIN_SECONDS}s before shutting down")
+        health_prober.start_draining()
+        loop.call_later(settings.HEALTH_DRAIN_SECONDS, os.kill, os.getpid(), signal.SIGINT)
+
+    try:
+        loop.add_signal_handler(signal.SIGTERM, handle_sigterm)
+    except (NotImplementedError, RuntimeError, ValueError):
+        # Not supported on this platform or loop
+        pass
@@ -0,0 +1,188 @@
+"""
+Per-route latency budgets and slow request capture.
+
+Each route template has a latency budget (ROUTE_LATENCY_BUDGETS, falling back to
+LATENCY_BUDGET_DEFAULT_MS). A watchdog thread takes stack samples of requests that
+are still running past their budget, and requests that finish over budget are kept
+in a bounded ring buffer together with their database and external call stats, so
+the worst recent requests can be inspected without a full APM.
+"""
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from starlette.types import Scope
+
+from app.core.config import settings
+from app.core.metrics import UNMATCHED_ROUTE, get_route_template
+from app.core.profiling import format_collapsed, snapshot_stacks
+from app.core.request_stats import RequestStats
+
+_captures: deque = deque(maxlen=settings.SLOW_REQUEST_CAPTURES_KEPT)
+_captures_lock = threading.Lock()
+
+@lru_cache(maxsize=1024)
+def get_latency_budget(endpoint: str) -> float:
+    """
+    Get the latency budget of a route.
+
+    ROUTE_LATENCY_BUDGETS is a comma-separated list of `route template=milliseconds`
+    pairs, e.g. "/api/v1/search/=300,/api/v1/packages/details/{slug}=500".
+
+    Args:
+        endpoint: Route template
+
+    Returns:
+        Budget in seconds
+    """
+    for entry in settings.ROUTE_LATENCY_BUDGETS.split(","):
+        template, _, budget = entry.rpartition("=")
+        if template.strip() == endpoint and budget.strip():
+            return float(budget) / 1000
+    return settings.LATENCY_BUDGET_DEFAULT_MS / 1000
+
+class _InflightRequest:
+    __slots__ = ("scope", "start_time", "budget", "samples", "sample_count")
+
+    def __init__(self, scope: Scope, start_time: float):
+        self.scope = scope
+        self.start_time = start_time
+        self.budget: Optional[float] = None
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+
+class SlowRequestWatchdog:
+    """
+    Background sampler for requests that are running past their latency budget.
+
+    Requests are registered by the request middleware. Every interval the watchdog
+    checks their elapsed time and, if any request is over budget, takes one snapshot
+    of all thread stacks and adds it to each such request.
+    """
+
+    def __init__(self, interval: float, max_samples: int):
+        """
+        Initialize the watchdog.
+
+        Args:
+            interval: Seconds between checks
+            max_samples: Maximum number of stack samples kept per request
+        """
+        self.interval = interval
+        self.max_samples = max_samples
+        self._inflight: Dict[str, _InflightRequest] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, request_id: str, scope: Scope, start_time: float) -> None:
+        """
+        Start watching a request.
+
+        Args:
+            request_id: Request ID
+            scope: ASGI scope of the request (the route is resolved from it once routed)
+            start_time: `time.perf_counter()` value when the request started
+        """
+        if self._thread is None:
+            self._start()
+        with self._lock:
+            self._inflight[request_id] = _InflightRequest(scope, start_time)
+
+    def finish(self, request_id: str) -> Counter:
+        """
+        Stop watching a request.
+
+        Returns:
+            Stack samples taken while the request was over budget
+        """
+        with self._lock:
+            request = self._inflight.pop(request_id, None)
+        return request.samples if request is not None else Counter()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="slow-request-watchdog", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        own_thread_id = threading.get_ident()
+        while True:
+            time.sleep(self.interval)
+            now = time.perf_counter()
+            with self._lock:
+                requests = list(self._inflight.values())
+            overdue = [request for request in requests
+                       if request.sample_count < self.max_samples and self._is_over_budget(request, now)]
+            if overdue:
+                stacks = snapshot_stacks(own_thread_id)
+                for request in overdue:
+                    request.samples.update(stacks)
+                    request.sample_count += 1
+
+    @staticmethod
+    def _is_over_budget(request: _InflightRequest, now: float) -> bool:
+        budget = request.budget
+        if budget is None:
+            endpoint = get_route_template(request.scope)
+            budget = get_latency_budget(endpoint)
+            # Unrouted requests may still be matched to a route with its own budget
+            if endpoint != UNMATCHED_ROUTE:
+                request.budget = budget
+        return now - request.start_time > budget
+
+watchdog = SlowRequestWatchdog(
+    interval=settings.SLOW_REQUEST_SAMPLE_INTERVAL_MS / 1000,
+    max_samples=settings.SLOW_REQUEST_MAX_SAMPLES,
+)
+
+def record_slow_request(capture: Dict[str, Any]) -> None:
+    """
+    Add a slow request capture to the ring buffer.
+    """
+    with _captures_lock:
+        _captures.append(capture)
+
+def build_capture(request_id: str, method: str, path: str, endpoint: str, status_code: int,
+                  duration: float, budget: float, request_stats: RequestStats,
+                  samples: Counter) -> Dict[str, Any]:
+    """
+    Build the capture of a request that exceeded its latency budget.
+    """
+    return {
+        "request_id": request_id,
+        "timestamp": datetime.utcnow(),
+        "method": method,
+        "path": path,
+        "route": endpoint,
+        "status_code": status_code,
+        "duration_ms": duration * 1000,
+        "budget_ms": budget * 1000,
+        "db_queries": request_stats.queries,
+        "db_duration_ms": request_stats.db_duration * 1000,
+        "external_calls": request_stats.external_calls,
+        "external_duration_ms": request_stats.external_duration * 1000,
+        "stack_samples": format_collapsed(samples),
+    }
+
+def get_slow_requests(limit: int = 20, sort: str = "duration") -> List[Dict[str, Any]]:
+    """
+    Get recent slow request captures.
+
+    Args:
+        limit: Maximum number of captures
+        sort: "duration" for the slowest first, "recent" for the newest first
+
+    Returns:
+        List of captures
+    """
+    with _captures_lock:
+        captures = list(_captures)
+    if sort == "duration":
+        captures.sort(key=lambda capture: capture["duration_ms"], reverse=True)
+    else:
+        captures.reverse()
+    return captures[:limit]
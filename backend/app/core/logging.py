@@ -1,162 +1,249 @@
+import atexit
+import copy
 import json
 import logging
-import time
-import uuid
+import queue
+import random
+import sys
 import traceback
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any, Optional
 from contextvars import ContextVar
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+
+from app.core.config import settings
+from app.core.metrics import LOG_RECORDS_DROPPED
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 # Context variables for request tracking
 request_id_var: ContextVar[str] = ContextVar('request_id', default='')
 user_id_var: ContextVar[Optional[int]] = ContextVar('user_id', default=None)
 
+# Keys whose values are never written to the logs (compared case-insensitively)
+REDACTED_KEYS = {"authorization", "proxy-authorization", "cookie", "set-cookie", "x-api-key"}
+REDACTED_VALUE = "[REDACTED]"
+
+_listener: Optional[QueueListener] = None
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log record to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, default=str)
+
+def _exception_fields(exc_info) -> Dict[str, Any]:
+    """Render an exception as the `exception` and `traceback` log fields."""
+    lines = traceback.format_exception(*exc_info)
+    return {"exception": "".join(lines).rstrip("\n"), "traceback": lines}
+
+def redact(value: Any) -> Any:
+    """
+    Replace sensitive header and cookie values in log data.
+
+    Args:
+        value: Log data (dictionaries and lists are redacted recursively)
+
+    Returns:
+        Copy of the data with sensitive values replaced
+    """
+    if isinstance(value, dict):
+        return {
+            key: REDACTED_VALUE if str(key).lower() in REDACTED_KEYS else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    return value
+
+@lru_cache(maxsize=256)
+def get_sample_rate(logger_name: str) -> float:
+    """
+    Get the sampling rate for a logger from LOG_SAMPLE_RATES.
+
+    The setting is a comma-separated list of `logger=rate` pairs; the most
+    specific matching logger prefix wins, e.g. "api.request=0.1,app=0.5".
+
+    Args:
+        logger_name: Name of the logger
+
+    Returns:
+        Fraction of records below WARNING that are kept (1.0 keeps all)
+    """
+    best_match = ""
+    rate = 1.0
+    for entry in settings.LOG_SAMPLE_RATES.split(","):
+        name, _, value = entry.partition("=")
+        name = name.strip()
+        if not value.strip():
+            continue
+        if logger_name == name or logger_name.startswith(f"{name}."):
+            if len(name) >= len(best_match):
+                best_match = name
+                rate = float(value)
+    return rate
+
+def is_sampled(logger_name: str, level: int) -> bool:
+    """
+    Decide whether a log record is kept by sampling.
+
+    Warnings and errors are always kept.
+
+    Args:
+        logger_name: Name of the logger
+        level: Level of the record
+
+    Returns:
+        True if the record should be logged
+    """
+    if level >= logging.WARNING:
+        return True
+    rate = get_sample_rate(logger_name)
+    return rate >= 1.0 or random.random() < rate
+
+class SamplingFilter(logging.Filter):
+    """Drop a fraction of low-level records according to LOG_SAMPLE_RATES."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Records may be marked as sampled by callers that decide up front
+        if getattr(record, "sampled", False) or is_sampled(record.name, record.levelno):
+            return True
+        LOG_RECORDS_DROPPED.labels(reason="sampled").inc()
+        return False
+
 class JSONFormatter(logging.Formatter):
     """Format logs as JSON for structured logging."""
-    
+
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat(),
             "level": record.levelname,
             "message": record.getMessage(),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
         }
-        
-        # Add request_id if available
-        request_id = request_id_var.get()
+
+        # Add request_id if available (captured when the record was queued)
+        request_id = getattr(record, "request_id", None) or request_id_var.get()
         if request_id:
             log_data["request_id"] = request_id
-        
+
         # Add user_id if available
-        user_id = user_id_var.get()
+        user_id = getattr(record, "user_id", None) or user_id_var.get()
         if user_id:
             log_data["user_id"] = user_id
-        
-        # Add exception info if available
+
+        # Add exception info if available (queued records carry it pre-rendered)
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
-            log_data["traceback"] = traceback.format_exception(*record.exc_info)
-        
+            log_data.update(_exception_fields(record.exc_info))
+        elif getattr(record, "exception_fields", None):
+            log_data.update(record.exception_fields)
+
         # Add extra fields if available
         if hasattr(record, "extra"):
-            log_data.update(record.extra)
-        
-        return json.dumps(log_data)
-
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging request and response details."""
-    
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
-        self.logger = logging.getLogger("api.request")
-    
-    async def dispatch(self, request: Request, call_next) -> Response:
-        # Generate request ID
-        request_id = str(uuid.uuid4())
-        request_id_var.set(request_id)
-        
-        # Start timer
-        start_time = time.time()
-        
-        # Log request
-        self.logger.info(
-            f"Request started: {request.method} {request.url.path}",
-            extra={
-                "request": {
-                    "id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "query": str(request.query_params),
-                    "headers": dict(request.headers),
-                    "client": request.client.host if request.client else None,
-                }
-            }
-        )
-        
+            log_data.update(redact(record.extra))
+
+        return _dumps(log_data)
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the caller.
+
+    Records are handed to a QueueListener thread for formatting and output. When
+    the queue is full the record is dropped and counted instead of waiting.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Like QueueHandler.prepare, render the message and exception now and
+        # queue a copy without args or exc_info: the listener thread must not
+        # hold on to (or see later changes of) the caller's objects and frames
+        prepared = copy.copy(record)
+        prepared.message = record.getMessage()
+        prepared.msg = prepared.message
+        prepared.args = None
+        if record.exc_info:
+            prepared.exception_fields = _exception_fields(record.exc_info)
+        prepared.exc_info = None
+        prepared.exc_text = None
+        prepared.stack_info = None
+        if hasattr(record, "extra"):
+            prepared.extra = redact(record.extra)
+
+        # Formatting happens on the listener thread, which doesn't see the
+        # request's context variables, so capture them here
+        prepared.request_id = request_id_var.get()
+        prepared.user_id = user_id_var.get()
+        return prepared
+
+    def enqueue(self, record: logging.LogRecord) -> None:
         try:
-            # Process request
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration = time.time() - start_time
-            
-            # Log response
-            self.logger.info(
-                f"Request completed: {request.method} {request.url.path} {response.status_code}",
-                extra={
-                    "response": {
-                        "status_code": response.status_code,
-                        "duration": duration,
-                        "headers": dict(response.headers),
-                    }
-                }
-            )
-            
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            
-            return response
-        except Exception as e:
-            # Calculate duration
-            duration = time.time() - start_time
-            
-            # Log error
-            self.logger.error(
-                f"Request failed: {request.method} {request.url.path}",
-                exc_info=True,
-                extra={
-                    "error": {
-                        "type": type(e).__name__,
-                        "message": str(e),
-                        "duration": duration,
-                    }
-                }
-            )
-            
-            # Re-raise exception
-            raise
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.labels(reason="queue_full").inc()
 
 def setup_logging(log_level: str = "INFO") -> None:
     """Configure logging for the application.
-    
+
+    Records are queued by the logging call and written to stdout by a background
+    listener thread, so slow log output can't block request handling.
+
     Args:
         log_level: The log level to use (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
+    global _listener
+
     # Set log level
-    import sys
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
-    
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
-    
+
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
-    
-    # Create console handler with JSON formatter
+    shutdown_logging()
+
+    # Create console handler with JSON formatter, fed from a bounded queue
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(JSONFormatter())
-    
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+    get_sample_rate.cache_clear()
+
+    _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
+
     # Add handler to root logger
-    root_logger.addHandler(console_handler)
-    
+    root_logger.addHandler(queue_handler)
+
     # Configure specific loggers
     logging.getLogger("api").setLevel(numeric_level)
     logging.getLogger("api.request").setLevel(numeric_level)
     logging.getLogger("app").setLevel(numeric_level)
-    
+
     # Disable uvicorn access logs (we have our own middleware)
     uvicorn_logger = logging.getLogger("uvicorn.access")
     uvicorn_logger.disabled = True
-    
+
     # Log configuration complete
     logging.getLogger("app.startup").info(
         "Logging configured",
-        extra={"log_level": log_level}
+        extra={"extra": {"log_level": log_level}}
     )
+
+def shutdown_logging() -> None:
+    """Stop the log listener thread, writing out any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,254 @@
+"""
+Memory instrumentation and worker recycling.
+
+RSS and GC collection counts are exported by prometheus_client's default process
+and GC collectors; this module adds GC pause times and per-generation object
+counts, on-demand tracemalloc snapshots for finding allocation sites and heap
+growth, and recycling of workers after a number of requests or above an RSS limit.
+"""
+import gc
+import logging
+import os
+import random
+import resource
+import signal
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.metrics import GC_OBJECTS, GC_PAUSE, WORKER_RECYCLES
+
+logger = logging.getLogger(__name__)
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# Snapshot that allocation diffs are compared against
+_baseline: Optional[tracemalloc.Snapshot] = None
+_baseline_taken_at: Optional[datetime] = None
+_tracemalloc_lock = threading.Lock()
+
+_gc_start_time: Optional[float] = None
+
+def get_rss_bytes() -> Optional[int]:
+    """
+    Get the current resident set size of the process.
+
+    Returns:
+        RSS in bytes, or None if it can't be read on this platform
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+def get_peak_rss_bytes() -> int:
+    """
+    Get the peak resident set size of the process.
+    """
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def _gc_callback(phase: str, info: Dict[str, Any]) -> None:
+    global _gc_start_time
+    if phase == "start":
+        _gc_start_time = time.perf_counter()
+    elif _gc_start_time is not None:
+        GC_PAUSE.labels(generation=str(info["generation"])).observe(time.perf_counter() - _gc_start_time)
+        _gc_start_time = None
+
+def setup_memory_metrics() -> None:
+    """
+    Register the GC pause and object count metrics.
+    """
+    if _gc_callback not in gc.callbacks:
+        gc.callbacks.append(_gc_callback)
+    for generation in range(3):
+        GC_OBJECTS.labels(generation=str(generation)).set_function(
+            lambda generation=generation: gc.get_count()[generation]
+        )
+
+def get_memory_summary() -> Dict[str, Any]:
+    """
+    Get the memory usage of the worker.
+
+    Returns:
+        Dictionary with RSS, GC and tracemalloc stats
+    """
+    summary = {
+        "worker_pid": os.getpid(),
+        "rss_bytes": get_rss_bytes(),
+        "peak_rss_bytes": get_peak_rss_bytes(),
+        "gc_counts": list(gc.get_count()),
+        "gc_thresholds": list(gc.get_threshold()),
+        "gc_stats": gc.get_stats(),
+        "gc_uncollectable": len(gc.garbage),
+        "tracemalloc_enabled": tracemalloc.is_tracing(),
+    }
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        summary["traced_bytes"] = current
+        summary["traced_peak_bytes"] = peak
+        summary["tracemalloc_overhead_bytes"] = tracemalloc.get_tracemalloc_memory()
+    return summary
+
+def start_allocation_tracing(frames: int = 1) -> bool:
+    """
+    Start tracemalloc and take a baseline snapshot for later diffs.
+
+    Tracing slows down allocations noticeably, so it should only run while
+    investigating.
+
+    Args:
+        frames: Number of stack frames stored per allocation
+
+    Returns:
+        False if tracing was already running
+    """
+    global _baseline, _baseline_taken_at
+    with _tracemalloc_lock:
+        if tracemalloc.is_tracing():
+            return False
+        tracemalloc.start(frames)
+        _baseline = tracemalloc.take_snapshot()
+        _baseline_taken_at = datetime.utcnow()
+        return True
+
+def stop_allocation_tracing() -> None:
+    """
+    Stop tracemalloc and drop the baseline snapshot.
+    """
+    global _baseline, _baseline_taken_at
+    with _tracemalloc_lock:
+        tracemalloc.stop()
+        _baseline = None
+        _baseline_taken_at = None
+
+def reset_allocation_baseline() -> bool:
+    """
+    Replace the baseline snapshot with the current allocations.
+
+    Returns:
+        False if tracing isn't running
+    """
+    global _baseline, _baseline_taken_at
+    with _tracemalloc_lock:
+        if not tracemalloc.is_tracing():
+            return False
+        _baseline = tracemalloc.take_snapshot()
+        _baseline_taken_at = datetime.utcnow()
+        return True
+
+def _format_traceback(traceback: tracemalloc.Traceback) -> List[str]:
+    return [f"{frame.filename}:{frame.lineno}" for frame in traceback]
+
+def get_top_allocations(limit: int = 20, group_by: str = "lineno",
+                        diff: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Get the allocation sites holding the most memory.
+
+    Args:
+        limit: Maximum number of allocation sites
+        group_by: "lineno", "filename" or "traceback"
+        diff: Compare against the baseline snapshot instead of listing totals
+
+    Returns:
+        Dictionary with the allocation sites, or None if tracing isn't running
+    """
+    with _tracemalloc_lock:
+        if not tracemalloc.is_tracing():
+            return None
+        snapshot = tracemalloc.take_snapshot()
+        baseline = _baseline
+        baseline_taken_at = _baseline_taken_at
+
+    # Leave out tracemalloc's own allocations and import machinery
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+
+    allocations = []
+    if diff and baseline is not None:
+        for stat in snapshot.compare_to(baseline, group_by)[:limit]:
+            allocations.append({
+                "traceback": _format_traceback(stat.traceback),
+                "size_bytes": stat.size,
+                "size_diff_bytes": stat.size_diff,
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+            })
+    else:
+        for stat in snapshot.statistics(group_by)[:limit]:
+            allocations.append({
+                "traceback": _format_traceback(stat.traceback),
+                "size_bytes": stat.size,
+                "count": stat.count,
+            })
+
+    return {
+        "worker_pid": os.getpid(),
+        "group_by": group_by,
+        "diff": diff and baseline is not None,
+        "baseline_taken_at": baseline_taken_at,
+        "allocations": allocations,
+    }
+
+class WorkerRecycler:
+    """
+    Stops the worker after a number of requests or when its RSS exceeds a limit.
+
+    The worker is sent SIGTERM, so it drains and shuts down gracefully (see
+    app.core.health); the process manager (gunicorn, Kubernetes, ...) replaces it.
+    """
+
+    # RSS is read every this many requests
+    RSS_CHECK_INTERVAL = 100
+
+    def __init__(self, max_requests: int = 0, jitter: int = 0, max_rss_mb: int = 0):
+        """
+        Initialize the recycler.
+
+        Args:
+            max_requests: Requests after which the worker is recycled (0 disables)
+            jitter: Up to this many requests are randomly added to max_requests so
+                workers started together aren't recycled together
+            max_rss_mb: RSS in megabytes above which the worker is recycled (0 disables)
+        """
+        self.max_requests = max_requests + random.randint(0, jitter) if max_requests else 0
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024
+        self.requests = 0
+        self.recycling = False
+
+    def on_request(self) -> None:
+        """
+        Count a finished request and recycle the worker if a limit is reached.
+        """
+        self.requests += 1
+        if self.recycling:
+            return
+        if self.max_requests and self.requests >= self.max_requests:
+            self.recycle("max_requests", f"served {self.requests} requests")
+        elif self.max_rss_bytes and self.requests % self.RSS_CHECK_INTERVAL == 0:
+            rss = get_rss_bytes()
+            if rss is not None and rss > self.max_rss_bytes:
+                self.recycle("max_rss", f"RSS {rss // (1024 * 1024)}MB is above the limit")
+
+    def recycle(self, reason: str, detail: str) -> None:
+        """
+        Ask the worker to shut down gracefully.
+        """
+        self.recycling = True
+        WORKER_RECYCLES.labels(reason=reason).inc()
+        logger.warning(f"Recycling worker {os.getpid()}: {detail}")
+        os.kill(os.getpid(), signal.SIGTERM)
+
+worker_recycler = WorkerRecycler(
+    max_requests=settings.MAX_REQUESTS,
+    jitter=settings.MAX_REQUESTS_JITTER,
+    max_rss_mb=settings.MAX_WORKER_RSS_MB,
+)
@@ -1,9 +1,20 @@
 from prometheus_client import Counter, Histogram, Gauge, Summary
 import time
-from typing import Callable, Dict, Any
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from starlette.routing import Match
+from starlette.types import Scope
+
+from app.core.config import settings
+from app.core.request_stats import record_external_call
+
+# Label used for requests that didn't match any route (e.g. 404s), so that
+# arbitrary paths can't create new time series
+UNMATCHED_ROUTE = "<unmatched>"
+
+def _parse_buckets(value: str) -> Tuple[float, ...]:
+    """Parse a comma-separated list of histogram buckets."""
+    buckets = sorted(float(bucket) for bucket in value.split(",") if bucket.strip())
+    return tuple(buckets) + (float("inf"),)
 
 # Define Prometheus metrics
 REQUEST_COUNT = Counter(
@@ -16,15 +27,111 @@ REQUEST_LATENCY = Histogram(
     "http_request_duration_seconds",
     "HTTP request latency in seconds",
     ["method", "endpoint"],
-    buckets=(0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0, 25.0, 50.0, 75.0, 100.0, float("inf"))
+    buckets=_parse_buckets(settings.METRICS_LATENCY_BUCKETS)
+)
+
+REQUEST_SIZE = Histogram(
+    "http_request_size_bytes",
+    "HTTP request body size in bytes",
+    ["method", "endpoint"],
+    buckets=_parse_buckets(settings.METRICS_SIZE_BUCKETS)
 )
 
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size in bytes",
+    ["method", "endpoint"],
+    buckets=_parse_buckets(settings.METRICS_SIZE_BUCKETS)
+)
+
+# The route isn't known until the request has been routed, so in-progress
+# requests are only labelled by method
 REQUEST_IN_PROGRESS = Gauge(
     "http_requests_in_progress",
     "Number of HTTP requests in progress",
+    ["method"]
+)
+
+LATENCY_BUDGET_VIOLATIONS = Counter(
+    "http_latency_budget_violations_total",
+    "HTTP requests that exceeded their route's latency budget",
     ["method", "endpoint"]
 )
 
+DEPENDENCY_UP = Gauge(
+    "dependency_up",
+    "Whether a dependency passed its last health check",
+    ["dependency"]
+)
+
+DEPENDENCY_CHECK_LATENCY = Histogram(
+    "dependency_check_duration_seconds",
+    "Dependency health check latency in seconds",
+    ["dependency"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0)
+)
+
+GC_PAUSE = Histogram(
+    "python_gc_pause_seconds",
+    "Garbage collection pause time in seconds",
+    ["generation"],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+)
+
+GC_OBJECTS = Gauge(
+    "python_gc_generation_objects",
+    "Allocations since the last collection of each GC generation",
+    ["generation"]
+)
+
+BACKGROUND_TASKS_TRACKED = Gauge(
+    "background_tasks_tracked",
+    "Background tasks kept by the task manager, including finished ones"
+)
+
+WORKER_RECYCLES = Counter(
+    "worker_recycles_total",
+    "Workers shut down for recycling",
+    ["reason"]
+)
+
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent hashing or verifying a password in seconds",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+PASSWORD_HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time password hashing operations waited for a hashing thread in seconds",
+    ["operation"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+
+PASSWORD_HASH_PENDING = Gauge(
+    "password_hash_pending",
+    "Password hashing operations queued or running"
+)
+
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hashing operations rejected because the hashing pool was full",
+    ["operation"]
+)
+
+LOGIN_ATTEMPTS = Counter(
+    "login_attempts_total",
+    "Login attempts by result",
+    ["result"]
+)
+
+PAGE_SECTION_FALLBACKS = Counter(
+    "page_section_fallbacks_total",
+    "Composite page sections replaced with their fallback",
+    ["page", "section", "reason"]
+)
+
 DB_QUERY_LATENCY = Histogram(
     "db_query_duration_seconds",
     "Database query latency in seconds",
@@ -32,6 +139,19 @@ DB_QUERY_LATENCY = Histogram(
     buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0)
 )
 
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "Number of database queries per HTTP request",
+    ["endpoint"],
+    buckets=(0, 1, 2, 5, 10, 20, 30, 50, 100, 200)
+)
+
+DB_QUERY_COUNT_EXCEEDED = Counter(
+    "db_query_count_exceeded_total",
+    "Requests that ran more queries than DB_QUERY_COUNT_THRESHOLD (likely N+1 queries)",
+    ["endpoint"]
+)
+
 EXTERNAL_API_LATENCY = Histogram(
     "external_api_duration_seconds",
     "External API call latency in seconds",
@@ -39,6 +159,12 @@ EXTERNAL_API_LATENCY = Histogram(
     buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
 )
 
+EXTERNAL_API_BYTES = Counter(
+    "external_api_bytes_total",
+    "Bytes transferred to and from external APIs",
+    ["service", "operation", "direction"]
+)
+
 CACHE_HIT_COUNT = Counter(
     "cache_hit_total",
     "Total number of cache hits",
@@ -57,41 +183,80 @@ ERROR_COUNT = Counter(
     ["type", "location"]
 )
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    """Middleware for collecting Prometheus metrics."""
+TRACE_SAMPLING_DECISIONS = Counter(
+    "trace_sampling_decisions_total",
+    "Tail sampling decisions for completed traces",
+    ["decision"]
+)
+
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped_total",
+    "Log records dropped by sampling or because the log queue was full",
+    ["reason"]
+)
+
+def get_route_template(scope: Scope) -> str:
+    """
+    Get the path template of the route that handled a request.
     
-    def __init__(self, app: ASGIApp):
-        super().__init__(app)
+    The router records the matched endpoint in the scope; it's mapped back to the
+    route's path template (e.g. `/api/v1/packages/details/{slug}`) so that metrics
+    are labelled per route rather than per URL.
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Extract endpoint from request
-        endpoint = request.url.path
-        method = request.method
-        
-        # Track request in progress
-        REQUEST_IN_PROGRESS.labels(method=method, endpoint=endpoint).inc()
-        
-        # Track request latency
-        start_time = time.time()
+    Args:
+        scope: ASGI scope of a request that has been routed
         
-        try:
-            # Process request
-            response = await call_next(request)
-            
-            # Record metrics
-            status_code = response.status_code
-            duration = time.time() - start_time
-            REQUEST_COUNT.labels(method=method, endpoint=endpoint, status_code=status_code).inc()
-            REQUEST_LATENCY.labels(method=method, endpoint=endpoint).observe(duration)
-            
-            return response
-        except Exception as e:
-            # Record error metrics
-            ERROR_COUNT.labels(type=type(e).__name__, location=f"{method}:{endpoint}").inc()
-            raise
-        finally:
-            # Decrement in-progress counter
-            REQUEST_IN_PROGRESS.labels(method=method, endpoint=endpoint).dec()
+    Returns:
+        Route path template, or UNMATCHED_ROUTE if no route matched
+    """
+    # Newer Starlette versions record the matched route directly
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    
+    endpoint = scope.get("endpoint")
+    app = scope.get("app")
+    if endpoint is None or app is None:
+        return UNMATCHED_ROUTE
+    
+    routes_by_endpoint = getattr(app.state, "routes_by_endpoint", None)
+    if routes_by_endpoint is None:
+        routes_by_endpoint = {}
+        for route in app.routes:
+            route_endpoint = getattr(route, "endpoint", None) or getattr(route, "app", None)
+            routes_by_endpoint.setdefault(route_endpoint, []).append(route)
+        app.state.routes_by_endpoint = routes_by_endpoint
+    
+    routes = routes_by_endpoint.get(endpoint)
+    if not routes:
+        return UNMATCHED_ROUTE
+    if len(routes) == 1:
+        return routes[0].path
+    
+    # The same endpoint is registered under several paths; find the one that matched
+    for route in routes:
+        match, _ = route.matches({**scope, "path": scope.get("raw_route_path", scope["path"])})
+        if match != Match.NONE:
+            return route.path
+    return routes[0].path
+
+def track_request(method: str, endpoint: str, status_code: int, duration: float,
+                  request_size: int, response_size: int) -> None:
+    """
+    Record the metrics of a completed HTTP request.
+    
+    Args:
+        method: HTTP method
+        endpoint: Route template (see get_route_template)
+        status_code: Response status code
+        duration: Request duration in seconds
+        request_size: Request body size in bytes
+        response_size: Response body size in bytes
+    """
+    REQUEST_COUNT.labels(method=method, endpoint=endpoint, status_code=status_code).inc()
+    REQUEST_LATENCY.labels(method=method, endpoint=endpoint).observe(duration)
+    REQUEST_SIZE.labels(method=method, endpoint=endpoint).observe(request_size)
+    RESPONSE_SIZE.labels(method=method, endpoint=endpoint).observe(response_size)
 
 def track_db_query(operation: str, table: str) -> Callable:
     """Decorator for tracking database query latency."""
@@ -106,6 +271,20 @@ def track_db_query(operation: str, table: str) -> Callable:
         return wrapper
     return decorator
 
+def observe_external_call(service: str, endpoint: str, duration: float) -> None:
+    """
+    Record the latency of an external API call.
+    
+    The call is also added to the current request's external call time.
+    
+    Args:
+        service: External service name
+        endpoint: Endpoint label (without IDs)
+        duration: Call duration in seconds
+    """
+    EXTERNAL_API_LATENCY.labels(service=service, endpoint=endpoint).observe(duration)
+    record_external_call(duration)
+
 def track_external_api(service: str, endpoint: str) -> Callable:
     """Decorator for tracking external API call latency."""
     def decorator(func):
@@ -114,8 +293,7 @@ def track_external_api(service: str, endpoint: str) -> Callable:
             try:
                 return await func(*args, **kwargs)
             finally:
-                duration = time.time() - start_time
-                EXTERNAL_API_LATENCY.labels(service=service, endpoint=endpoint).observe(duration)
+                observe_external_call(service, endpoint, time.time() - start_time)
         return wrapper
     return decorator
 
@@ -0,0 +1,240 @@
+import logging
+import time
+import uuid
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.latency_budget import build_capture, get_latency_budget, record_slow_request, watchdog
+from app.core.logging import is_sampled, request_id_var
+from app.core.memory import worker_recycler
+from app.core.metrics import (
+    DB_QUERIES_PER_REQUEST, DB_QUERY_COUNT_EXCEEDED, ERROR_COUNT, LATENCY_BUDGET_VIOLATIONS,
+    LOG_RECORDS_DROPPED, REQUEST_IN_PROGRESS, get_route_template, track_request
+)
+from app.core.profiling import SamplingProfiler, store_request_profile, verify_profile_token
+from app.core.request_stats import RequestStats, request_stats_var
+
+CORRELATION_ID_HEADER = b"x-correlation-id"
+PROFILE_TOKEN_HEADER = b"x-profile-token"
+
+class RequestContextMiddleware:
+    """
+    Pure ASGI middleware handling per-request bookkeeping in a single pass.
+
+    - Assigns a request ID and propagates the correlation ID (the incoming
+      X-Correlation-ID header, or the request ID if there is none)
+    - Times the request and records Prometheus metrics by route template
+    - Counts database queries per request and flags requests exceeding
+      DB_QUERY_COUNT_THRESHOLD as likely N+1s; in debug mode the query count and
+      database time are sent as `Server-Timing` headers
+    - Writes a sampled structured access log line; errors and slow requests
+      are always logged
+    - Checks the request against its route's latency budget (see
+      app.core.latency_budget); requests over budget are counted and captured
+      with their database/external call stats and the stacks sampled while they
+      were over budget
+    - Counts requests towards worker recycling (see app.core.memory)
+    - Profiles requests carrying a valid `X-Profile-Token` header (see
+      app.core.profiling); the profile ID is returned as `X-Profile-ID`
+
+    The response isn't re-wrapped: the ID headers are added to the
+    `http.response.start` message and body sizes are counted as they stream through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.logger = logging.getLogger("api.request")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = uuid.uuid4().hex
+        correlation_id = request_id
+        profile_token = None
+        for name, value in scope["headers"]:
+            if name == CORRELATION_ID_HEADER:
+                correlation_id = value.decode("latin-1")
+            elif name == PROFILE_TOKEN_HEADER:
+                profile_token = value.decode("latin-1")
+        profiler = self._start_profiler(profile_token) if profile_token else None
+        token = request_id_var.set(request_id)
+        request_stats = RequestStats()
+        request_stats_token = request_stats_var.set(request_stats)
+
+        method = scope["method"]
+        path = scope["path"]
+        # Keep the original path; mounted apps rewrite scope["path"]
+        scope["raw_route_path"] = path
+        request_size = 0
+        response_size = 0
+        status_code = 500
+
+        async def receive_wrapper() -> Message:
+            nonlocal request_size
+            message = await receive()
+            if message["type"] == "http.request":
+                request_size += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_size, status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Request-ID", request_id)
+                headers.append("X-Correlation-ID", correlation_id)
+                if settings.DEBUG:
+                    headers.append("Server-Timing", self._server_timing(request_stats, start_time))
+                if profiler is not None:
+                    headers.append("X-Profile-ID", request_id)
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = REQUEST_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        start_time = time.perf_counter()
+        watchdog.register(request_id, scope, start_time)
+        error = None
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            duration = time.perf_counter() - start_time
+            in_progress.dec()
+            samples = watchdog.finish(request_id)
+            if profiler is not None:
+                self._finish_profiler(profiler, request_id, method, path)
+            endpoint = get_route_template(scope)
+            track_request(method, endpoint, status_code, duration, request_size, response_size)
+            if error is not None:
+                ERROR_COUNT.labels(type=type(error).__name__, location=f"{method}:{endpoint}").inc()
+            self._check_query_count(method, path, endpoint, request_stats)
+            budget = get_latency_budget(endpoint)
+            if duration > budget:
+                LATENCY_BUDGET_VIOLATIONS.labels(method=method, endpoint=endpoint).inc()
+                record_slow_request(build_capture(request_id, method, path, endpoint, status_code,
+                                                  duration, budget, request_stats, samples))
+            self._log_request(scope, method, path, endpoint, status_code, duration,
+                              response_size, correlation_id, request_stats, error)
+            request_stats_var.reset(request_stats_token)
+            request_id_var.reset(token)
+            worker_recycler.on_request()
+
+    @staticmethod
+    def _start_profiler(profile_token: str) -> Optional[SamplingProfiler]:
+        """
+        Start profiling the request if it carries a valid profiling token.
+
+        Returns:
+            The running profiler, or None if the token is invalid or another
+            profiling session is running in this worker
+        """
+        if not verify_profile_token(profile_token):
+            return None
+        profiler = SamplingProfiler(interval=settings.PROFILER_INTERVAL_MS / 1000)
+        return profiler if profiler.start() else None
+
+    def _finish_profiler(self, profiler: SamplingProfiler, request_id: str,
+                         method: str, path: str) -> None:
+        """
+        Stop a request's profiler, then store and log its collapsed stacks.
+        """
+        collapsed = profiler.stop()
+        store_request_profile(request_id, collapsed)
+        self.logger.info(
+            f"Request profile: {method} {path}",
+            extra={"extra": {"profile": {
+                "samples": profiler.samples,
+                "collapsed": collapsed,
+            }}, "sampled": True},
+        )
+
+    @staticmethod
+    def _server_timing(request_stats: RequestStats, start_time: float) -> str:
+        """
+        Build the Server-Timing header value for a response.
+        """
+        total = (time.perf_counter() - start_time) * 1000
+        return (
+            f'db;dur={request_stats.db_duration * 1000:.1f};desc="{request_stats.queries} queries", '
+            f"app;dur={total:.1f}"
+        )
+
+    def _check_query_count(self, method: str, path: str, endpoint: str,
+                           request_stats: RequestStats) -> None:
+        """
+        Record the request's query count and flag likely N+1 queries.
+        """
+        DB_QUERIES_PER_REQUEST.labels(endpoint=endpoint).observe(request_stats.queries)
+        if request_stats.queries > settings.DB_QUERY_COUNT_THRESHOLD:
+            DB_QUERY_COUNT_EXCEEDED.labels(endpoint=endpoint).inc()
+            self.logger.warning(
+                f"Likely N+1 queries: {method} {path} ran {request_stats.queries} queries",
+                extra={"extra": {"db": {
+                    "route": endpoint,
+                    "queries": request_stats.queries,
+                    "duration": request_stats.db_duration,
+                    "threshold": settings.DB_QUERY_COUNT_THRESHOLD,
+                }}},
+            )
+
+    def _log_request(self, scope: Scope, method: str, path: str, endpoint: str,
+                     status_code: int, duration: float, response_size: int,
+                     correlation_id: str, request_stats: RequestStats,
+                     error: Optional[Exception] = None) -> None:
+        """
+        Write the access log line for a request if it is sampled.
+
+        Server errors are logged as errors and requests slower than
+        REQUEST_LOG_SLOW_SECONDS as warnings, so they are never sampled out; other
+        requests are sampled according to LOG_SAMPLE_RATES for "api.request".
+        """
+        if error is not None or status_code >= 500:
+            level = logging.ERROR
+        elif duration >= settings.REQUEST_LOG_SLOW_SECONDS:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+
+        # Decide before building the record so unsampled requests cost almost nothing
+        if not self.logger.isEnabledFor(level):
+            return
+        if not is_sampled(self.logger.name, level):
+            LOG_RECORDS_DROPPED.labels(reason="sampled").inc()
+            return
+
+        client = scope.get("client")
+        request_data = {
+            "method": method,
+            "path": path,
+            "route": endpoint,
+            "query": scope.get("query_string", b"").decode("latin-1"),
+            "client": client[0] if client else None,
+            "status_code": status_code,
+            "duration": duration,
+            "response_size": response_size,
+            "correlation_id": correlation_id,
+            "db_queries": request_stats.queries,
+            "db_duration": request_stats.db_duration,
+            "external_calls": request_stats.external_calls,
+            "external_duration": request_stats.external_duration,
+        }
+        if error is not None:
+            request_data["error"] = {"type": type(error).__name__, "message": str(error)}
+
+        self.logger.log(
+            level,
+            f"Request {'failed' if error is not None else 'completed'}: {method} {path} {status_code}",
+            exc_info=error,
+            # Sampling has already been applied above
+            extra={"extra": {"request": request_data}, "sampled": True},
+        )
@@ -0,0 +1,193 @@
+"""
+Low-overhead sampling profiler for production workers.
+
+A background thread periodically snapshots the Python stacks of all threads in the
+worker (`sys._current_frames`) and counts them. The result is rendered as
+flamegraph-compatible collapsed stacks (`frame;frame;frame count`), which can be fed
+to flamegraph.pl, speedscope or similar tools.
+
+Only one profiling session runs per worker process at a time.
+"""
+import os
+import sys
+import threading
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from jose import JWTError, jwt
+
+from app.core.config import settings
+
+PROFILE_TOKEN_TYPE = "profile"
+
+# Leaf frames of threads that are blocked waiting rather than running code
+_IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+}
+
+# Serializes profiling sessions within the worker
+_session_lock = threading.Lock()
+
+# Profiles of recently profiled requests, by request ID
+_request_profiles: "OrderedDict[str, str]" = OrderedDict()
+_request_profiles_lock = threading.Lock()
+
+@lru_cache(maxsize=8192)
+def _frame_label(code) -> str:
+    # Shorten paths to the package, e.g. "starlette/routing.py" or "app/services/country.py"
+    filename = code.co_filename
+    index = filename.rfind("site-packages/")
+    if index != -1:
+        filename = filename[index + len("site-packages/"):]
+    else:
+        index = filename.rfind("/app/")
+        if index != -1:
+            filename = filename[index + 1:]
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+def snapshot_stacks(exclude_thread_id: Optional[int] = None) -> List[str]:
+    """
+    Take a snapshot of the stacks of all busy threads.
+
+    Args:
+        exclude_thread_id: Thread to leave out (usually the sampling thread itself)
+
+    Returns:
+        One collapsed stack (`outer;...;inner`) per thread that isn't idle
+    """
+    stacks = []
+    for thread_id, frame in sys._current_frames().items():
+        if thread_id == exclude_thread_id:
+            continue
+        code = frame.f_code
+        if (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+            continue
+        stack = []
+        while frame is not None:
+            stack.append(_frame_label(frame.f_code))
+            frame = frame.f_back
+        stack.reverse()
+        stacks.append(";".join(stack))
+    return stacks
+
+def format_collapsed(stacks: Counter) -> str:
+    """
+    Render counted stacks as collapsed stacks, most frequent first.
+    """
+    return "\n".join(f"{stack} {count}" for stack, count in stacks.most_common())
+
+class SamplingProfiler:
+    """
+    Sampling profiler that counts the stacks of all threads at a fixed interval.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Initialize the profiler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.samples = 0
+        self._stacks: Counter = Counter()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        """
+        Start sampling in a background thread.
+
+        Returns:
+            False if another profiling session is already running in this worker
+        """
+        if not _session_lock.acquire(blocking=False):
+            return False
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> str:
+        """
+        Stop sampling.
+
+        Returns:
+            Collapsed stacks collected so far
+        """
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+            _session_lock.release()
+        return self.collapsed()
+
+    def _run(self) -> None:
+        own_thread_id = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            self._sample(own_thread_id)
+
+    def _sample(self, own_thread_id: int) -> None:
+        self.samples += 1
+        self._stacks.update(snapshot_stacks(own_thread_id))
+
+    def collapsed(self) -> str:
+        """
+        Render the collected samples as collapsed stacks, most frequent first.
+        """
+        return format_collapsed(self._stacks)
+
+def create_profile_token(expires_in: int) -> Tuple[str, datetime]:
+    """
+    Create a signed token that enables per-request profiling.
+
+    Args:
+        expires_in: Token lifetime in seconds
+
+    Returns:
+        Tuple of token and expiry time
+    """
+    expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+    token = jwt.encode(
+        {"type": PROFILE_TOKEN_TYPE, "exp": expires_at},
+        settings.JWT_SECRET_KEY,
+        algorithm=settings.JWT_ALGORITHM,
+    )
+    return token, expires_at
+
+def verify_profile_token(token: str) -> bool:
+    """
+    Check that a per-request profiling token is valid and not expired.
+    """
+    try:
+        claims = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+    except JWTError:
+        return False
+    return claims.get("type") == PROFILE_TOKEN_TYPE
+
+def store_request_profile(request_id: str, collapsed: str) -> None:
+    """
+    Keep the profile of a request for later retrieval.
+    """
+    with _request_profiles_lock:
+        _request_profiles[request_id] = collapsed
+        while len(_request_profiles) > settings.PROFILER_REQUEST_PROFILES_KEPT:
+            _request_profiles.popitem(last=False)
+
+def get_request_profile(request_id: str) -> Optional[str]:
+    """
+    Get the stored profile of a request profiled in this worker.
+    """
+    with _request_profiles_lock:
+        return _request_profiles.get(request_id)
+
+def list_request_profiles() -> Dict[str, int]:
+    """
+    Get the IDs of the requests with stored profiles and their sizes in bytes.
+    """
+    with _request_profiles_lock:
+        return {request_id: len(collapsed) for request_id, collapsed in _request_profiles.items()}
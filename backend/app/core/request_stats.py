@@ -0,0 +1,35 @@
+"""
+Per-request resource accounting.
+
+The request middleware sets a RequestStats instance in a context variable; database
+and external API instrumentation add to it. The context (and so the same instance)
+is shared with threads that sync endpoints and blocking client calls run in.
+"""
+from contextvars import ContextVar
+from typing import Optional
+
+class RequestStats:
+    """Database and external API usage of a single request."""
+
+    __slots__ = ("queries", "db_duration", "external_calls", "external_duration")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_duration = 0.0
+        self.external_calls = 0
+        self.external_duration = 0.0
+
+# Set by the request middleware; None outside of requests
+request_stats_var: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+def record_external_call(duration: float) -> None:
+    """
+    Add an external API call to the current request's stats.
+
+    Args:
+        duration: Call duration in seconds
+    """
+    stats = request_stats_var.get()
+    if stats is not None:
+        stats.external_calls += 1
+        stats.external_duration += duration
@@ -0,0 +1,187 @@
+"""
+Cache of rendered responses.
+
+Large, rarely changing payloads (country and package details) are rendered to
+JSON once and kept per worker for RESPONSE_CACHE_TTL_SECONDS. Compressed variants
+are made on first request for each encoding, at a higher level than on-the-fly
+compression, and stored with the entry, so compression is paid once per cache
+fill rather than per request; the compression middleware passes them through.
+
+Entries list the tables they were built from. Flushing changes to any of those
+tables in this worker drops the entries; other workers pick up changes when
+their entries expire.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.compression import compress, negotiate_encoding
+from app.core.config import settings
+from app.core.metrics import track_cache_hit, track_cache_miss
+from app.core.serialization import dump_json
+from app.utils.cache import check_if_modified
+
+class CachedResponse:
+    """
+    Rendered JSON body with its ETag and compressed variants.
+    """
+    __slots__ = ("body", "etag", "expires_at", "tables", "_encoded")
+
+    def __init__(self, body: bytes, expires_at: float, tables: FrozenSet[str]):
+        self.body = body
+        self.etag = hashlib.md5(body).hexdigest()
+        self.expires_at = expires_at
+        self.tables = tables
+        self._encoded: Dict[str, bytes] = {}
+
+    def encoded(self, encoding: str) -> bytes:
+        """
+        Get the body compressed with an encoding, compressing it on first use.
+        """
+        body = self._encoded.get(encoding)
+        if body is None:
+            # Two requests may compress concurrently; either result is kept
+            body = self._encoded.setdefault(encoding, compress(self.body, encoding))
+        return body
+
+    def to_response(self, request: Request) -> Response:
+        """
+        Build the response for a request, honoring If-None-Match and Accept-Encoding.
+        """
+        headers = {"ETag": f'"{self.etag}"', "Vary": "Accept-Encoding"}
+        if not check_if_modified(request, self.etag):
+            return Response(status_code=304, headers=headers)
+        if len(self.body) >= settings.COMPRESSION_MIN_SIZE:
+            encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+            if encoding is not None:
+                headers["Content-Encoding"] = encoding
+                return Response(self.encoded(encoding), media_type="application/json", headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
+
+class ResponseCache:
+    """
+    Bounded TTL cache of rendered responses by key.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a response is cached
+            max_entries: Maximum number of cached responses; the least recently
+                used are evicted first
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # Incremented on every invalidation
+        self._generation = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: str, builder: Callable[[], Any],
+                     tables: Iterable[str]) -> Optional[CachedResponse]:
+        """
+        Get a cached response, rendering it on a miss.
+
+        Args:
+            key: Cache key
+            builder: Function returning the data to render, or None if there is none
+            tables: Tables the data is read from
+
+        Returns:
+            The cached response, or None if the builder returned None
+        """
+        entry, generation = self._lookup(key)
+        if entry is not None:
+            return entry
+        data = builder()
+        if data is None:
+            return None
+        return self._store(key, data, tables, generation)
+
+    async def get_or_build_async(self, key: str, builder: Callable[[], Awaitable[Any]],
+                                 tables: Iterable[str],
+                                 cacheable: Optional[Callable[[Any], bool]] = None) -> Optional[CachedResponse]:
+        """
+        Get a cached response, rendering it with an async builder on a miss.
+
+        Args:
+            key: Cache key
+            builder: Coroutine function returning the data to render, or None if there is none
+            tables: Tables the data is read from
+            cacheable: Function telling whether built data may be cached (e.g. not
+                when parts of it are fallbacks); all data is cached if None
+
+        Returns:
+            The response, or None if the builder returned None
+        """
+        entry, generation = self._lookup(key)
+        if entry is not None:
+            return entry
+        data = await builder()
+        if data is None:
+            return None
+        return self._store(key, data, tables, generation, store=cacheable is None or cacheable(data))
+
+    def _lookup(self, key: str) -> Tuple[Optional[CachedResponse], int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                track_cache_hit("response")
+                return entry, self._generation
+            generation = self._generation
+        track_cache_miss("response")
+        return None, generation
+
+    def _store(self, key: str, data: Any, tables: Iterable[str], generation: int,
+               store: bool = True) -> CachedResponse:
+        entry = CachedResponse(dump_json(data), time.monotonic() + self.ttl, frozenset(tables))
+        with self._lock:
+            # Don't cache data that may have been read before an invalidation
+            if store and generation == self._generation:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def invalidate_tables(self, tables: Iterable[str]) -> None:
+        """
+        Drop the cached responses built from any of the given tables.
+        """
+        tables = set(tables)
+        with self._lock:
+            self._generation += 1
+            for key in [key for key, entry in self._entries.items() if entry.tables & tables]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Drop all cached responses.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+response_cache = ResponseCache(
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+)
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_tables(session: Session, flush_context: Any) -> None:
+    tables = {
+        instance.__table__.name
+        for instance in (*session.new, *session.dirty, *session.deleted)
+        if hasattr(instance, "__table__")
+    }
+    if tables:
+        response_cache.invalidate_tables(tables)
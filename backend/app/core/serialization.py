@@ -0,0 +1,185 @@
+"""
+Fast JSON rendering for read endpoints.
+
+Endpoints returning ORM objects with a `response_model` have every object
+validated into the schema with `from_attributes` and then dumped again, and
+endpoints returning dicts have them walked by `jsonable_encoder`. For data that
+comes straight from the database neither step adds anything, so hot read
+endpoints instead build plain dicts from the ORM objects following the response
+schema and encode them with orjson, returning the bytes in a response FastAPI
+passes through as is. The `response_model` stays on the route for the OpenAPI
+schema.
+
+Schemas rendered this way must not rely on validators to transform values. With
+FAST_SERIALIZATION disabled, responses are validated through the schema instead,
+except for sparse fieldsets (`fields=`), which can't be validated against the full
+schema and are always rendered directly.
+"""
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, FrozenSet, Iterable, List, Optional, Tuple, Type, Union, get_args, get_origin
+from uuid import UUID
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dump_json(data: Any) -> bytes:
+    """
+    Encode data as JSON, using orjson when it is installed.
+
+    Decimals are encoded as floats and datetimes in ISO 8601, as in Pydantic's
+    JSON output.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_default, separators=(",", ":")).encode()
+
+class PrerenderedJSONResponse(Response):
+    """
+    JSON response whose content is already encoded, or is encoded with dump_json.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dump_json(content)
+
+# Field kinds of a compiled serializer
+_SCALAR, _OBJECT, _LIST = 0, 1, 2
+
+def _nested_schema(annotation: Any) -> Tuple[int, Optional[Type[BaseModel]]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _OBJECT, annotation
+    origin = get_origin(annotation)
+    if origin is list:
+        kind, schema = _nested_schema(get_args(annotation)[0])
+        if kind == _OBJECT:
+            return _LIST, schema
+    elif origin is Union:
+        for arg in get_args(annotation):
+            kind, schema = _nested_schema(arg)
+            if schema is not None:
+                return kind, schema
+    return _SCALAR, None
+
+@lru_cache(maxsize=256)
+def _compile(schema: Type[BaseModel], only: Optional[FrozenSet[str]] = None) -> Callable[[Any], dict]:
+    """
+    Build a function turning an ORM object into a dict with the schema's fields
+    (or only the given top-level fields).
+    """
+    fields = []
+    for name, field in schema.model_fields.items():
+        if only is not None and name not in only:
+            continue
+        kind, nested = _nested_schema(field.annotation)
+        fields.append((name, kind, nested))
+
+    def serialize(obj: Any) -> dict:
+        data = {}
+        for name, kind, nested in fields:
+            value = getattr(obj, name, None)
+            if kind == _SCALAR or value is None:
+                data[name] = value
+            elif kind == _OBJECT:
+                data[name] = _compile(nested)(value)
+            else:
+                serialize_item = _compile(nested)
+                data[name] = [serialize_item(item) for item in value]
+        return data
+
+    return serialize
+
+def serialize_orm(obj: Any, schema: Type[BaseModel]) -> dict:
+    """
+    Convert an ORM object into a JSON-ready dict following a response schema.
+
+    Args:
+        obj: ORM object (or any object with the schema's fields as attributes)
+        schema: Pydantic response schema
+
+    Returns:
+        Dictionary with the schema's fields, without validation
+    """
+    return _compile(schema)(obj)
+
+@lru_cache(maxsize=256)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[FrozenSet[str]]:
+    """
+    Parse a `fields=` query parameter listing the fields to return.
+
+    Args:
+        fields: Comma-separated field names, or None for all fields
+        allowed: Names of the fields that can be requested
+
+    Returns:
+        The requested fields, or None for all fields
+
+    Raises:
+        HTTPException: 400 if unknown fields are requested
+    """
+    if not fields:
+        return None
+    requested = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    return requested or None
+
+def render_orm(data: Union[Any, List[Any]], schema: Type[BaseModel],
+               fields: Optional[FrozenSet[str]] = None) -> PrerenderedJSONResponse:
+    """
+    Render ORM objects as a JSON response following a response schema.
+
+    Args:
+        data: ORM object or list of ORM objects
+        schema: Pydantic response schema
+        fields: Top-level fields to include (all of the schema's fields if None)
+
+    Returns:
+        Response with the encoded JSON
+    """
+    is_list = isinstance(data, list)
+    if not settings.FAST_SERIALIZATION and fields is None:
+        if is_list:
+            adapter = _list_adapter(schema)
+            content = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+        else:
+            content = schema.model_validate(data, from_attributes=True).model_dump_json().encode()
+        return PrerenderedJSONResponse(content)
+
+    serialize = _compile(schema, fields)
+    content = [serialize(obj) for obj in data] if is_list else serialize(data)
+    return PrerenderedJSONResponse(dump_json(content))
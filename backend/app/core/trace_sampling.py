@@ -0,0 +1,111 @@
+"""
+Tail-based trace sampling.
+
+Spans are buffered per trace until the trace's local root span ends; the whole
+trace is then either forwarded to the exporting span processor or dropped. Traces
+that contain an error or whose root span is slow are always kept; the remaining
+(fast, successful) traces are kept at a fixed rate.
+"""
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.trace import StatusCode
+
+from app.core.metrics import TRACE_SAMPLING_DECISIONS
+
+# Number of recent decisions remembered for spans that end after their trace's root
+_DECISIONS_KEPT = 10000
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """
+    Span processor that decides whether to export a trace once it has completed.
+    """
+
+    def __init__(self, exporter_processor: SpanProcessor, sample_rate: float = 0.1,
+                 slow_threshold_ms: float = 500, max_traces: int = 5000,
+                 max_spans_per_trace: int = 1000):
+        """
+        Initialize the processor.
+
+        Args:
+            exporter_processor: Processor that exports kept spans (e.g. a BatchSpanProcessor)
+            sample_rate: Fraction of fast, successful traces that are kept
+            slow_threshold_ms: Traces whose root span takes at least this long are kept
+            max_traces: Maximum number of incomplete traces buffered; the oldest are
+                dropped when exceeded
+            max_spans_per_trace: Spans beyond this number are dropped from a trace
+        """
+        self.exporter_processor = exporter_processor
+        self.sample_rate = sample_rate
+        self.slow_threshold_ns = slow_threshold_ms * 1_000_000
+        self.max_traces = max_traces
+        self.max_spans_per_trace = max_spans_per_trace
+        self._traces: "OrderedDict[int, List[ReadableSpan]]" = OrderedDict()
+        self._errored: set = set()
+        self._decisions: "OrderedDict[int, bool]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        self.exporter_processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id
+        is_local_root = span.parent is None or span.parent.is_remote
+
+        with self._lock:
+            # Late spans of traces that have already been decided
+            decision = self._decisions.get(trace_id)
+            if decision is not None:
+                spans = [span] if decision else []
+            else:
+                self._buffer(trace_id, span)
+                if not is_local_root:
+                    return
+                decision = self._decide(trace_id, span)
+                self._remember(trace_id, decision)
+                buffered = self._traces.pop(trace_id, [])
+                self._errored.discard(trace_id)
+                spans = buffered if decision else []
+
+        for kept_span in spans:
+            self.exporter_processor.on_end(kept_span)
+
+    def _buffer(self, trace_id: int, span: ReadableSpan) -> None:
+        spans = self._traces.get(trace_id)
+        if spans is None:
+            spans = self._traces[trace_id] = []
+            while len(self._traces) > self.max_traces:
+                evicted_trace_id, _ = self._traces.popitem(last=False)
+                self._errored.discard(evicted_trace_id)
+                TRACE_SAMPLING_DECISIONS.labels(decision="evicted").inc()
+        if len(spans) < self.max_spans_per_trace:
+            spans.append(span)
+        if span.status.status_code == StatusCode.ERROR:
+            self._errored.add(trace_id)
+
+    def _decide(self, trace_id: int, root_span: ReadableSpan) -> bool:
+        if trace_id in self._errored:
+            decision = "kept_error"
+        elif root_span.end_time - root_span.start_time >= self.slow_threshold_ns:
+            decision = "kept_slow"
+        elif (trace_id & 0xFFFFFFFFFFFFFFFF) < self.sample_rate * 2 ** 64:
+            # Use the trace ID so every service sampling the trace agrees
+            decision = "kept_sampled"
+        else:
+            decision = "dropped"
+        TRACE_SAMPLING_DECISIONS.labels(decision=decision).inc()
+        return decision != "dropped"
+
+    def _remember(self, trace_id: int, decision: bool) -> None:
+        self._decisions[trace_id] = decision
+        while len(self._decisions) > _DECISIONS_KEPT:
+            self._decisions.popitem(last=False)
+
+    def shutdown(self) -> None:
+        self.exporter_processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.exporter_processor.force_flush(timeout_millis)
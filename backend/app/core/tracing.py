@@ -1,17 +1,16 @@
+import asyncio
+import functools
 import logging
 import importlib.util
-from typing import Optional
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional
 
-# Core OpenTelemetry imports
-from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from app.core.config import settings
 
-# Optional instrumentation imports - will be imported dynamically if available
-from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+# OpenTelemetry is only imported when tracing is set up or its helpers are used,
+# which keeps it off the startup path when tracing is disabled
+if TYPE_CHECKING:
+    from opentelemetry import trace
 
 # Check if optional dependencies are available
 def is_module_available(module_name):
@@ -19,6 +18,12 @@ def is_module_available(module_name):
 
 logger = logging.getLogger(__name__)
 
+# Spans are only created once setup_tracing has run, so the decorators cost a
+# single flag check when tracing is disabled
+_tracing_enabled = False
+
+tracer: Optional["trace.Tracer"] = None
+
 def setup_tracing(app, service_name: str = "allbounds-backend", endpoint: Optional[str] = None) -> None:
     """
     Set up OpenTelemetry tracing for the application.
@@ -28,7 +33,17 @@ def setup_tracing(app, service_name: str = "allbounds-backend", endpoint: Option
         service_name: Name of the service
         endpoint: OTLP endpoint for exporting traces
     """
+    global _tracing_enabled, tracer
+    
     try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+        
+        from app.core.trace_sampling import TailSamplingSpanProcessor
+        
         # Create a resource with service information
         resource = Resource.create({"service.name": service_name})
         
@@ -37,17 +52,37 @@ def setup_tracing(app, service_name: str = "allbounds-backend", endpoint: Option
         
         # If an endpoint is provided, set up the OTLP exporter
         if endpoint:
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+            
             # Create an OTLP exporter
-            otlp_exporter = OTLPSpanExporter(endpoint=endpoint)
+            otlp_exporter = OTLPSpanExporter(endpoint=endpoint, timeout=settings.OTLP_EXPORT_TIMEOUT_SECONDS)
             
-            # Add the exporter to the tracer provider
-            tracer_provider.add_span_processor(BatchSpanProcessor(otlp_exporter))
+            # Spans are queued and exported in batches from a background thread; when
+            # the queue is full new spans are dropped rather than blocking requests
+            batch_processor = BatchSpanProcessor(
+                otlp_exporter,
+                max_queue_size=settings.OTLP_MAX_QUEUE_SIZE,
+                schedule_delay_millis=settings.OTLP_SCHEDULE_DELAY_MS,
+                max_export_batch_size=settings.OTLP_MAX_EXPORT_BATCH_SIZE,
+                export_timeout_millis=settings.OTLP_EXPORT_TIMEOUT_SECONDS * 1000,
+            )
+            
+            # Keep slow and errored traces, sample the rest
+            tracer_provider.add_span_processor(TailSamplingSpanProcessor(
+                batch_processor,
+                sample_rate=settings.TRACE_SAMPLE_RATE,
+                slow_threshold_ms=settings.TRACE_SLOW_THRESHOLD_MS,
+                max_traces=settings.TRACE_TAIL_MAX_TRACES,
+                max_spans_per_trace=settings.TRACE_MAX_SPANS_PER_TRACE,
+            ))
             logger.info(f"OpenTelemetry tracing configured with OTLP exporter to {endpoint}")
         else:
             logger.info("OpenTelemetry tracing configured without exporter")
         
         # Set the tracer provider
         trace.set_tracer_provider(tracer_provider)
+        tracer = trace.get_tracer("allbounds")
+        _tracing_enabled = True
         
         # Instrument FastAPI
         FastAPIInstrumentor.instrument_app(app, tracer_provider=tracer_provider)
@@ -85,7 +120,74 @@ def setup_tracing(app, service_name: str = "allbounds-backend", endpoint: Option
     except Exception as e:
         logger.error(f"Failed to set up OpenTelemetry tracing: {e}")
 
-def get_tracer(name: str) -> trace.Tracer:
+def is_tracing_enabled() -> bool:
+    """
+    Check if tracing has been set up.
+    """
+    return _tracing_enabled
+
+@contextmanager
+def start_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Optional["trace.Span"]]:
+    """
+    Run a block of code in a span, if tracing is enabled.
+    
+    Exceptions are recorded on the span and mark it as failed.
+    
+    Args:
+        name: Name of the span
+        attributes: Span attributes
+        
+    Yields:
+        The span, or None if tracing is disabled
+    """
+    if not _tracing_enabled:
+        yield None
+        return
+    
+    with tracer.start_as_current_span(name, attributes=attributes, record_exception=False,
+                                      set_status_on_exception=False) as span:
+        try:
+            yield span
+        except Exception as e:
+            from opentelemetry.trace import Status, StatusCode
+            
+            span.record_exception(e)
+            span.set_status(Status(StatusCode.ERROR, f"{type(e).__name__}: {e}"))
+            raise
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorator that runs a function or coroutine function in a span.
+    
+    Args:
+        name: Name of the span (defaults to the function's qualified name)
+        
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        attributes = {"code.namespace": func.__module__, "code.function": func.__name__}
+        
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _tracing_enabled:
+                    return await func(*args, **kwargs)
+                with start_span(span_name, attributes):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracing_enabled:
+                return func(*args, **kwargs)
+            with start_span(span_name, attributes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def get_tracer(name: str) -> "trace.Tracer":
     """
     Get a tracer for the given name.
     
@@ -95,9 +197,11 @@ def get_tracer(name: str) -> trace.Tracer:
     Returns:
         Tracer instance
     """
+    from opentelemetry import trace
+    
     return trace.get_tracer(name)
 
-def extract_context_from_headers(headers: dict) -> trace.SpanContext:
+def extract_context_from_headers(headers: dict) -> "trace.SpanContext":
     """
     Extract trace context from HTTP headers.
     
@@ -107,6 +211,8 @@ def extract_context_from_headers(headers: dict) -> trace.SpanContext:
     Returns:
         Span context
     """
+    from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+    
     return TraceContextTextMapPropagator().extract(headers)
 
 def inject_context_into_headers(headers: dict) -> None:
@@ -116,4 +222,6 @@ def inject_context_into_headers(headers: dict) -> None:
     Args:
         headers: HTTP headers to inject context into
     """
+    from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+    
     TraceContextTextMapPropagator().inject(headers)
@@ -3,10 +3,14 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.db.query_stats import setup_query_instrumentation
 
 # Create SQLAlchemy engine
 engine = create_engine(settings.DATABASE_URL)
 
+# Record query latency and per-request query counts
+setup_query_instrumentation()
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
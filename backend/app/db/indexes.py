@@ -0,0 +1,30 @@
+"""
+Index helpers for the models.
+
+List and filter queries only ever read active rows (`is_active == True`), so
+their indexes are declared as partial indexes over those rows. The predicate is
+written per dialect: SQLite only uses a partial index when the query repeats its
+WHERE terms, and SQLAlchemy renders `== True` as `= 1` there.
+"""
+from typing import Sequence
+
+from sqlalchemy import Index, text
+
+def active_index(name: str, *columns: str, flags: Sequence[str] = ("is_active",)) -> Index:
+    """
+    Create an index over the rows where all of `flags` are true.
+
+    Args:
+        name: Index name, also used by the migration creating it
+        columns: Indexed column names
+        flags: Boolean columns the indexed rows are filtered on
+
+    Returns:
+        Partial index, to be added to the model's __table_args__
+    """
+    return Index(
+        name,
+        *columns,
+        postgresql_where=text(" AND ".join(f"{flag} = true" for flag in flags)),
+        sqlite_where=text(" AND ".join(f"{flag} = 1" for flag in flags)),
+    )
@@ -0,0 +1,98 @@
+"""
+Eager loading options derived from response schemas.
+
+Response models are serialized with `from_attributes`, so every relationship a
+schema includes is read from the ORM object, and any that wasn't eager-loaded
+fires a lazy query per object. `loader_options` walks a schema's fields and
+returns the loader options for exactly the relationships it serializes, so list
+endpoints run a fixed number of queries however many rows they return.
+
+For sparse fieldsets (`fields=` on list endpoints) only the requested columns are
+loaded with `load_only`, and only the requested relationships are eager-loaded.
+"""
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Optional, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, load_only, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+def _nested_schema(annotation: Any) -> Optional[Type[BaseModel]]:
+    """
+    Get the schema of a field annotated as a schema, Optional[schema] or List[schema].
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    if get_origin(annotation) in (list, Union):
+        for arg in get_args(annotation):
+            schema = _nested_schema(arg)
+            if schema is not None:
+                return schema
+    return None
+
+def _build_options(model: Any, schema: Type[BaseModel],
+                   seen: FrozenSet[Tuple[Any, Type[BaseModel]]],
+                   fields: Optional[FrozenSet[str]] = None) -> List[LoaderOption]:
+    mapper = inspect(model)
+    relationships = mapper.relationships
+    options = []
+    if fields is not None:
+        columns = _projected_columns(mapper, fields)
+        if columns is not None:
+            options.append(load_only(*columns))
+    for name, field in schema.model_fields.items():
+        if fields is not None and name not in fields:
+            continue
+        relationship = relationships.get(name)
+        if relationship is None:
+            continue
+        attribute = getattr(model, name)
+        # Collections are loaded with one extra IN query so LIMIT applies to the
+        # parent rows; many-to-one relationships are joined into the parent query
+        option = selectinload(attribute) if relationship.uselist else joinedload(attribute)
+        nested = _nested_schema(field.annotation)
+        target = relationship.mapper.class_
+        if nested is not None and (target, nested) not in seen:
+            child_options = _build_options(target, nested, seen | {(target, nested)})
+            if child_options:
+                option = option.options(*child_options)
+        options.append(option)
+    return options
+
+def _projected_columns(mapper: Any, fields: FrozenSet[str]) -> Optional[List[Any]]:
+    """
+    Get the column attributes to load for a sparse fieldset.
+
+    Returns:
+        The columns, or None if a field isn't a column or relationship (e.g. a
+        Python property, which may read any column) and all columns must be loaded
+    """
+    columns = {}
+    for name in fields:
+        if name in mapper.columns:
+            columns[name] = getattr(mapper.class_, name)
+        elif name in mapper.relationships:
+            # Many-to-one relationships are loaded through their foreign keys
+            for column in mapper.relationships[name].local_columns:
+                key = mapper.get_property_by_column(column).key
+                columns[key] = getattr(mapper.class_, key)
+        else:
+            return None
+    return list(columns.values())
+
+@lru_cache(maxsize=256)
+def loader_options(model: Any, schema: Type[BaseModel],
+                   fields: Optional[FrozenSet[str]] = None) -> Tuple[LoaderOption, ...]:
+    """
+    Get the eager loading options needed to serialize a model with a schema.
+
+    Args:
+        model: SQLAlchemy model class
+        schema: Pydantic response schema
+        fields: Top-level fields to load (all of the schema's fields if None)
+
+    Returns:
+        Loader options to pass to `Query.options()`
+    """
+    return tuple(_build_options(model, schema, frozenset({(model, schema)}), fields))
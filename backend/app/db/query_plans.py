@@ -0,0 +1,172 @@
+"""
+Query plan checks for the hot read paths.
+
+Each hot path runs a service call while its SQL is captured, then every captured
+SELECT is explained on the same connection. A path fails when its plan reads one
+of the path's tables with a full table scan, which means a filter or sort column
+lost (or never had) its index.
+
+- SQLite: `EXPLAIN QUERY PLAN`; a `SCAN <table>` step without an index fails.
+- PostgreSQL: `EXPLAIN` with `enable_seqscan` off, so small seeded tables don't
+  make a sequential scan the cheapest plan; a `Seq Scan on <table>` node fails.
+
+Full scans of an index pass: ordered listings read their partial index that way.
+
+Used by scripts/check_query_plans.py and the test suite.
+"""
+import re
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.services.accommodation import accommodation_service
+from app.services.attraction import attraction_service
+from app.services.blog import blog_service
+from app.services.group_trip import group_trip_service
+from app.services.hotel import hotel_service
+from app.services.media import media_service
+from app.services.package import package_service
+from app.services.package_price_chart import package_price_chart_service
+from app.services.stats import COUNTED_ENTITIES, COUNTRY_ENTITIES, entity_counters
+
+# Plans only depend on the shape of the query, so any ID will do
+_ID = 1
+
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)$")
+_POSTGRES_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+class HotPath:
+    """
+    A service call that must not scan its tables.
+    """
+
+    def __init__(self, name: str, run: Callable[[Session], Any], tables: FrozenSet[str]):
+        """
+        Args:
+            name: Name reported for the path
+            run: Function making the service call with the given session
+            tables: Tables that must be read through an index
+        """
+        self.name = name
+        self.run = run
+        self.tables = tables
+
+HOT_PATHS: List[HotPath] = [
+    HotPath("packages_newest", lambda db: package_service.get_packages(db, limit=20),
+            frozenset({"packages"})),
+    HotPath("packages_by_country", lambda db: package_service.get_packages_by_country(db, _ID),
+            frozenset({"packages"})),
+    HotPath("featured_packages", lambda db: package_service.get_featured_packages(db),
+            frozenset({"packages"})),
+    HotPath("package_price_charts", lambda db: package_price_chart_service.get_active_price_charts_by_package(db, _ID),
+            frozenset({"package_price_charts"})),
+    HotPath("package_price_for_date", lambda db: package_price_chart_service.get_price_for_date(db, _ID, datetime(2026, 1, 1)),
+            frozenset({"package_price_charts"})),
+    HotPath("group_trips_by_country", lambda db: group_trip_service.get_group_trips_by_country(db, _ID),
+            frozenset({"group_trips"})),
+    HotPath("featured_group_trips", lambda db: group_trip_service.get_featured_group_trips(db),
+            frozenset({"group_trips"})),
+    HotPath("group_trip_departures", lambda db: group_trip_service.get_departures(db, _ID),
+            frozenset({"group_trip_departures"})),
+    HotPath("hotels_by_country", lambda db: hotel_service.get_hotels_by_country(db, _ID),
+            frozenset({"hotels"})),
+    HotPath("attractions_by_country", lambda db: attraction_service.get_attractions_by_country(db, _ID),
+            frozenset({"attractions"})),
+    HotPath("accommodations_by_country", lambda db: accommodation_service.get_accommodations_by_country(db, _ID),
+            frozenset({"accommodations"})),
+    HotPath("package_media", lambda db: media_service.get_media_assets_by_entity(db, "package", _ID),
+            frozenset({"package_media", "media_assets"})),
+    HotPath("hotel_media", lambda db: media_service.get_media_assets_by_entity(db, "hotel", _ID),
+            frozenset({"hotel_media", "media_assets"})),
+    HotPath("blog_posts", lambda db: blog_service.get_blog_posts(db, limit=10),
+            frozenset({"blog_posts"})),
+    # Per-country counts; the totals of the other entity types are full counts anyway
+    HotPath("entity_counts", lambda db: entity_counters.reconcile(db),
+            frozenset(COUNTED_ENTITIES[name].__tablename__ for name in COUNTRY_ENTITIES)),
+]
+
+@contextmanager
+def capture_statements(db: Session) -> Iterator[List[Tuple[str, Any]]]:
+    """
+    Capture the SELECT statements executed through a session's engine.
+
+    Yields:
+        List the (statement, parameters) tuples are appended to
+    """
+    engine = db.get_bind()
+    statements: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+def explain(connection: Connection, statement: str, parameters: Any) -> List[str]:
+    """
+    Get the plan of a statement as text lines.
+
+    Args:
+        connection: Connection to explain the statement on
+        statement: SQL statement, as sent to the driver
+        parameters: Statement parameters, as sent to the driver
+
+    Returns:
+        One line per plan step (SQLite) or node (PostgreSQL)
+    """
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        return [row[-1] for row in rows]
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    try:
+        rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).all()
+    finally:
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = on")
+    return [row[0] for row in rows]
+
+def scanned_tables(dialect: str, plan: List[str]) -> List[str]:
+    """
+    Get the tables a plan reads with a full table scan.
+
+    Args:
+        dialect: Dialect name of the plan
+        plan: Plan lines from explain()
+
+    Returns:
+        Names of the scanned tables
+    """
+    pattern = _SQLITE_SCAN if dialect == "sqlite" else _POSTGRES_SCAN
+    return [match.group(1) for match in (pattern.search(line.strip()) for line in plan) if match]
+
+def check_query_plans(db: Session, paths: List[HotPath] = HOT_PATHS) -> Dict[str, List[str]]:
+    """
+    Explain the queries of the hot paths and report full scans of their tables.
+
+    Args:
+        db: Database session on the database to check
+        paths: Hot paths to check
+
+    Returns:
+        Failure descriptions by path name, for the paths that scan their tables
+    """
+    failures: Dict[str, List[str]] = {}
+    for path in paths:
+        with capture_statements(db) as statements:
+            path.run(db)
+        connection = db.connection()
+        for statement, parameters in statements:
+            plan = explain(connection, statement, parameters)
+            for table in scanned_tables(connection.dialect.name, plan):
+                if table in path.tables:
+                    failures.setdefault(path.name, []).append(
+                        f"full scan of {table} in: {' '.join(statement.split())}\n  " + "\n  ".join(plan)
+                    )
+    return failures
@@ -0,0 +1,78 @@
+"""
+Automatic database query instrumentation.
+
+SQLAlchemy cursor events record every statement's latency in DB_QUERY_LATENCY by
+statement type and table, and add to the current request's query count and
+database time (see app.core.request_stats) so the request middleware can flag
+likely N+1 queries.
+"""
+import re
+import time
+from functools import lru_cache
+from typing import Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.metrics import DB_QUERY_LATENCY
+from app.core.request_stats import request_stats_var
+
+# Tables are taken from the first FROM/INTO/UPDATE target of the statement
+_TABLE_PATTERNS = {
+    "select": re.compile(r"\bFROM\s+[\"`]?(\w+)", re.IGNORECASE),
+    "insert": re.compile(r"\bINTO\s+[\"`]?(\w+)", re.IGNORECASE),
+    "update": re.compile(r"^\s*UPDATE\s+[\"`]?(\w+)", re.IGNORECASE),
+    "delete": re.compile(r"\bFROM\s+[\"`]?(\w+)", re.IGNORECASE),
+}
+
+@lru_cache(maxsize=1024)
+def classify_statement(statement: str) -> Tuple[str, str]:
+    """
+    Get the statement type and main table of a SQL statement.
+
+    Args:
+        statement: SQL statement
+
+    Returns:
+        (operation, table) tuple, e.g. ("select", "packages"); unknown parts are "other"
+    """
+    words = statement.lstrip().split(None, 1)
+    operation = words[0].lower() if words else "other"
+    pattern = _TABLE_PATTERNS.get(operation)
+    if pattern is None:
+        return "other", "other"
+    match = pattern.search(statement)
+    return operation, match.group(1).lower() if match else "other"
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    duration = time.perf_counter() - start_times.pop()
+
+    operation, table = classify_statement(statement)
+    DB_QUERY_LATENCY.labels(operation=operation, table=table).observe(duration)
+
+    stats = request_stats_var.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_duration += duration
+
+def _handle_error(exception_context):
+    # Failed statements never reach after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_time"):
+        connection.info["query_start_time"].pop()
+
+def setup_query_instrumentation() -> None:
+    """
+    Register the query instrumentation for all engines.
+    """
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
@@ -1,5 +1,5 @@
 import logging
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_client import make_asgi_app
 
@@ -7,10 +7,17 @@ from prometheus_client import make_asgi_app
 from app.models.all_models import __all__ as all_models
 
 from app.api.api_v1.api import api_router
+from app.auth.password_hashing import password_hash_pool
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.core.logging import setup_logging, RequestLoggingMiddleware
-from app.core.metrics import PrometheusMiddleware
+from app.core.health import health_prober, install_drain_handler
+from app.core.logging import setup_logging
+from app.core.memory import setup_memory_metrics
+from app.core.middleware import RequestContextMiddleware
 from app.core.tracing import setup_tracing
+from app.media.r2 import r2_client
+from app.media.variants import shutdown_process_pool
+from app.services.cloudflare_images import cloudflare_images_service
 
 # Set up logging
 setup_logging(settings.LOG_LEVEL)
@@ -35,11 +42,14 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
-# Add request logging middleware
-app.add_middleware(RequestLoggingMiddleware)
+# Compress responses; added first so the request metrics record compressed sizes
+app.add_middleware(CompressionMiddleware)
 
-# Add Prometheus metrics middleware
-app.add_middleware(PrometheusMiddleware)
+# Add request ID, metrics and access logging middleware
+app.add_middleware(RequestContextMiddleware)
+
+# Export GC pause times and object counts next to the default process metrics
+setup_memory_metrics()
 
 # Create metrics endpoint
 metrics_app = make_asgi_app()
@@ -58,19 +68,34 @@ def health_check():
     """Health check endpoint for the API."""
     return {"status": "ok"}
 
-@app.middleware("http")
-async def add_correlation_id_header(request: Request, call_next):
-    """Add correlation ID header to response."""
-    response = await call_next(request)
-    response.headers["X-Correlation-ID"] = request.headers.get("X-Correlation-ID", "")
-    return response
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the worker's event loop is responding."""
+    return Response(content=b'{"status":"ok"}', media_type="application/json")
+
+@app.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness probe: the required dependencies passed their last background check
+    and the worker isn't draining. Returns 503 otherwise.
+    """
+    status_code, body = health_prober.ready_response()
+    return Response(content=body, status_code=status_code, media_type="application/json")
 
 @app.on_event("startup")
 async def startup_event():
     """Run startup tasks."""
+    await health_prober.start()
+    install_drain_handler()
     logger.info("Application startup complete")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run shutdown tasks."""
+    health_prober.start_draining()
+    await health_prober.stop()
+    await cloudflare_images_service.aclose()
+    shutdown_process_pool()
+    password_hash_pool.shutdown()
+    r2_client.shutdown()
     logger.info("Application shutdown complete")
@@ -1,17 +1,37 @@
-import boto3
+import asyncio
+import contextvars
 import logging
-from botocore.exceptions import ClientError
-from typing import Optional, Dict, Any, BinaryIO, List, Tuple
+import threading
+import time
+from botocore.exceptions import BotoCoreError, ClientError
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Optional, Dict, Any, BinaryIO, Callable, Iterator, List, Tuple, TypeVar
 from datetime import datetime, timedelta
 from urllib.parse import urljoin
 
 from app.core.config import settings
+from app.core.metrics import EXTERNAL_API_BYTES, observe_external_call
+from app.core.tracing import start_span
+
+T = TypeVar("T")
+
+MB = 1024 * 1024
 
 logger = logging.getLogger(__name__)
 
 class CloudflareR2:
     """
     Cloudflare R2 storage client for handling media assets.
+    
+    The S3 client is configured with a sized connection pool, explicit timeouts and
+    adaptive retries; large uploads are split into parts that are sent concurrently.
+    The `*_async` methods run the blocking boto3 calls on a dedicated thread pool so
+    bulk media operations don't starve the event loop's default executor.
+    
+    boto3 is only imported and the S3 client only built on first use, which keeps
+    both off the application's startup path.
     """
     
     def __init__(self):
@@ -23,16 +43,112 @@ class CloudflareR2:
         self.secret_key = settings.R2_SECRET_KEY
         self.bucket_name = settings.R2_BUCKET_NAME
         
-        # Initialize the S3 client (R2 uses S3-compatible API)
-        self.client = None
-        if self.endpoint and self.access_key and self.secret_key:
-            self.client = boto3.client(
-                's3',
-                endpoint_url=self.endpoint,
-                aws_access_key_id=self.access_key,
-                aws_secret_access_key=self.secret_key,
-                region_name='auto'  # Cloudflare R2 uses 'auto' as region
+        self._client = None
+        self._transfer_config = None
+        self._client_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    @property
+    def client(self):
+        """
+        S3 client (R2 uses S3-compatible API), created on first use.
+        
+        Returns:
+            The boto3 S3 client, or None if R2 is not configured
+        """
+        if self._client is None and self.is_configured():
+            with self._client_lock:
+                if self._client is None:
+                    import boto3
+                    from botocore.config import Config
+                    
+                    client_config = Config(
+                        max_pool_connections=settings.R2_MAX_POOL_CONNECTIONS,
+                        connect_timeout=settings.R2_CONNECT_TIMEOUT,
+                        read_timeout=settings.R2_READ_TIMEOUT,
+                        retries={
+                            'max_attempts': settings.R2_MAX_ATTEMPTS,
+                            'mode': 'adaptive'
+                        }
+                    )
+                    self._client = boto3.client(
+                        's3',
+                        endpoint_url=self.endpoint,
+                        aws_access_key_id=self.access_key,
+                        aws_secret_access_key=self.secret_key,
+                        region_name='auto',  # Cloudflare R2 uses 'auto' as region
+                        config=client_config
+                    )
+        return self._client
+    
+    @property
+    def transfer_config(self):
+        """
+        Multipart transfer settings for uploads.
+        """
+        if self._transfer_config is None:
+            from boto3.s3.transfer import TransferConfig
+            
+            self._transfer_config = TransferConfig(
+                multipart_threshold=settings.R2_MULTIPART_THRESHOLD_MB * MB,
+                multipart_chunksize=settings.R2_MULTIPART_CHUNKSIZE_MB * MB,
+                max_concurrency=settings.R2_MAX_CONCURRENCY,
+                use_threads=True
+            )
+        return self._transfer_config
+    
+    @contextmanager
+    def _track(self, operation: str) -> Iterator[None]:
+        """
+        Record the latency of an R2 operation and trace it.
+        """
+        start_time = time.perf_counter()
+        try:
+            with start_span(f"r2.{operation}", {"r2.bucket": self.bucket_name or ""}):
+                yield
+        finally:
+            observe_external_call("r2", operation, time.perf_counter() - start_time)
+    
+    def _count_bytes(self, operation: str, direction: str, num_bytes: int) -> None:
+        EXTERNAL_API_BYTES.labels(service="r2", operation=operation, direction=direction).inc(num_bytes)
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Dedicated thread pool for running blocking R2 calls from async code.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.R2_EXECUTOR_WORKERS,
+                thread_name_prefix="r2"
             )
+        return self._executor
+    
+    async def run_async(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a blocking client method on the dedicated R2 thread pool.
+        
+        Args:
+            func: Method to run
+            *args: Arguments to pass to the method
+            **kwargs: Keyword arguments to pass to the method
+            
+        Returns:
+            The method's return value
+        """
+        loop = asyncio.get_running_loop()
+        # Run in a copy of the caller's context so trace spans and request-scoped
+        # state carry over to the worker thread
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self.executor, partial(context.run, func, *args, **kwargs))
+    
+    def shutdown(self) -> None:
+        """
+        Shut down the dedicated thread pool.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     def is_configured(self) -> bool:
         """
@@ -41,7 +157,26 @@ class CloudflareR2:
         Returns:
             bool: True if R2 is configured, False otherwise
         """
-        return self.client is not None
+        return bool(self.endpoint and self.access_key and self.secret_key)
+    
+    def health_check(self) -> bool:
+        """
+        Check if the R2 bucket is reachable.
+        
+        Returns:
+            bool: True if the bucket is reachable, False otherwise
+        """
+        if not self.is_configured():
+            logger.error("R2 is not configured")
+            return False
+        
+        try:
+            with self._track("head_bucket"):
+                self.client.head_bucket(Bucket=self.bucket_name)
+            return True
+        except (BotoCoreError, ClientError) as e:
+            logger.error(f"Error checking R2 health: {e}")
+            return False
     
     def upload_file(self, file_obj: BinaryIO, object_name: str, content_type: str) -> bool:
         """
@@ -59,18 +194,23 @@ class CloudflareR2:
             logger.error("R2 is not configured")
             return False
         
+        from boto3.exceptions import S3UploadFailedError
+        
         try:
-            self.client.upload_fileobj(
-                file_obj,
-                self.bucket_name,
-                object_name,
-                ExtraArgs={
-                    'ContentType': content_type,
-                    'CacheControl': 'max-age=31536000'  # Cache for 1 year
-                }
-            )
+            with self._track("upload"):
+                self.client.upload_fileobj(
+                    file_obj,
+                    self.bucket_name,
+                    object_name,
+                    ExtraArgs={
+                        'ContentType': content_type,
+                        'CacheControl': 'max-age=31536000'  # Cache for 1 year
+                    },
+                    Config=self.transfer_config,
+                    Callback=partial(self._count_bytes, "upload", "upload")
+                )
             return True
-        except ClientError as e:
+        except (BotoCoreError, ClientError, S3UploadFailedError) as e:
             logger.error(f"Error uploading file to R2: {e}")
             return False
     
@@ -89,12 +229,13 @@ class CloudflareR2:
             return False
         
         try:
-            self.client.delete_object(
-                Bucket=self.bucket_name,
-                Key=object_name
-            )
+            with self._track("delete"):
+                self.client.delete_object(
+                    Bucket=self.bucket_name,
+                    Key=object_name
+                )
             return True
-        except ClientError as e:
+        except (BotoCoreError, ClientError) as e:
             logger.error(f"Error deleting file from R2: {e}")
             return False
     
@@ -123,10 +264,126 @@ class CloudflareR2:
                 ExpiresIn=expiration
             )
             return url
-        except ClientError as e:
+        except (BotoCoreError, ClientError) as e:
             logger.error(f"Error generating presigned URL: {e}")
             return None
     
+    def generate_presigned_upload_url(self, object_name: str, content_type: str,
+                                      expiration: int = 3600) -> Optional[str]:
+        """
+        Generate a presigned PUT URL for uploading a file directly from the browser.
+        
+        R2 does not support S3 POST policies, so direct uploads use a signed PUT
+        whose Content-Type must match the one the URL was signed with.
+        
+        Args:
+            object_name: Name of the object in R2
+            content_type: MIME type the client will upload
+            expiration: Time in seconds for the URL to remain valid
+            
+        Returns:
+            str: Presigned PUT URL or None if an error occurred
+        """
+        if not self.is_configured():
+            logger.error("R2 is not configured")
+            return None
+        
+        try:
+            return self.client.generate_presigned_url(
+                'put_object',
+                Params={
+                    'Bucket': self.bucket_name,
+                    'Key': object_name,
+                    'ContentType': content_type,
+                    'CacheControl': 'max-age=31536000'
+                },
+                ExpiresIn=expiration
+            )
+        except (BotoCoreError, ClientError) as e:
+            logger.error(f"Error generating presigned upload URL: {e}")
+            return None
+    
+    def get_file_info(self, object_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get metadata for a file without downloading it.
+        
+        Args:
+            object_name: Name of the object in R2
+            
+        Returns:
+            dict: File size, content type and ETag, or None if the file doesn't exist
+        """
+        if not self.is_configured():
+            logger.error("R2 is not configured")
+            return None
+        
+        try:
+            with self._track("head"):
+                response = self.client.head_object(Bucket=self.bucket_name, Key=object_name)
+            return {
+                'key': object_name,
+                'size': response['ContentLength'],
+                'content_type': response.get('ContentType'),
+                'etag': response.get('ETag', '').strip('"')
+            }
+        except (BotoCoreError, ClientError) as e:
+            logger.error(f"Error getting file info from R2: {e}")
+            return None
+    
+    def read_file(self, object_name: str) -> Optional[bytes]:
+        """
+        Download a file into memory.
+        
+        Args:
+            object_name: Name of the object in R2
+            
+        Returns:
+            bytes: File contents or None if an error occurred
+        """
+        if not self.is_configured():
+            logger.error("R2 is not configured")
+            return None
+        
+        try:
+            with self._track("download"):
+                response = self.client.get_object(Bucket=self.bucket_name, Key=object_name)
+                data = response['Body'].read()
+            self._count_bytes("download", "download", len(data))
+            return data
+        except (BotoCoreError, ClientError) as e:
+            logger.error(f"Error reading file from R2: {e}")
+            return None
+    
+    def read_file_range(self, object_name: str, start: int, end: int) -> Optional[bytes]:
+        """
+        Read a byte range of a file, e.g. to inspect image headers.
+        
+        Args:
+            object_name: Name of the object in R2
+            start: First byte offset (inclusive)
+            end: Last byte offset (inclusive)
+            
+        Returns:
+            bytes: The requested range or None if an error occurred
+        """
+        if not self.is_configured():
+            logger.error("R2 is not configured")
+            return None
+        
+        try:
+            with self._track("download_range"):
+                response = self.client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=object_name,
+                    Range=f"bytes={start}-{end}"
+                )
+                data = response['Body'].read()
+            self._count_bytes("download_range", "download", len(data))
+            return data
+        except (BotoCoreError, ClientError) as e:
+            logger.error(f"Error reading file range from R2: {e}")
+            return None
+    
     def generate_presigned_post(self, object_name: str, expiration: int = 3600, 
                                conditions: Optional[List] = None, 
                                fields: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
@@ -161,7 +418,7 @@ class CloudflareR2:
                 ExpiresIn=expiration
             )
             return response
-        except ClientError as e:
+        except (BotoCoreError, ClientError) as e:
             logger.error(f"Error generating presigned POST: {e}")
             return None
     
@@ -181,11 +438,12 @@ class CloudflareR2:
             return []
         
         try:
-            response = self.client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                MaxKeys=max_keys
-            )
+            with self._track("list"):
+                response = self.client.list_objects_v2(
+                    Bucket=self.bucket_name,
+                    Prefix=prefix,
+                    MaxKeys=max_keys
+                )
             
             if 'Contents' not in response:
                 return []
@@ -199,9 +457,45 @@ class CloudflareR2:
                 }
                 for obj in response['Contents']
             ]
-        except ClientError as e:
+        except (BotoCoreError, ClientError) as e:
             logger.error(f"Error listing files in R2: {e}")
             return []
+    
+    async def upload_file_async(self, file_obj: BinaryIO, object_name: str, content_type: str) -> bool:
+        """
+        Upload a file to Cloudflare R2 without blocking the event loop.
+        """
+        return await self.run_async(self.upload_file, file_obj, object_name, content_type)
+    
+    async def delete_file_async(self, object_name: str) -> bool:
+        """
+        Delete a file from Cloudflare R2 without blocking the event loop.
+        """
+        return await self.run_async(self.delete_file, object_name)
+    
+    async def get_file_info_async(self, object_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get metadata for a file without blocking the event loop.
+        """
+        return await self.run_async(self.get_file_info, object_name)
+    
+    async def read_file_async(self, object_name: str) -> Optional[bytes]:
+        """
+        Download a file into memory without blocking the event loop.
+        """
+        return await self.run_async(self.read_file, object_name)
+    
+    async def read_file_range_async(self, object_name: str, start: int, end: int) -> Optional[bytes]:
+        """
+        Read a byte range of a file without blocking the event loop.
+        """
+        return await self.run_async(self.read_file_range, object_name, start, end)
+    
+    async def list_files_async(self, prefix: str = "", max_keys: int = 1000) -> List[Dict[str, Any]]:
+        """
+        List files with a given prefix without blocking the event loop.
+        """
+        return await self.run_async(self.list_files, prefix, max_keys)
 
 # Create a singleton instance
 r2_client = CloudflareR2()
@@ -0,0 +1,178 @@
+"""
+Local image variant generation.
+
+Resized WebP/AVIF variants are rendered in a process pool (image encoding is CPU
+bound and would otherwise hold the GIL of the API worker) and stored in R2. Pillow
+is an optional dependency; without it variant generation is skipped.
+"""
+import asyncio
+import io
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - depends on the environment
+    Image = None
+    ImageOps = None
+
+VARIANT_CONTENT_TYPES = {
+    "webp": "image/webp",
+    "avif": "image/avif",
+    "jpeg": "image/jpeg",
+}
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def is_available() -> bool:
+    """
+    Check if Pillow is installed so variants can be generated.
+    """
+    return Image is not None
+
+
+def get_variant_widths() -> List[int]:
+    """
+    Get the configured variant widths in ascending order.
+    """
+    return sorted({int(width) for width in settings.MEDIA_VARIANT_WIDTHS.split(",") if width.strip()})
+
+
+def get_variant_formats() -> List[str]:
+    """
+    Get the configured variant formats that the installed Pillow can encode.
+    """
+    if not is_available():
+        return []
+    Image.init()
+    formats = []
+    for fmt in settings.MEDIA_VARIANT_FORMATS.split(","):
+        fmt = fmt.strip().lower()
+        if fmt and fmt.upper() in Image.SAVE and fmt in VARIANT_CONTENT_TYPES:
+            formats.append(fmt)
+    return formats
+
+
+def render_variants(data: bytes, widths: List[int], formats: List[str],
+                    quality: int) -> List[Dict[str, Any]]:
+    """
+    Render resized variants of an image.
+
+    Runs in a worker process, so it only takes and returns picklable values.
+
+    Args:
+        data: Original image bytes
+        widths: Target widths; widths not smaller than the original are skipped
+        formats: Output formats (e.g. "webp", "avif")
+        quality: Encoder quality
+
+    Returns:
+        List of variant dictionaries with width, height, format and encoded bytes
+    """
+    with Image.open(io.BytesIO(data)) as original:
+        # Let the JPEG decoder downscale while decoding for the largest variant
+        if widths:
+            original.draft("RGB", (max(widths), max(widths)))
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+        variants = []
+        for width in widths:
+            if width >= image.width:
+                continue
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                buffer = io.BytesIO()
+                resized.save(buffer, fmt.upper(), quality=quality)
+                variants.append({
+                    "width": width,
+                    "height": height,
+                    "format": fmt,
+                    "data": buffer.getvalue(),
+                })
+        return variants
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared process pool used for variant rendering.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=max(1, settings.MEDIA_VARIANT_WORKERS))
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """
+    Shut down the variant rendering process pool if it was started.
+    """
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+async def render_variants_async(data: bytes) -> List[Dict[str, Any]]:
+    """
+    Render the configured variants of an image in the process pool.
+
+    Args:
+        data: Original image bytes
+
+    Returns:
+        List of rendered variants (empty if Pillow isn't installed)
+    """
+    formats = get_variant_formats()
+    if not formats:
+        return []
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_process_pool(),
+        render_variants,
+        data,
+        get_variant_widths(),
+        formats,
+        settings.MEDIA_VARIANT_QUALITY,
+    )
+
+
+def variant_key(media_id: int, width: int, fmt: str) -> str:
+    """
+    Get the R2 storage key for a variant.
+    """
+    return f"variants/{media_id}/{width}w.{fmt}"
+
+
+def build_srcset(manifest: Optional[Dict[str, Any]], base_url: str) -> Dict[str, str]:
+    """
+    Build `srcset` attribute values per format from a variant manifest.
+
+    Args:
+        manifest: Variant manifest stored on the media asset
+        base_url: Public base URL the variant keys are served from
+
+    Returns:
+        Dictionary mapping format to srcset string, e.g. {"webp": "https://... 320w, ..."}
+    """
+    if not manifest or not base_url:
+        return {}
+
+    srcset: Dict[str, List[Tuple[int, str]]] = {}
+    for variant in manifest.get("variants", []):
+        url = f"{base_url.rstrip('/')}/{variant['key']}"
+        srcset.setdefault(variant["format"], []).append((variant["width"], url))
+
+    return {
+        fmt: ", ".join(f"{url} {width}w" for width, url in sorted(entries))
+        for fmt, entries in srcset.items()
+    }
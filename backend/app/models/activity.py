@@ -9,7 +9,7 @@ country_activities = Table(
     "country_activities",
     Base.metadata,
     Column("country_id", Integer, ForeignKey("countries.id"), primary_key=True),
-    Column("activity_id", Integer, ForeignKey("activities.id"), primary_key=True),
+    Column("activity_id", Integer, ForeignKey("activities.id"), primary_key=True, index=True),
 )
 
 # Association table for Activity and MediaAsset (Gallery)
@@ -17,7 +17,7 @@ activity_media = Table(
     "activity_media",
     Base.metadata,
     Column("activity_id", Integer, ForeignKey("activities.id"), primary_key=True),
-    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True),
+    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True, index=True),
 )
 
 
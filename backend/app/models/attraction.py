@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Float, Table
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Float, Table, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -9,18 +9,21 @@ package_attractions = Table(
     "package_attractions",
     Base.metadata,
     Column("package_id", Integer, ForeignKey("packages.id"), primary_key=True),
-    Column("attraction_id", Integer, ForeignKey("attractions.id"), primary_key=True)
+    Column("attraction_id", Integer, ForeignKey("attractions.id"), primary_key=True, index=True)
 )
 
 group_trip_attractions = Table(
     "group_trip_attractions",
     Base.metadata,
     Column("group_trip_id", Integer, ForeignKey("group_trips.id"), primary_key=True),
-    Column("attraction_id", Integer, ForeignKey("attractions.id"), primary_key=True)
+    Column("attraction_id", Integer, ForeignKey("attractions.id"), primary_key=True, index=True)
 )
 
 class Attraction(Base):
     __tablename__ = "attractions"
+    __table_args__ = (
+        Index("ix_attractions_country_id_is_active", "country_id", "is_active"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
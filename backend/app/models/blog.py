@@ -3,17 +3,21 @@ from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
+from app.db.indexes import active_index
 
 # Many-to-Many relationship table between BlogPost and Tag
 blog_post_tags = Table(
     "blog_post_tags",
     Base.metadata,
     Column("blog_post_id", Integer, ForeignKey("blog_posts.id"), primary_key=True),
-    Column("tag_id", Integer, ForeignKey("tags.id"), primary_key=True)
+    Column("tag_id", Integer, ForeignKey("tags.id"), primary_key=True, index=True)
 )
 
 class BlogPost(Base):
     __tablename__ = "blog_posts"
+    __table_args__ = (
+        active_index("ix_blog_posts_published_created_at", "created_at", flags=("is_active", "is_published")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
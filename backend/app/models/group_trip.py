@@ -1,19 +1,24 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Float, Table
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Float, Table, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
+from app.db.indexes import active_index
 
 # Many-to-Many relationship table between GroupTrip and HolidayType
 group_trip_holiday_types = Table(
     "group_trip_holiday_types",
     Base.metadata,
     Column("group_trip_id", Integer, ForeignKey("group_trips.id"), primary_key=True),
-    Column("holiday_type_id", Integer, ForeignKey("holiday_types.id"), primary_key=True)
+    Column("holiday_type_id", Integer, ForeignKey("holiday_types.id"), primary_key=True, index=True)
 )
 
 class GroupTrip(Base):
     __tablename__ = "group_trips"
+    __table_args__ = (
+        Index("ix_group_trips_country_id_is_active", "country_id", "is_active"),
+        active_index("ix_group_trips_active_is_featured", "is_featured"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
@@ -57,6 +62,9 @@ class GroupTrip(Base):
 
 class GroupTripDeparture(Base):
     __tablename__ = "group_trip_departures"
+    __table_args__ = (
+        Index("ix_group_trip_departures_group_trip_id_start_date", "group_trip_id", "start_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     group_trip_id = Column(Integer, ForeignKey("group_trips.id"), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Float, JSON, Table
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Float, JSON, Table, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -9,25 +9,28 @@ hotel_media = Table(
     "hotel_media",
     Base.metadata,
     Column("hotel_id", Integer, ForeignKey("hotels.id"), primary_key=True),
-    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True)
+    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True, index=True)
 )
 
 package_hotels = Table(
     "package_hotels",
     Base.metadata,
     Column("package_id", Integer, ForeignKey("packages.id"), primary_key=True),
-    Column("hotel_id", Integer, ForeignKey("hotels.id"), primary_key=True)
+    Column("hotel_id", Integer, ForeignKey("hotels.id"), primary_key=True, index=True)
 )
 
 group_trip_hotels = Table(
     "group_trip_hotels",
     Base.metadata,
     Column("group_trip_id", Integer, ForeignKey("group_trips.id"), primary_key=True),
-    Column("hotel_id", Integer, ForeignKey("hotels.id"), primary_key=True)
+    Column("hotel_id", Integer, ForeignKey("hotels.id"), primary_key=True, index=True)
 )
 
 class Hotel(Base):
     __tablename__ = "hotels"
+    __table_args__ = (
+        Index("ix_hotels_country_id_is_active", "country_id", "is_active"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
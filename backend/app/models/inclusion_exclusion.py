@@ -9,28 +9,28 @@ package_inclusions = Table(
     "package_inclusions",
     Base.metadata,
     Column("package_id", Integer, ForeignKey("packages.id"), primary_key=True),
-    Column("inclusion_id", Integer, ForeignKey("inclusions.id"), primary_key=True)
+    Column("inclusion_id", Integer, ForeignKey("inclusions.id"), primary_key=True, index=True)
 )
 
 package_exclusions = Table(
     "package_exclusions",
     Base.metadata,
     Column("package_id", Integer, ForeignKey("packages.id"), primary_key=True),
-    Column("exclusion_id", Integer, ForeignKey("exclusions.id"), primary_key=True)
+    Column("exclusion_id", Integer, ForeignKey("exclusions.id"), primary_key=True, index=True)
 )
 
 group_trip_inclusions = Table(
     "group_trip_inclusions",
     Base.metadata,
     Column("group_trip_id", Integer, ForeignKey("group_trips.id"), primary_key=True),
-    Column("inclusion_id", Integer, ForeignKey("inclusions.id"), primary_key=True)
+    Column("inclusion_id", Integer, ForeignKey("inclusions.id"), primary_key=True, index=True)
 )
 
 group_trip_exclusions = Table(
     "group_trip_exclusions",
     Base.metadata,
     Column("group_trip_id", Integer, ForeignKey("group_trips.id"), primary_key=True),
-    Column("exclusion_id", Integer, ForeignKey("exclusions.id"), primary_key=True)
+    Column("exclusion_id", Integer, ForeignKey("exclusions.id"), primary_key=True, index=True)
 )
 
 class Inclusion(Base):
@@ -10,21 +10,21 @@ itinerary_hotels = Table(
     'itinerary_hotels',
     Base.metadata,
     Column('itinerary_item_id', Integer, ForeignKey('itinerary_items.id'), primary_key=True),
-    Column('hotel_id', Integer, ForeignKey('hotels.id'), primary_key=True)
+    Column('hotel_id', Integer, ForeignKey('hotels.id'), primary_key=True, index=True)
 )
 
 itinerary_attractions = Table(
     'itinerary_attractions', 
     Base.metadata,
     Column('itinerary_item_id', Integer, ForeignKey('itinerary_items.id'), primary_key=True),
-    Column('attraction_id', Integer, ForeignKey('attractions.id'), primary_key=True)
+    Column('attraction_id', Integer, ForeignKey('attractions.id'), primary_key=True, index=True)
 )
 
 itinerary_item_activities = Table(
     'itinerary_item_activities',
     Base.metadata,
     Column('itinerary_item_id', Integer, ForeignKey('itinerary_items.id'), primary_key=True),
-    Column('activity_id', Integer, ForeignKey('activities.id'), primary_key=True)
+    Column('activity_id', Integer, ForeignKey('activities.id'), primary_key=True, index=True)
 )
 
 
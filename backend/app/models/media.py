@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Table, JSON, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -9,14 +9,14 @@ attraction_media = Table(
     "attraction_media",
     Base.metadata,
     Column("attraction_id", Integer, ForeignKey("attractions.id"), primary_key=True),
-    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True)
+    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True, index=True)
 )
 
 accommodation_media = Table(
     "accommodation_media",
     Base.metadata,
     Column("accommodation_id", Integer, ForeignKey("accommodations.id"), primary_key=True),
-    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True)
+    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True, index=True)
 )
 
 # hotel_media table is defined in hotel.py to avoid circular imports
@@ -25,25 +25,28 @@ package_media = Table(
     "package_media",
     Base.metadata,
     Column("package_id", Integer, ForeignKey("packages.id"), primary_key=True),
-    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True)
+    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True, index=True)
 )
 
 group_trip_media = Table(
     "group_trip_media",
     Base.metadata,
     Column("group_trip_id", Integer, ForeignKey("group_trips.id"), primary_key=True),
-    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True)
+    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True, index=True)
 )
 
 blog_post_media = Table(
     "blog_post_media",
     Base.metadata,
     Column("blog_post_id", Integer, ForeignKey("blog_posts.id"), primary_key=True),
-    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True)
+    Column("media_asset_id", Integer, ForeignKey("media_assets.id"), primary_key=True, index=True)
 )
 
 class MediaAsset(Base):
     __tablename__ = "media_assets"
+    __table_args__ = (
+        Index("ix_media_assets_entity_type_entity_id", "entity_type", "entity_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String(255), nullable=False)
@@ -54,6 +57,8 @@ class MediaAsset(Base):
     content_type = Column(String(100), nullable=True)  # MIME type
     width = Column(Integer, nullable=True)  # For images
     height = Column(Integer, nullable=True)  # For images
+    variant_manifest = Column(JSON, nullable=True)  # Locally generated resized variants stored in R2
+    processing_attempts = Column(Integer, nullable=False, default=0, server_default="0")  # Image processing runs started
     alt_text = Column(String(255), nullable=True)
     title = Column(String(255), nullable=True)
     caption = Column(Text, nullable=True)
@@ -1,18 +1,24 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Float, Table
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Float, Table, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
+from app.db.indexes import active_index
 
 # PackageHolidayType model for the association between Package and HolidayType
 class PackageHolidayType(Base):
     __tablename__ = "package_holiday_types"
     
     package_id = Column(Integer, ForeignKey("packages.id"), primary_key=True)
-    holiday_type_id = Column(Integer, ForeignKey("holiday_types.id"), primary_key=True)
+    holiday_type_id = Column(Integer, ForeignKey("holiday_types.id"), primary_key=True, index=True)
 
 class Package(Base):
     __tablename__ = "packages"
+    __table_args__ = (
+        Index("ix_packages_country_id_is_active", "country_id", "is_active"),
+        active_index("ix_packages_active_is_featured", "is_featured"),
+        active_index("ix_packages_active_created_at", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
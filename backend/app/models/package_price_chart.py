@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Boolean, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -6,6 +6,9 @@ from app.db.database import Base
 
 class PackagePriceChart(Base):
     __tablename__ = "package_price_charts"
+    __table_args__ = (
+        Index("ix_package_price_charts_package_id_dates", "package_id", "start_date", "end_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     package_id = Column(Integer, ForeignKey("packages.id"), nullable=False)
@@ -9,7 +9,7 @@ user_roles = Table(
     "user_roles",
     Base.metadata,
     Column("user_id", Integer, ForeignKey("users.id"), primary_key=True),
-    Column("role_id", Integer, ForeignKey("roles.id"), primary_key=True)
+    Column("role_id", Integer, ForeignKey("roles.id"), primary_key=True, index=True)
 )
 
 # Many-to-Many relationship table between Role and Permission
@@ -17,7 +17,7 @@ role_permissions = Table(
     "role_permissions",
     Base.metadata,
     Column("role_id", Integer, ForeignKey("roles.id"), primary_key=True),
-    Column("permission_id", Integer, ForeignKey("permissions.id"), primary_key=True)
+    Column("permission_id", Integer, ForeignKey("permissions.id"), primary_key=True, index=True)
 )
 
 class User(Base):
@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+# Schema for the IDs and slugs of one entity type to fetch
+class BatchKeys(BaseModel):
+    ids: List[int] = Field(default_factory=list, description="Entity IDs", example=[1, 2, 3])
+    slugs: List[str] = Field(default_factory=list, description="Entity slugs", example=["maasai-mara"])
+
+# Schema for fetching entities of several types in one request
+class BatchGetRequest(BaseModel):
+    packages: Optional[BatchKeys] = None
+    group_trips: Optional[BatchKeys] = None
+    hotels: Optional[BatchKeys] = None
+    attractions: Optional[BatchKeys] = None
+    accommodations: Optional[BatchKeys] = None
+    countries: Optional[BatchKeys] = None
+
+# Schema for the entities found, by type, formatted as by the single-item endpoints
+class BatchGetResponse(BaseModel):
+    packages: Optional[List[Dict[str, Any]]] = None
+    group_trips: Optional[List[Dict[str, Any]]] = None
+    hotels: Optional[List[Dict[str, Any]]] = None
+    attractions: Optional[List[Dict[str, Any]]] = None
+    accommodations: Optional[List[Dict[str, Any]]] = None
+    countries: Optional[List[Dict[str, Any]]] = None
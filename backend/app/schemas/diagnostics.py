@@ -0,0 +1,66 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+# Schema for a per-request profiling token
+class ProfileTokenResponse(BaseModel):
+    token: str = Field(..., description="Value for the X-Profile-Token request header")
+    expires_at: datetime = Field(..., description="When the token expires")
+    worker_pid: int = Field(..., description="Process ID of the worker that issued the token")
+
+# Schema for the stored request profiles of a worker
+class RequestProfileList(BaseModel):
+    worker_pid: int = Field(..., description="Process ID of the worker")
+    profiles: Dict[str, int] = Field(..., description="Request IDs with stored profiles and their sizes in bytes")
+
+
+# Schema for a request that exceeded its latency budget
+class SlowRequestCapture(BaseModel):
+    request_id: str
+    timestamp: datetime
+    method: str
+    path: str
+    route: str = Field(..., description="Route template")
+    status_code: int
+    duration_ms: float
+    budget_ms: float
+    db_queries: int
+    db_duration_ms: float
+    external_calls: int
+    external_duration_ms: float
+    stack_samples: str = Field(..., description="Collapsed stacks sampled while the request was over budget")
+
+# Schema for the slow request captures of a worker
+class SlowRequestList(BaseModel):
+    worker_pid: int = Field(..., description="Process ID of the worker")
+    requests: List[SlowRequestCapture]
+
+# Schema for the memory usage of a worker
+class MemorySummary(BaseModel):
+    worker_pid: int = Field(..., description="Process ID of the worker")
+    rss_bytes: Optional[int] = Field(None, description="Resident set size")
+    peak_rss_bytes: int = Field(..., description="Peak resident set size")
+    gc_counts: List[int] = Field(..., description="Allocations since the last collection, per generation")
+    gc_thresholds: List[int]
+    gc_stats: List[Dict[str, Any]] = Field(..., description="Collections, collected and uncollectable objects per generation")
+    gc_uncollectable: int = Field(..., description="Objects in gc.garbage")
+    tracemalloc_enabled: bool
+    traced_bytes: Optional[int] = None
+    traced_peak_bytes: Optional[int] = None
+    tracemalloc_overhead_bytes: Optional[int] = None
+
+# Schema for an allocation site reported by tracemalloc
+class AllocationSite(BaseModel):
+    traceback: List[str] = Field(..., description="Allocating frames as file:line, innermost first")
+    size_bytes: int
+    count: int
+    size_diff_bytes: Optional[int] = Field(None, description="Change since the baseline snapshot")
+    count_diff: Optional[int] = Field(None, description="Change since the baseline snapshot")
+
+# Schema for the top allocation sites of a worker
+class AllocationReport(BaseModel):
+    worker_pid: int = Field(..., description="Process ID of the worker")
+    group_by: str
+    diff: bool = Field(..., description="Whether sizes are compared against the baseline snapshot")
+    baseline_taken_at: Optional[datetime] = None
+    allocations: List[AllocationSite]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 from datetime import datetime
 
 # Base Media Asset Schema
@@ -50,3 +50,28 @@ class PresignedUploadResponse(BaseModel):
     url: str = Field(..., description="URL to upload to")
     fields: Dict[str, Any] = Field(..., description="Fields to include in the form")
     storage_key: str = Field(..., description="Storage key in R2")
+
+# Schema for requesting a direct (browser-to-storage) upload ticket
+class MediaDirectUploadRequest(BaseModel):
+    filename: str = Field(..., description="Original filename of the media asset")
+    content_type: str = Field(..., description="MIME type of the media asset")
+    provider: Literal["cloudflare", "r2"] = Field("cloudflare", description="Storage the browser uploads to")
+    entity_type: Optional[str] = Field(None, description="Type of entity this media belongs to")
+    entity_id: Optional[int] = Field(None, description="ID of the entity this media belongs to")
+    alt_text: Optional[str] = Field(None, description="Alternative text for the image")
+    title: Optional[str] = Field(None, description="Title for the media asset")
+    caption: Optional[str] = Field(None, description="Caption for the media asset")
+
+# Schema for a direct upload ticket
+class MediaDirectUploadResponse(BaseModel):
+    provider: str = Field(..., description="Storage the browser uploads to")
+    upload_url: str = Field(..., description="URL the browser uploads the file to")
+    method: str = Field(..., description="HTTP method to use (POST multipart form for Cloudflare, PUT for R2)")
+    headers: Dict[str, str] = Field(default_factory=dict, description="Headers the upload request must send")
+    storage_key: str = Field(..., description="Storage key the file will be stored under")
+    ticket: str = Field(..., description="Signed ticket to pass to the confirm endpoint")
+    expires_at: datetime = Field(..., description="When the upload URL and ticket expire")
+
+# Schema for confirming a direct upload
+class MediaDirectUploadConfirm(BaseModel):
+    ticket: str = Field(..., description="Ticket returned when the upload was requested")
@@ -1,8 +1,9 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
+from app.core.cloudflare_config import cloudflare_settings
 from app.models.attraction import Attraction
-from app.schemas.attraction import AttractionCreate, AttractionUpdate
+from app.schemas.attraction import AttractionCreate, AttractionUpdate, GalleryImageResponse
 from app.utils.slug import create_slug
 
 class AttractionService:
@@ -33,6 +34,39 @@ class AttractionService:
         """
         return db.query(Attraction).filter(Attraction.slug == slug, Attraction.is_active == True).first()
     
+    def set_gallery_images(self, attractions: List[Attraction]) -> None:
+        """
+        Set `gallery_images` on attractions from their active media assets.
+
+        URLs for all the attractions' images are generated in one batch. Load
+        `Attraction.media_assets` eagerly when passing several attractions.
+        """
+        from app.services.media import media_service
+
+        galleries = [
+            (attraction, [media_asset for media_asset in attraction.media_assets if media_asset.is_active])
+            for attraction in attractions
+        ]
+        image_urls = media_service.get_media_urls(
+            [media_asset for _, media_assets in galleries for media_asset in media_assets]
+        )
+        for attraction, media_assets in galleries:
+            gallery_images = []
+            for media_asset in media_assets:
+                # Generate proper image URL
+                image_url = image_urls.get(media_asset.id)
+                if not image_url and media_asset.file_path.startswith("cloudflare://"):
+                    image_url = f"{cloudflare_settings.delivery_url}/{media_asset.storage_key}/medium"
+                elif not image_url:
+                    image_url = media_asset.file_path
+                gallery_images.append(GalleryImageResponse(
+                    id=media_asset.id,
+                    file_path=image_url,
+                    alt_text=media_asset.alt_text,
+                    caption=media_asset.caption,
+                ))
+            attraction.gallery_images = gallery_images
+    
     def create_attraction(self, db: Session, attraction_create: AttractionCreate) -> Attraction:
         """
         Create a new attraction.
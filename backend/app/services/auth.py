@@ -2,9 +2,11 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.models.user import User
 from app.schemas.user import UserCreate
+from app.auth.password_hashing import password_hash_pool
 from app.auth.security import verify_password, get_password_hash, create_access_token, create_refresh_token
 
 class AuthService:
@@ -24,6 +26,34 @@ class AuthService:
         if not user or not verify_password(password, user.hashed_password):
             return None
         return user
+
+    async def authenticate_user_async(self, db: Session, email: str, password: str) -> Optional[User]:
+        """
+        Authenticate a user, verifying the password on the password hashing pool.
+
+        If the stored hash uses outdated settings it is replaced on the user; the
+        new hash is saved with the next commit (e.g. update_last_login).
+
+        Args:
+            db: Database session
+            email: User email
+            password: User password
+
+        Returns:
+            The authenticated user or None if authentication fails
+
+        Raises:
+            PasswordHashPoolFull: If too many password operations are pending
+        """
+        user = await run_in_threadpool(lambda: db.query(User).filter(User.email == email).first())
+        if not user:
+            return None
+        valid, new_hash = await password_hash_pool.verify(password, user.hashed_password)
+        if not valid:
+            return None
+        if new_hash:
+            user.hashed_password = new_hash
+        return user
     
     def create_user(self, db: Session, user_in: UserCreate) -> User:
         """
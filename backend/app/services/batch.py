@@ -0,0 +1,106 @@
+"""
+Batch reads of entities by ID or slug.
+
+Pages that show many entities (itineraries, attraction trips, homepage rails)
+would otherwise fetch them one request at a time. `batch_service.get_many`
+resolves any number of IDs and slugs of one type with a single IN query (plus
+the eager loads of its response schema) and returns the objects ready to be
+serialized with the same schema as the single-item endpoints.
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, selectinload
+
+from app.db.loading import loader_options
+from app.models.accommodation import Accommodation
+from app.models.attraction import Attraction
+from app.models.country import Country
+from app.models.group_trip import GroupTrip
+from app.models.hotel import Hotel
+from app.models.package import Package
+from app.schemas.accommodation import AccommodationWithCountryResponse
+from app.schemas.attraction import AttractionWithCountryResponse
+from app.schemas.country import CountryWithRegionResponse
+from app.schemas.group_trip import GroupTripWithCountryResponse
+from app.schemas.hotel import HotelWithCountryResponse
+from app.schemas.package import PackageWithCountryResponse
+from app.services.attraction import attraction_service
+
+class BatchType:
+    """
+    An entity type that can be read in batches.
+    """
+
+    def __init__(self, model: Any, schema: Type[BaseModel], extra_loads: Tuple[str, ...] = (),
+                 prepare: Optional[Callable[[List[Any]], None]] = None):
+        """
+        Args:
+            model: SQLAlchemy model class, with `id`, `slug` and `is_active` columns
+            schema: Response schema of the single-item endpoints
+            extra_loads: Relationships outside the schema that `prepare` reads
+            prepare: Function setting computed attributes on the loaded objects
+        """
+        self.model = model
+        self.schema = schema
+        self.extra_loads = extra_loads
+        self.prepare = prepare
+
+# Batchable types by the name used in batch requests
+BATCH_TYPES: Dict[str, BatchType] = {
+    "packages": BatchType(Package, PackageWithCountryResponse),
+    "group_trips": BatchType(GroupTrip, GroupTripWithCountryResponse),
+    "hotels": BatchType(Hotel, HotelWithCountryResponse),
+    "attractions": BatchType(
+        Attraction, AttractionWithCountryResponse,
+        extra_loads=("media_assets",),
+        prepare=attraction_service.set_gallery_images,
+    ),
+    "accommodations": BatchType(Accommodation, AccommodationWithCountryResponse),
+    "countries": BatchType(Country, CountryWithRegionResponse),
+}
+
+class BatchService:
+    def get_many(self, db: Session, entity_type: str, ids: Sequence[int] = (),
+                 slugs: Sequence[str] = ()) -> List[Any]:
+        """
+        Retrieve active entities of one type by ID and slug in a single query.
+
+        Args:
+            db: Database session
+            entity_type: Key of BATCH_TYPES
+            ids: Entity IDs
+            slugs: Entity slugs
+
+        Returns:
+            The entities found, in the order requested (IDs first, then slugs),
+            each once; IDs and slugs that don't match an active entity are skipped
+        """
+        batch_type = BATCH_TYPES[entity_type]
+        model = batch_type.model
+        if not ids and not slugs:
+            return []
+
+        conditions = []
+        if ids:
+            conditions.append(model.id.in_(set(ids)))
+        if slugs:
+            conditions.append(model.slug.in_(set(slugs)))
+        found = db.query(model).options(
+            *loader_options(model, batch_type.schema),
+            *(selectinload(getattr(model, name)) for name in batch_type.extra_loads),
+        ).filter(or_(*conditions), model.is_active == True).all()
+
+        by_id = {obj.id: obj for obj in found}
+        by_slug = {obj.slug: obj for obj in found}
+        ordered = {}
+        for obj in [by_id.get(id) for id in ids] + [by_slug.get(slug) for slug in slugs]:
+            if obj is not None:
+                ordered.setdefault(obj.id, obj)
+        results = list(ordered.values())
+        if batch_type.prepare is not None:
+            batch_type.prepare(results)
+        return results
+
+batch_service = BatchService()
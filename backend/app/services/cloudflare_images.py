@@ -1,20 +1,57 @@
 """
 Cloudflare Images service for interacting with the Cloudflare Images API.
 """
+import asyncio
+import base64
+import hashlib
+import hmac
 import json
 import logging
-import requests
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime, timedelta
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Union
+from datetime import datetime, timedelta, timezone
+
+import httpx
 
 from app.core.cloudflare_config import cloudflare_settings
+from app.core.metrics import observe_external_call
+from app.core.tracing import traced
+from app.utils.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# Status codes that are safe to retry
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Methods that may create a resource each time they are sent; a 5xx or a dropped
+# connection does not tell whether Cloudflare stored the upload, so these are only
+# retried when the request was rejected (429) or never reached the server
+NON_IDEMPOTENT_METHODS = {"POST"}
+
+# Path segments that are part of the API surface rather than resource IDs
+_ENDPOINT_KEYWORDS = {"images", "v1", "v2", "variants", "direct_upload", "stats", "blob"}
+
+
+def _endpoint_label(endpoint: str) -> str:
+    """
+    Collapse resource IDs in an endpoint path so metric labels stay bounded.
+    """
+    return "/".join(
+        segment if segment in _ENDPOINT_KEYWORDS else "{id}"
+        for segment in endpoint.split("/")
+    )
+
 
 class CloudflareImagesService:
     """
     Service for interacting with Cloudflare Images API.
+
+    Requests go through persistent, connection-pooled httpx clients with explicit
+    timeouts, a client-side token bucket and retries that honor ``Retry-After``.
+    The ``*_async`` methods should be used from async code; the plain methods are
+    a synchronous facade for sync endpoints and scripts.
     """
     
     def __init__(self):
@@ -25,13 +62,127 @@ class CloudflareImagesService:
         self.default_variants = cloudflare_settings.default_variants
         self.require_signed_urls = cloudflare_settings.require_signed_urls
         self.signing_key = cloudflare_settings.signing_key
+        self.max_retries = cloudflare_settings.max_retries
+        self.retry_backoff = cloudflare_settings.retry_backoff
+        self.max_retry_delay = cloudflare_settings.max_retry_delay
         
-        # Headers used for API requests
+        # Headers used for API requests (httpx sets Content-Type per request)
         self.headers = {
             "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json"
         }
-    
+
+        self.timeout = httpx.Timeout(
+            cloudflare_settings.request_timeout,
+            connect=cloudflare_settings.connect_timeout,
+        )
+        self.limits = httpx.Limits(
+            max_connections=cloudflare_settings.max_connections,
+            max_keepalive_connections=cloudflare_settings.max_keepalive_connections,
+        )
+        self.rate_limiter = TokenBucket(
+            rate=cloudflare_settings.rate_limit_per_second,
+            capacity=cloudflare_settings.rate_limit_burst,
+        )
+
+        # Clients are created lazily; the async client is bound to the event loop
+        # it was created on
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        Persistent synchronous HTTP client.
+        """
+        if self._client is None:
+            self._client = httpx.Client(
+                base_url=self._account_url(),
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=self.limits,
+            )
+        return self._client
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        """
+        Get the persistent asynchronous HTTP client for the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                base_url=self._account_url(),
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=self.limits,
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled HTTP clients.
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _account_url(self) -> str:
+        return f"{self.api_base_url}/accounts/{self.account_id}/"
+
+    def _request_kwargs(self, data: Optional[Dict] = None, files: Optional[Dict] = None,
+                        params: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Build keyword arguments for an httpx request.
+        """
+        return {
+            "json": data if data and not files else None,
+            "data": data if files and data else None,
+            "files": files,
+            "params": params,
+        }
+
+    def _retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        Work out how long to wait before retrying, honoring ``Retry-After`` if present.
+        """
+        delay = self.retry_backoff * (2 ** attempt)
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    pass
+        return max(0.0, min(delay, self.max_retry_delay))
+
+    def _should_retry(self, attempt: int, method: str, response: Optional[httpx.Response],
+                      error: Optional[httpx.TransportError] = None) -> bool:
+        if attempt >= self.max_retries:
+            return False
+        if method.upper() in NON_IDEMPOTENT_METHODS:
+            if response is None:
+                return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+            return response.status_code == 429
+        return response is None or response.status_code in RETRYABLE_STATUS_CODES
+
+    def _handle_response(self, response: httpx.Response) -> Dict:
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Error making request to Cloudflare Images API: {e}")
+            logger.error(f"Response: {e.response.text}")
+            raise
+        return response.json()
+
+    @traced("cloudflare_images.request")
     def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
                      files: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
         """
@@ -47,49 +198,78 @@ class CloudflareImagesService:
         Returns:
             API response as dictionary
         """
-        url = f"{self.api_base_url}/accounts/{self.account_id}/{endpoint}"
-        
-        headers = self.headers.copy()
-        
-        # If uploading files, don't set Content-Type header
-        if files:
-            headers.pop("Content-Type", None)
-        
-        try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=data if data and not files else None,
-                data=data if files and data else None,
-                files=files,
-                params=params
-            )
-            
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error making request to Cloudflare Images API: {e}")
-            if hasattr(e, 'response') and e.response:
-                logger.error(f"Response: {e.response.text}")
-            raise
-    
-    def upload_image(self, file_data: bytes, file_name: str, 
-                    require_signed_urls: bool = None, metadata: Optional[Dict] = None) -> Dict:
+        kwargs = self._request_kwargs(data, files, params)
+        label = _endpoint_label(endpoint)
+        attempt = 0
+
+        while True:
+            self.rate_limiter.acquire()
+            response = None
+            start_time = time.perf_counter()
+            try:
+                response = self.client.request(method, endpoint, **kwargs)
+            except httpx.TransportError as e:
+                logger.warning(f"Transport error calling Cloudflare Images API ({label}): {e}")
+                if not self._should_retry(attempt, method, None, e):
+                    raise
+            finally:
+                observe_external_call("cloudflare_images", label, time.perf_counter() - start_time)
+
+            if response is not None and not self._should_retry(attempt, method, response):
+                return self._handle_response(response)
+
+            delay = self._retry_delay(attempt, response)
+            logger.warning(f"Retrying Cloudflare Images API request ({label}) in {delay:.2f}s")
+            time.sleep(delay)
+            attempt += 1
+
+    @traced("cloudflare_images.request")
+    async def _make_request_async(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                                  files: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict:
         """
-        Upload an image to Cloudflare Images.
+        Make a request to the Cloudflare Images API without blocking the event loop.
         
         Args:
-            file_data: Image file data as bytes
-            file_name: Name of the file
-            require_signed_urls: Whether to require signed URLs for this image
-            metadata: Optional metadata to attach to the image
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint
+            data: Request data
+            files: Files to upload
+            params: Query parameters
             
         Returns:
-            Upload response with image details
+            API response as dictionary
+        """
+        client = self.get_async_client()
+        kwargs = self._request_kwargs(data, files, params)
+        label = _endpoint_label(endpoint)
+        attempt = 0
+
+        while True:
+            await self.rate_limiter.acquire_async()
+            response = None
+            start_time = time.perf_counter()
+            try:
+                response = await client.request(method, endpoint, **kwargs)
+            except httpx.TransportError as e:
+                logger.warning(f"Transport error calling Cloudflare Images API ({label}): {e}")
+                if not self._should_retry(attempt, method, None, e):
+                    raise
+            finally:
+                observe_external_call("cloudflare_images", label, time.perf_counter() - start_time)
+
+            if response is not None and not self._should_retry(attempt, method, response):
+                return self._handle_response(response)
+
+            delay = self._retry_delay(attempt, response)
+            logger.warning(f"Retrying Cloudflare Images API request ({label}) in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _upload_image_request(self, file_data: bytes, file_name: str, require_signed_urls: Optional[bool],
+                              metadata: Optional[Dict]) -> Tuple[Dict, Dict]:
+        """
+        Build the form data and files for an image upload.
         """
-        endpoint = "images/v1"
-        
         # Set default value for require_signed_urls if not provided
         if require_signed_urls is None:
             require_signed_urls = self.require_signed_urls
@@ -107,25 +287,47 @@ class CloudflareImagesService:
         files = {
             "file": (file_name, file_data)
         }
-        
-        return self._make_request("POST", endpoint, data=form_data, files=files)
+        return form_data, files
     
-    def get_direct_upload_url(self, require_signed_urls: bool = None, 
-                             metadata: Optional[Dict] = None, 
-                             expiry: Optional[datetime] = None) -> Dict:
+    def upload_image(self, file_data: bytes, file_name: str, 
+                    require_signed_urls: bool = None, metadata: Optional[Dict] = None) -> Dict:
         """
-        Get a one-time upload URL for direct creator uploads.
+        Upload an image to Cloudflare Images.
         
         Args:
+            file_data: Image file data as bytes
+            file_name: Name of the file
             require_signed_urls: Whether to require signed URLs for this image
             metadata: Optional metadata to attach to the image
-            expiry: Optional expiry time for the upload URL
             
         Returns:
-            Response with upload URL and image ID
+            Upload response with image details
         """
-        endpoint = "images/v2/direct_upload"
+        form_data, files = self._upload_image_request(file_data, file_name, require_signed_urls, metadata)
+        return self._make_request("POST", "images/v1", data=form_data, files=files)
+
+    async def upload_image_async(self, file_data: bytes, file_name: str,
+                                 require_signed_urls: bool = None, metadata: Optional[Dict] = None) -> Dict:
+        """
+        Upload an image to Cloudflare Images without blocking the event loop.
         
+        Args:
+            file_data: Image file data as bytes
+            file_name: Name of the file
+            require_signed_urls: Whether to require signed URLs for this image
+            metadata: Optional metadata to attach to the image
+            
+        Returns:
+            Upload response with image details
+        """
+        form_data, files = self._upload_image_request(file_data, file_name, require_signed_urls, metadata)
+        return await self._make_request_async("POST", "images/v1", data=form_data, files=files)
+
+    def _direct_upload_request(self, require_signed_urls: Optional[bool], metadata: Optional[Dict],
+                               expiry: Optional[datetime]) -> Dict:
+        """
+        Build the request body for a direct creator upload URL.
+        """
         # Set default value for require_signed_urls if not provided
         if require_signed_urls is None:
             require_signed_urls = self.require_signed_urls
@@ -153,7 +355,41 @@ class CloudflareImagesService:
                 
             data["expiry"] = expiry.strftime("%Y-%m-%dT%H:%M:%SZ")
         
-        return self._make_request("POST", endpoint, data=data)
+        return data
+    
+    def get_direct_upload_url(self, require_signed_urls: bool = None, 
+                             metadata: Optional[Dict] = None, 
+                             expiry: Optional[datetime] = None) -> Dict:
+        """
+        Get a one-time upload URL for direct creator uploads.
+        
+        Args:
+            require_signed_urls: Whether to require signed URLs for this image
+            metadata: Optional metadata to attach to the image
+            expiry: Optional expiry time for the upload URL
+            
+        Returns:
+            Response with upload URL and image ID
+        """
+        data = self._direct_upload_request(require_signed_urls, metadata, expiry)
+        return self._make_request("POST", "images/v2/direct_upload", data=data)
+
+    async def get_direct_upload_url_async(self, require_signed_urls: bool = None,
+                                          metadata: Optional[Dict] = None,
+                                          expiry: Optional[datetime] = None) -> Dict:
+        """
+        Get a one-time upload URL for direct creator uploads without blocking the event loop.
+        
+        Args:
+            require_signed_urls: Whether to require signed URLs for this image
+            metadata: Optional metadata to attach to the image
+            expiry: Optional expiry time for the upload URL
+            
+        Returns:
+            Response with upload URL and image ID
+        """
+        data = self._direct_upload_request(require_signed_urls, metadata, expiry)
+        return await self._make_request_async("POST", "images/v2/direct_upload", data=data)
     
     def get_image(self, image_id: str) -> Dict:
         """
@@ -167,6 +403,77 @@ class CloudflareImagesService:
         """
         endpoint = f"images/v1/{image_id}"
         return self._make_request("GET", endpoint)
+
+    async def get_image_async(self, image_id: str) -> Dict:
+        """
+        Get details of a specific image without blocking the event loop.
+        
+        Args:
+            image_id: ID of the image
+            
+        Returns:
+            Image details
+        """
+        return await self._make_request_async("GET", f"images/v1/{image_id}")
+    
+    async def get_image_blob_async(self, image_id: str) -> bytes:
+        """
+        Download the original image.
+        
+        Args:
+            image_id: ID of the image
+            
+        Returns:
+            Original image bytes
+        """
+        client = self.get_async_client()
+        endpoint = f"images/v1/{image_id}/blob"
+        await self.rate_limiter.acquire_async()
+        
+        start_time = time.perf_counter()
+        try:
+            response = await client.get(endpoint)
+            response.raise_for_status()
+            return response.content
+        finally:
+            observe_external_call(
+                "cloudflare_images", _endpoint_label(endpoint), time.perf_counter() - start_time
+            )
+    
+    async def read_image_head_async(self, image_id: str, max_bytes: int) -> bytes:
+        """
+        Read the leading bytes of an original image, e.g. to inspect its headers.
+        
+        The blob is streamed and the connection released once enough bytes have
+        been read, so the full image is never buffered.
+        
+        Args:
+            image_id: ID of the image
+            max_bytes: Maximum number of bytes to read
+            
+        Returns:
+            Up to max_bytes leading bytes of the image
+        """
+        client = self.get_async_client()
+        endpoint = f"images/v1/{image_id}/blob"
+        await self.rate_limiter.acquire_async()
+        
+        chunks = []
+        received = 0
+        start_time = time.perf_counter()
+        try:
+            async with client.stream("GET", endpoint) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    received += len(chunk)
+                    if received >= max_bytes:
+                        break
+        finally:
+            observe_external_call(
+                "cloudflare_images", _endpoint_label(endpoint), time.perf_counter() - start_time
+            )
+        return b"".join(chunks)[:max_bytes]
     
     def list_images(self, page: int = 1, per_page: int = 100) -> Dict:
         """
@@ -198,6 +505,18 @@ class CloudflareImagesService:
         """
         endpoint = f"images/v1/{image_id}"
         return self._make_request("DELETE", endpoint)
+
+    async def delete_image_async(self, image_id: str) -> Dict:
+        """
+        Delete an image from Cloudflare Images without blocking the event loop.
+        
+        Args:
+            image_id: ID of the image to delete
+            
+        Returns:
+            Deletion response
+        """
+        return await self._make_request_async("DELETE", f"images/v1/{image_id}")
     
     def create_variant(self, variant_id: str, options: Dict, 
                       never_require_signed_urls: bool = False) -> Dict:
@@ -243,6 +562,23 @@ class CloudflareImagesService:
         endpoint = f"images/v1/variants/{variant_id}"
         return self._make_request("DELETE", endpoint)
     
+    def signed_url_expiry(self, expires_in: int = 3600) -> int:
+        """
+        Get the expiry timestamp for a signed URL, rounded up to the signing window.
+        
+        Every URL requested within the same window gets the same expiry (and therefore
+        the same signature), so URLs can be cached and CDN caches keyed on the full
+        URL stay warm. URLs remain valid for at least `expires_in` seconds.
+        
+        Args:
+            expires_in: Minimum number of seconds the URL must stay valid
+            
+        Returns:
+            Expiry as a Unix timestamp
+        """
+        window = max(1, cloudflare_settings.signed_url_window_seconds)
+        return ((int(time.time()) + expires_in) // window + 1) * window
+    
     def generate_signed_url(self, image_id: str, variant_name: str, 
                            expiry: Optional[datetime] = None) -> str:
         """
@@ -251,39 +587,67 @@ class CloudflareImagesService:
         Args:
             image_id: ID of the image
             variant_name: Name of the variant
-            expiry: Optional expiry time for the signed URL
+            expiry: Optional expiry time for the signed URL; by default the URL is valid
+                for at least an hour, with the expiry bucketed to the signing window
             
         Returns:
             Signed URL for the image
         """
-        import time
-        import hashlib
-        import hmac
-        import base64
-        
-        # Default expiry is 1 hour from now
-        if not expiry:
-            expiry = datetime.utcnow() + timedelta(hours=1)
-        
-        # Convert expiry to timestamp
-        expiry_timestamp = int(expiry.timestamp())
-        
-        # Create the URL without signature
-        url = f"{self.delivery_url}/{image_id}/{variant_name}"
+        if expiry:
+            expiry_timestamp = int(expiry.timestamp())
+        else:
+            expiry_timestamp = self.signed_url_expiry()
         
-        # Create the signature
-        signature_payload = f"{image_id}/{variant_name}{expiry_timestamp}"
-        signature = hmac.new(
-            self.signing_key.encode(),
-            signature_payload.encode(),
-            hashlib.sha256
-        ).digest()
+        return _sign_url(self.delivery_url, self.signing_key, image_id, variant_name, expiry_timestamp)
+    
+    def generate_signed_urls(self, images: List[Tuple[str, str]],
+                             expires_in: int = 3600) -> Dict[Tuple[str, str], str]:
+        """
+        Generate signed URLs for many (image ID, variant) pairs in one call.
         
-        # Base64 encode the signature
-        encoded_signature = base64.urlsafe_b64encode(signature).decode().rstrip("=")
+        All URLs share one bucketed expiry, so repeated calls within the signing
+        window return identical, cached URLs.
         
-        # Return the signed URL
-        return f"{url}?exp={expiry_timestamp}&sig={encoded_signature}"
+        Args:
+            images: List of (image_id, variant_name) pairs
+            expires_in: Minimum number of seconds the URLs must stay valid
+            
+        Returns:
+            Dictionary mapping each (image_id, variant_name) pair to its signed URL
+        """
+        expiry_timestamp = self.signed_url_expiry(expires_in)
+        return {
+            (image_id, variant_name): _sign_url(
+                self.delivery_url, self.signing_key, image_id, variant_name, expiry_timestamp
+            )
+            for image_id, variant_name in images
+        }
+
+
+@lru_cache(maxsize=cloudflare_settings.signed_url_cache_size)
+def _sign_url(delivery_url: str, signing_key: str, image_id: str, variant_name: str,
+              expiry_timestamp: int) -> str:
+    """
+    Build a signed image delivery URL.
+    
+    Cached because bucketed expiries make the same URL get requested many times.
+    """
+    # Create the URL without signature
+    url = f"{delivery_url}/{image_id}/{variant_name}"
+    
+    # Create the signature
+    signature_payload = f"{image_id}/{variant_name}{expiry_timestamp}"
+    signature = hmac.new(
+        signing_key.encode(),
+        signature_payload.encode(),
+        hashlib.sha256
+    ).digest()
+    
+    # Base64 encode the signature
+    encoded_signature = base64.urlsafe_b64encode(signature).decode().rstrip("=")
+    
+    # Return the signed URL
+    return f"{url}?exp={expiry_timestamp}&sig={encoded_signature}"
 
 
 # Create a singleton instance
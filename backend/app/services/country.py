@@ -1,6 +1,7 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
+from app.core.tracing import traced
 from app.models.country import Country
 from app.schemas.country import CountryCreate, CountryUpdate
 from app.utils.slug import create_slug
@@ -87,6 +88,7 @@ class CountryService:
         """
         return db.query(Country).filter(Country.slug == slug, Country.is_active == True).first()
     
+    @traced()
     def get_country_details_by_slug(self, db: Session, slug: str) -> Optional[dict]:
         """
         Retrieve a specific country by slug with all related destinations data.
@@ -216,6 +218,7 @@ class CountryService:
         
         return country_dict
 
+    @traced()
     def get_countries_with_details(self, db: Session, skip: int = 0, limit: int = 100) -> List[dict]:
         """
         Retrieve all countries with detailed related data for trending destinations.
@@ -1,36 +1,42 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet
 from datetime import datetime
 from sqlalchemy.orm import Session, joinedload
 
+from app.db.loading import loader_options
 from app.models.group_trip import GroupTrip, GroupTripDeparture
 from app.models.media import MediaAsset
 from app.models.inclusion_exclusion import Inclusion, Exclusion
-from app.schemas.group_trip import GroupTripCreate, GroupTripUpdate, GroupTripDepartureCreate, GroupTripDepartureUpdate
+from app.schemas.group_trip import GroupTripCreate, GroupTripUpdate, GroupTripResponse, GroupTripWithCountryResponse, GroupTripDepartureCreate, GroupTripDepartureUpdate
 from app.utils.slug import create_slug
 from app.core.cloudflare_config import cloudflare_settings
 from app.services.group_trip_helper import format_group_trip_response
 
 class GroupTripService:
-    def get_group_trips(self, db: Session, skip: int = 0, limit: int = 100) -> List[GroupTrip]:
+    def get_group_trips(self, db: Session, skip: int = 0, limit: int = 100,
+                        fields: Optional[FrozenSet[str]] = None) -> List[GroupTrip]:
         """
-        Retrieve all group trips with pagination.
+        Retrieve all group trips with pagination, loading only `fields` if given.
         """
-        return db.query(GroupTrip).filter(GroupTrip.is_active == True).offset(skip).limit(limit).all()
+        return db.query(GroupTrip).options(*loader_options(GroupTrip, GroupTripResponse, fields)).filter(
+            GroupTrip.is_active == True
+        ).offset(skip).limit(limit).all()
     
-    def get_group_trips_by_country(self, db: Session, country_id: int, skip: int = 0, limit: int = 100) -> List[GroupTrip]:
+    def get_group_trips_by_country(self, db: Session, country_id: int, skip: int = 0, limit: int = 100,
+                                   fields: Optional[FrozenSet[str]] = None) -> List[GroupTrip]:
         """
-        Retrieve all group trips for a specific country with pagination.
+        Retrieve all group trips for a specific country with pagination, loading only `fields` if given.
         """
-        return db.query(GroupTrip).filter(
+        return db.query(GroupTrip).options(*loader_options(GroupTrip, GroupTripResponse, fields)).filter(
             GroupTrip.country_id == country_id,
             GroupTrip.is_active == True
         ).offset(skip).limit(limit).all()
     
-    def get_featured_group_trips(self, db: Session, skip: int = 0, limit: int = 100) -> List[GroupTrip]:
+    def get_featured_group_trips(self, db: Session, skip: int = 0, limit: int = 100,
+                                 fields: Optional[FrozenSet[str]] = None) -> List[GroupTrip]:
         """
-        Retrieve featured group trips with pagination.
+        Retrieve featured group trips with pagination, loading only `fields` if given.
         """
-        return db.query(GroupTrip).filter(
+        return db.query(GroupTrip).options(*loader_options(GroupTrip, GroupTripResponse, fields)).filter(
             GroupTrip.is_active == True,
             GroupTrip.is_featured == True
         ).offset(skip).limit(limit).all()
@@ -39,13 +45,17 @@ class GroupTripService:
         """
         Retrieve a specific group trip by ID.
         """
-        return db.query(GroupTrip).filter(GroupTrip.id == group_trip_id, GroupTrip.is_active == True).first()
+        return db.query(GroupTrip).options(*loader_options(GroupTrip, GroupTripWithCountryResponse)).filter(
+            GroupTrip.id == group_trip_id, GroupTrip.is_active == True
+        ).first()
     
     def get_group_trip_by_slug(self, db: Session, slug: str) -> Optional[GroupTrip]:
         """
         Retrieve a specific group trip by slug.
         """
-        return db.query(GroupTrip).filter(GroupTrip.slug == slug, GroupTrip.is_active == True).first()
+        return db.query(GroupTrip).options(*loader_options(GroupTrip, GroupTripWithCountryResponse)).filter(
+            GroupTrip.slug == slug, GroupTrip.is_active == True
+        ).first()
     
     def get_group_trip_details_by_slug(self, db: Session, slug: str) -> Optional[Dict[str, Any]]:
         """
@@ -1,6 +1,8 @@
 from typing import Dict, Any, List
+from app.core.tracing import traced
 from app.models.group_trip import GroupTrip
 
+@traced()
 def format_group_trip_response(group_trip: GroupTrip, gallery_images: List[Dict[str, Any]], cover_image: str) -> Dict[str, Any]:
     """
     Format group trip data for API response, including inclusion and exclusion items.
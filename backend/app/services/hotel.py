@@ -1,5 +1,5 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session, joinedload
+from typing import List, Optional, Dict, Any, FrozenSet
+from sqlalchemy.orm import Session, joinedload, load_only
 
 from app.models.hotel import Hotel
 from app.models.country import Country
@@ -7,6 +7,27 @@ from app.schemas.hotel import HotelCreate, HotelUpdate
 from app.utils.slug import create_slug
 from app.core.cloudflare_config import cloudflare_settings
 
+# Fields of the hotel list, in response order, and the columns each one needs
+HOTEL_LIST_FIELDS = {
+    "id": ("id",),
+    "name": ("name",),
+    "summary": ("summary",),
+    "description": ("description",),
+    "slug": ("slug",),
+    "country_id": ("country_id",),
+    "country": ("country_id",),
+    "image_id": ("image_id",),
+    "image_url": ("id", "image_id"),
+    "is_active": ("is_active",),
+    "address": ("address",),
+    "city": ("city",),
+    "stars": ("stars",),
+    "price_category": ("price_category",),
+    "amenities": ("amenities",),
+    "created_at": ("created_at",),
+    "updated_at": ("updated_at",),
+}
+
 class HotelService:
     def _get_cloudflare_image_url(self, image_id: str, variant: str = "medium") -> Optional[str]:
         """
@@ -16,14 +37,34 @@ class HotelService:
             return None
         return f"{cloudflare_settings.delivery_url}/{image_id}/{variant}"
     
-    def get_hotels(self, db: Session, skip: int = 0, limit: int = 100, recommended: Optional[bool] = None, country: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _get_cover_image_url(self, hotel: Hotel) -> Optional[str]:
+        """
+        Get a hotel's cover image URL, falling back to its first active gallery image.
+        """
+        if hotel.image_id:
+            return self._get_cloudflare_image_url(hotel.image_id)
+        for media in hotel.media_assets:
+            if media.is_active and media.storage_key:
+                return self._get_cloudflare_image_url(media.storage_key)
+        return None
+
+    def get_hotels(self, db: Session, skip: int = 0, limit: int = 100, recommended: Optional[bool] = None, country: Optional[str] = None,
+                   fields: Optional[FrozenSet[str]] = None) -> List[Dict[str, Any]]:
         """
         Retrieve all hotels with pagination and optional filtering, including cover images.
+
+        Only the columns and relationships needed for `fields` (see HOTEL_LIST_FIELDS)
+        are loaded if given.
         """
-        query = db.query(Hotel).options(
-            joinedload(Hotel.country),
-            joinedload(Hotel.media_assets)
-        ).filter(Hotel.is_active == True)
+        selected = [field for field in HOTEL_LIST_FIELDS if fields is None or field in fields]
+        options = []
+        if "country" in selected:
+            options.append(joinedload(Hotel.country))
+        if "image_url" in selected:
+            options.append(joinedload(Hotel.media_assets))
+        if fields is not None:
+            options.append(load_only(*{getattr(Hotel, column) for field in selected for column in HOTEL_LIST_FIELDS[field]}))
+        query = db.query(Hotel).options(*options).filter(Hotel.is_active == True)
 
         if recommended is not None and recommended:
             # For now, recommended means all active hotels (can be enhanced later with a recommended field)
@@ -35,47 +76,21 @@ class HotelService:
 
         hotels = query.offset(skip).limit(limit).all()
 
-        # Format hotels with cover images
         result = []
         for hotel in hotels:
-            # Get cover image
-            cover_image_url = None
-            if hotel.image_id:
-                cover_image_url = self._get_cloudflare_image_url(hotel.image_id)
-            else:
-                # Fallback to first gallery image
-                for media in hotel.media_assets:
-                    if media.is_active:
-                        if media.file_path.startswith("cloudflare://") and media.storage_key:
-                            cover_image_url = self._get_cloudflare_image_url(media.storage_key)
-                            break
-                        elif media.storage_key:
-                            cover_image_url = self._get_cloudflare_image_url(media.storage_key)
-                            break
-
-            hotel_data = {
-                "id": hotel.id,
-                "name": hotel.name,
-                "summary": hotel.summary,
-                "description": hotel.description,
-                "slug": hotel.slug,
-                "country_id": hotel.country_id,
-                "country": {
-                    "id": hotel.country.id,
-                    "name": hotel.country.name,
-                    "slug": hotel.country.slug,
-                } if hotel.country else None,
-                "image_id": hotel.image_id,
-                "image_url": cover_image_url,  # Add this for backward compatibility
-                "is_active": hotel.is_active,
-                "address": hotel.address,
-                "city": hotel.city,
-                "stars": hotel.stars,
-                "price_category": hotel.price_category,
-                "amenities": hotel.amenities,
-                "created_at": hotel.created_at,
-                "updated_at": hotel.updated_at,
-            }
+            hotel_data = {}
+            for field in selected:
+                if field == "country":
+                    hotel_data["country"] = {
+                        "id": hotel.country.id,
+                        "name": hotel.country.name,
+                        "slug": hotel.country.slug,
+                    } if hotel.country else None
+                elif field == "image_url":
+                    # Cover image, kept under this name for backward compatibility
+                    hotel_data["image_url"] = self._get_cover_image_url(hotel)
+                else:
+                    hotel_data[field] = getattr(hotel, field)
             result.append(hotel_data)
 
         return result
@@ -91,24 +106,10 @@ class HotelService:
             Hotel.is_active == True
         ).offset(skip).limit(limit).all()
         
-        # Format hotels with cover images
         result = []
         for hotel in hotels:
-            # Get cover image
-            cover_image_url = None
-            if hotel.image_id:
-                cover_image_url = self._get_cloudflare_image_url(hotel.image_id)
-            else:
-                # Fallback to first gallery image
-                for media in hotel.media_assets:
-                    if media.is_active:
-                        if media.file_path.startswith("cloudflare://") and media.storage_key:
-                            cover_image_url = self._get_cloudflare_image_url(media.storage_key)
-                            break
-                        elif media.storage_key:
-                            cover_image_url = self._get_cloudflare_image_url(media.storage_key)
-                            break
-            
+            cover_image_url = self._get_cover_image_url(hotel)
+
             hotel_data = {
                 "id": hotel.id,
                 "name": hotel.name,
@@ -3,6 +3,7 @@ from datetime import date, timedelta
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_
 
+from app.core.tracing import traced
 from app.models.itinerary import ItineraryItem, ItineraryActivity, EntityType
 from app.models.hotel import Hotel
 from app.models.attraction import Attraction
@@ -362,6 +363,7 @@ class ItineraryService:
             "custom_activities": formatted_custom_activities
         }
 
+    @traced()
     def format_itinerary_for_response(self, items: List[ItineraryItem]) -> Dict[str, Any]:
         """Format itinerary items for API response with additional details."""
         formatted_items = []
@@ -1,13 +1,19 @@
 from typing import List, Optional, Dict, Any, BinaryIO
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, timedelta
 import uuid
 import os
 from fastapi import UploadFile
+from jose import jwt, JWTError
 
+from app.core.config import settings
 from app.models.media import MediaAsset
+from app.media.r2 import r2_client
+from app.media.variants import build_srcset
 from app.services.cloudflare_images import cloudflare_images_service
 
+UPLOAD_TICKET_TYPE = "media_upload"
+
 class MediaService:
     def get_media_assets(self, db: Session, skip: int = 0, limit: int = 100) -> List[MediaAsset]:
         """
@@ -227,24 +233,70 @@ class MediaService:
         if not db_media:
             return None
         
+        return self.get_media_urls([db_media], expiration=expiration).get(db_media.id)
+    
+    def get_media_urls(self, media_assets: List[MediaAsset], variant: str = "medium",
+                       expiration: int = 3600) -> Dict[int, Optional[str]]:
+        """
+        Generate delivery URLs for already loaded media assets in one call.
+        
+        Use this for lists and galleries instead of calling get_presigned_url per asset:
+        the assets aren't re-fetched and Cloudflare signed URLs are generated as a batch
+        with a shared, cacheable expiry.
+        
+        Args:
+            media_assets: Media assets to generate URLs for
+            variant: Cloudflare Images variant to deliver
+            expiration: Minimum time in seconds for signed URLs to remain valid
+            
+        Returns:
+            Dictionary mapping media asset ID to its URL (None if it couldn't be generated)
+        """
+        from app.core.cloudflare_config import cloudflare_settings
+        
+        urls: Dict[int, Optional[str]] = {}
+        cloudflare_assets = []
+        for media_asset in media_assets:
+            if media_asset.file_path.startswith("r2://"):
+                urls[media_asset.id] = r2_client.generate_presigned_url(media_asset.storage_key, expiration)
+            else:
+                cloudflare_assets.append(media_asset)
+        
+        if not cloudflare_assets:
+            return urls
+        
         # For Cloudflare Images, generate the delivery URL
         # If signed URLs are required, generate signed URL, otherwise use public URL
         try:
-            from app.core.cloudflare_config import cloudflare_settings
             if cloudflare_settings.require_signed_urls:
-                from datetime import datetime, timedelta
-                expiry = datetime.utcnow() + timedelta(seconds=expiration)
-                return cloudflare_images_service.generate_signed_url(
-                    db_media.storage_key, 
-                    "medium",  # default variant
-                    expiry
+                signed_urls = cloudflare_images_service.generate_signed_urls(
+                    [(media_asset.storage_key, variant) for media_asset in cloudflare_assets],
+                    expires_in=expiration
                 )
+                for media_asset in cloudflare_assets:
+                    urls[media_asset.id] = signed_urls[(media_asset.storage_key, variant)]
             else:
                 # Public URL format: https://imagedelivery.net/{account_hash}/{image_id}/{variant_name}
-                return f"{cloudflare_settings.delivery_url}/{db_media.storage_key}/medium"
+                for media_asset in cloudflare_assets:
+                    urls[media_asset.id] = f"{cloudflare_settings.delivery_url}/{media_asset.storage_key}/{variant}"
         except Exception as e:
-            print(f"Error generating Cloudflare Images URL: {e}")
-            return None
+            print(f"Error generating Cloudflare Images URLs: {e}")
+            for media_asset in cloudflare_assets:
+                urls[media_asset.id] = None
+        
+        return urls
+    
+    def get_srcset(self, media_asset: MediaAsset) -> Dict[str, str]:
+        """
+        Get responsive `srcset` values per image format for a media asset.
+        
+        Args:
+            media_asset: Media asset with a variant manifest
+            
+        Returns:
+            Dictionary mapping format to srcset string (empty if there are no local variants)
+        """
+        return build_srcset(media_asset.variant_manifest, settings.R2_PUBLIC_URL)
     
     def get_upload_presigned_post(self, filename: str, content_type: str, 
                                  expiration: int = 3600) -> Optional[Dict[str, Any]]:
@@ -275,7 +327,9 @@ class MediaService:
             if response.get("success"):
                 return {
                     "url": response["result"]["uploadURL"],
-                    "id": response["result"]["id"]
+                    "id": response["result"]["id"],
+                    "fields": {},
+                    "storage_key": response["result"]["id"]
                 }
             return None
         except Exception as e:
@@ -319,6 +373,185 @@ class MediaService:
         db.refresh(db_media)
         return db_media
     
+    async def create_direct_upload(self, user_id: int, filename: str, content_type: str, provider: str = "cloudflare",
+                                   entity_type: Optional[str] = None, entity_id: Optional[int] = None,
+                                   alt_text: Optional[str] = None, title: Optional[str] = None,
+                                   caption: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Issue an upload ticket so the browser can upload a file straight to storage.
+        
+        The API never sees the file bytes: the browser uploads to the returned URL and
+        then calls the confirm endpoint with the signed ticket.
+        
+        Args:
+            user_id: ID of the user requesting the upload; only they can confirm it
+            filename: Original filename
+            content_type: MIME type of the file
+            provider: Storage to upload to ("cloudflare" or "r2")
+            entity_type: Type of entity this media belongs to
+            entity_id: ID of the entity this media belongs to
+            alt_text: Alternative text for the image
+            title: Title for the media asset
+            caption: Caption for the media asset
+            
+        Returns:
+            Upload ticket data or None if the upload URL couldn't be created
+        """
+        expires_at = datetime.utcnow() + timedelta(minutes=settings.MEDIA_UPLOAD_TICKET_EXPIRE_MINUTES)
+        
+        try:
+            if provider == "r2":
+                file_extension = os.path.splitext(filename)[1]
+                storage_key = f"{uuid.uuid4()}{file_extension}"
+                # Presigning is local, no request is made to R2
+                upload_url = r2_client.generate_presigned_upload_url(
+                    storage_key,
+                    content_type,
+                    settings.MEDIA_UPLOAD_TICKET_EXPIRE_MINUTES * 60
+                )
+                if not upload_url:
+                    return None
+                method = "PUT"
+                headers = {"Content-Type": content_type}
+            else:
+                response = await cloudflare_images_service.get_direct_upload_url_async(
+                    metadata={
+                        "original_filename": filename,
+                        "entity_type": entity_type,
+                        "entity_id": str(entity_id) if entity_id else None
+                    },
+                    expiry=expires_at
+                )
+                if not response.get("success"):
+                    return None
+                storage_key = response["result"]["id"]
+                upload_url = response["result"]["uploadURL"]
+                method = "POST"
+                headers = {}
+        except Exception as e:
+            print(f"Error creating direct upload URL: {e}")
+            return None
+        
+        ticket = jwt.encode(
+            {
+                "type": UPLOAD_TICKET_TYPE,
+                "exp": expires_at,
+                "sub": str(user_id),
+                "provider": provider,
+                "storage_key": storage_key,
+                "filename": filename,
+                "content_type": content_type,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "alt_text": alt_text,
+                "title": title,
+                "caption": caption
+            },
+            settings.JWT_SECRET_KEY,
+            algorithm=settings.JWT_ALGORITHM
+        )
+        
+        return {
+            "provider": provider,
+            "upload_url": upload_url,
+            "method": method,
+            "headers": headers,
+            "storage_key": storage_key,
+            "ticket": ticket,
+            "expires_at": expires_at
+        }
+    
+    def decode_upload_ticket(self, ticket: str) -> Optional[Dict[str, Any]]:
+        """
+        Verify and decode a direct upload ticket.
+        
+        Args:
+            ticket: Ticket issued by create_direct_upload
+            
+        Returns:
+            Ticket claims or None if the ticket is invalid or expired
+        """
+        try:
+            claims = jwt.decode(ticket, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        except JWTError:
+            return None
+        
+        if claims.get("type") != UPLOAD_TICKET_TYPE:
+            return None
+        return claims
+    
+    def get_direct_upload_size(self, provider: str, storage_key: str) -> Optional[int]:
+        """
+        Check that a direct upload has completed and get its size.
+        
+        Args:
+            provider: Storage the file was uploaded to
+            storage_key: Storage key of the uploaded file
+            
+        Returns:
+            Size in bytes, 0 for Cloudflare Images (which doesn't report sizes), or None
+            if the upload isn't there
+        """
+        try:
+            if provider == "r2":
+                file_info = r2_client.get_file_info(storage_key)
+                return file_info["size"] if file_info else None
+            
+            response = cloudflare_images_service.get_image(storage_key)
+            result = response.get("result") or {}
+            # Direct upload images stay drafts until the browser has uploaded the file
+            if not response.get("success") or result.get("draft"):
+                return None
+            return 0
+        except Exception as e:
+            print(f"Error checking direct upload {storage_key}: {e}")
+            return None
+    
+    def record_direct_upload(self, db: Session, ticket_data: Dict[str, Any], user_id: int,
+                             file_size: Optional[int] = None) -> MediaAsset:
+        """
+        Create the database record for a completed direct upload.
+        
+        Confirming the same ticket twice returns the existing record.
+        
+        Args:
+            db: Database session
+            ticket_data: Decoded upload ticket claims
+            user_id: ID of the user confirming the upload
+            file_size: Size of the uploaded file in bytes, if known
+            
+        Returns:
+            The media asset for the upload
+        """
+        storage_key = ticket_data["storage_key"]
+        existing = self.get_media_asset_by_key(db, storage_key)
+        if existing:
+            return existing
+        
+        scheme = "r2" if ticket_data["provider"] == "r2" else "cloudflare"
+        db_media = MediaAsset(
+            filename=ticket_data["filename"],
+            original_filename=ticket_data["filename"],
+            file_path=f"{scheme}://{storage_key}",
+            storage_key=storage_key,
+            content_type=ticket_data["content_type"],
+            file_size=file_size or None,
+            entity_type=ticket_data.get("entity_type"),
+            entity_id=ticket_data.get("entity_id"),
+            alt_text=ticket_data.get("alt_text"),
+            title=ticket_data.get("title") or ticket_data["filename"],
+            caption=ticket_data.get("caption"),
+            created_by_id=user_id
+        )
+        db.add(db_media)
+        db.commit()
+        db.refresh(db_media)
+        
+        if db_media.entity_type and db_media.entity_id:
+            self.associate_media_with_entity(db, db_media.id, db_media.entity_type, db_media.entity_id)
+        
+        return db_media
+    
     def associate_media_with_entity(self, db: Session, media_id: int, entity_type: str, entity_id: int) -> bool:
         """
         Associate a media asset with an entity by adding it to the appropriate junction table.
@@ -1,13 +1,13 @@
-from typing import List, Optional, Dict, Any
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet
 from datetime import datetime
 from sqlalchemy.orm import Session, joinedload
 
+from app.db.loading import loader_options
 from app.models.package import Package
 from app.models.media import MediaAsset
 from app.models.holiday_type import HolidayType
 from app.models.inclusion_exclusion import Inclusion, Exclusion
-from app.schemas.package import PackageCreate, PackageUpdate
+from app.schemas.package import PackageCreate, PackageUpdate, PackageWithCountryResponse
 from app.utils.slug import create_slug
 from app.core.cloudflare_config import cloudflare_settings
 
@@ -20,14 +20,12 @@ class PackageService:
             return None
         return f"{cloudflare_settings.delivery_url}/{image_id}/{variant}"
 
-    def get_packages(self, db: Session, skip: int = 0, limit: int = 100, order_by: str = "created_at", order: str = "desc") -> List[Package]:
+    def get_packages(self, db: Session, skip: int = 0, limit: int = 100, order_by: str = "created_at", order: str = "desc",
+                     fields: Optional[FrozenSet[str]] = None) -> List[Package]:
         """
-        Retrieve all packages with pagination and ordering.
+        Retrieve all packages with pagination and ordering, loading only `fields` if given.
         """
-        query = db.query(Package).options(
-            joinedload(Package.country),
-            joinedload(Package.holiday_types)
-        ).filter(Package.is_active == True)
+        query = db.query(Package).options(*loader_options(Package, PackageWithCountryResponse, fields)).filter(Package.is_active == True)
 
         # Apply ordering
         if order_by == "created_at":
@@ -45,29 +43,27 @@ class PackageService:
                 query = query.order_by(Package.price.desc())
             else:
                 query = query.order_by(Package.price.asc())
+        # Ties would otherwise come back in whatever order the index scan yields them
+        query = query.order_by(Package.id.asc())
 
         return query.offset(skip).limit(limit).all()
     
-    def get_packages_by_country(self, db: Session, country_id: int, skip: int = 0, limit: int = 100) -> List[Package]:
+    def get_packages_by_country(self, db: Session, country_id: int, skip: int = 0, limit: int = 100,
+                                fields: Optional[FrozenSet[str]] = None) -> List[Package]:
         """
-        Retrieve all packages for a specific country with pagination.
+        Retrieve all packages for a specific country with pagination, loading only `fields` if given.
         """
-        return db.query(Package).options(
-            joinedload(Package.country),
-            joinedload(Package.holiday_types)
-        ).filter(
+        return db.query(Package).options(*loader_options(Package, PackageWithCountryResponse, fields)).filter(
             Package.country_id == country_id,
             Package.is_active == True
         ).offset(skip).limit(limit).all()
     
-    def get_featured_packages(self, db: Session, skip: int = 0, limit: int = 100) -> List[Package]:
+    def get_featured_packages(self, db: Session, skip: int = 0, limit: int = 100,
+                              fields: Optional[FrozenSet[str]] = None) -> List[Package]:
         """
-        Retrieve featured packages with pagination.
+        Retrieve featured packages with pagination, loading only `fields` if given.
         """
-        return db.query(Package).options(
-            joinedload(Package.country),
-            joinedload(Package.holiday_types)
-        ).filter(
+        return db.query(Package).options(*loader_options(Package, PackageWithCountryResponse, fields)).filter(
             Package.is_active == True,
             Package.is_featured == True
         ).offset(skip).limit(limit).all()
@@ -76,16 +72,15 @@ class PackageService:
         """
         Retrieve a specific package by ID.
         """
-        return db.query(Package).options(
-            joinedload(Package.country),
-            joinedload(Package.holiday_types)
-        ).filter(Package.id == package_id, Package.is_active == True).first()
+        return db.query(Package).options(*loader_options(Package, PackageWithCountryResponse)).filter(Package.id == package_id, Package.is_active == True).first()
     
     def get_package_by_slug(self, db: Session, slug: str) -> Optional[Package]:
         """
         Retrieve a specific package by slug.
         """
-        return db.query(Package).filter(Package.slug == slug, Package.is_active == True).first()
+        return db.query(Package).options(*loader_options(Package, PackageWithCountryResponse)).filter(
+            Package.slug == slug, Package.is_active == True
+        ).first()
     
     def get_package_details_by_slug(self, db: Session, slug: str) -> Optional[Dict[str, Any]]:
         """
@@ -0,0 +1,156 @@
+"""
+Composite pages assembled from several sections in one request.
+
+The homepage used to make one HTTP request per rail (featured packages and group
+trips, trending destinations, stats, recommended hotels, blog posts). `/pages/home`
+loads all of them concurrently in the threadpool and returns them together.
+
+SQLAlchemy sessions can't be shared between threads, so each section reads
+through its own short-lived session on the request session's engine and renders
+its data before the session is closed. Each section has a timeout and a fallback
+value: a slow or failing section is replaced by its fallback and listed under
+`degraded` instead of failing the page. Complete pages are cached as a unit in
+the response cache.
+"""
+import asyncio
+import logging
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.metrics import PAGE_SECTION_FALLBACKS
+from app.core.serialization import serialize_orm
+from app.schemas.blog import BlogPostResponse
+from app.schemas.group_trip import GroupTripResponse
+from app.schemas.package import PackageWithCountryResponse
+from app.services.blog import blog_service
+from app.services.country import country_service
+from app.services.group_trip import group_trip_service
+from app.services.hotel import hotel_service
+from app.services.package import package_service
+from app.services.stats import stats_service
+
+logger = logging.getLogger(__name__)
+
+class PageSection:
+    """
+    A section of a composite page.
+    """
+
+    def __init__(self, name: str, load: Callable[[Session, int], Any], fallback: Any,
+                 tables: FrozenSet[str], timeout: Optional[float] = None):
+        """
+        Args:
+            name: Key of the section in the page
+            load: Function reading the section's JSON-ready data, given a session
+                and the number of items to return
+            fallback: Data returned when the section times out or fails
+            tables: Tables the section is read from
+            timeout: Seconds the section may take (PAGE_SECTION_TIMEOUT_SECONDS by default)
+        """
+        self.name = name
+        self.load = load
+        self.fallback = fallback
+        self.tables = tables
+        self.timeout = timeout
+
+HOME_SECTIONS: List[PageSection] = [
+    PageSection(
+        "featured_packages",
+        lambda db, limit: [
+            serialize_orm(package, PackageWithCountryResponse)
+            for package in package_service.get_featured_packages(db, limit=limit)
+        ],
+        fallback=[],
+        tables=frozenset({"packages", "package_holiday_types", "countries", "holiday_types",
+                          "inclusions", "exclusions"}),
+    ),
+    PageSection(
+        "featured_group_trips",
+        lambda db, limit: [
+            serialize_orm(group_trip, GroupTripResponse)
+            for group_trip in group_trip_service.get_featured_group_trips(db, limit=limit)
+        ],
+        fallback=[],
+        tables=frozenset({"group_trips", "holiday_types", "inclusions", "exclusions"}),
+    ),
+    PageSection(
+        "trending_destinations",
+        lambda db, limit: country_service.get_countries_with_details(db, limit=limit),
+        fallback=[],
+        tables=frozenset({"countries", "regions", "packages", "group_trips", "group_trip_departures",
+                          "attractions", "accommodations", "hotels", "country_visit_info"}),
+    ),
+    PageSection(
+        "stats",
+        lambda db, limit: stats_service.get_stats(db),
+        fallback=None,
+        tables=frozenset({"group_trips", "activities", "hotels", "attractions"}),
+    ),
+    PageSection(
+        "recommended_hotels",
+        lambda db, limit: hotel_service.get_hotels(db, limit=limit, recommended=True),
+        fallback=[],
+        tables=frozenset({"hotels", "countries", "media_assets"}),
+    ),
+    PageSection(
+        "blog_posts",
+        lambda db, limit: [
+            serialize_orm(post, BlogPostResponse)
+            for post in blog_service.get_blog_posts(db, limit=limit)
+        ],
+        fallback=[],
+        tables=frozenset({"blog_posts", "tags"}),
+    ),
+]
+
+# Tables any homepage section is read from, for invalidating the cached page
+HOME_TABLES = frozenset().union(*(section.tables for section in HOME_SECTIONS))
+
+class PageService:
+    def _load_section(self, db: Session, section: PageSection, limit: int) -> Any:
+        # Each section gets its own session: sessions aren't thread-safe
+        with Session(bind=db.get_bind(), autoflush=False) as section_db:
+            return section.load(section_db, limit)
+
+    async def _run_section(self, db: Session, page: str, section: PageSection,
+                           limit: int, degraded: List[str]) -> Any:
+        timeout = section.timeout if section.timeout is not None else settings.PAGE_SECTION_TIMEOUT_SECONDS
+        try:
+            return await asyncio.wait_for(run_in_threadpool(self._load_section, db, section, limit), timeout)
+        except asyncio.TimeoutError:
+            reason = "timeout"
+            logger.warning("Page section %s/%s timed out after %ss", page, section.name, timeout)
+        except Exception:
+            reason = "error"
+            logger.exception("Page section %s/%s failed", page, section.name)
+        PAGE_SECTION_FALLBACKS.labels(page=page, section=section.name, reason=reason).inc()
+        degraded.append(section.name)
+        return section.fallback
+
+    async def assemble(self, db: Session, page: str, sections: List[PageSection],
+                       limit: int) -> Dict[str, Any]:
+        """
+        Load the sections of a page concurrently.
+
+        Args:
+            db: Request database session, whose engine the sections read from
+            page: Page name, for logs and metrics
+            sections: Sections to load
+            limit: Number of items per list section
+
+        Returns:
+            Dictionary with each section's data by name, and `degraded` listing
+            the sections replaced by their fallback
+        """
+        degraded: List[str] = []
+        results = await asyncio.gather(*(
+            self._run_section(db, page, section, limit, degraded) for section in sections
+        ))
+        page_data = {section.name: result for section, result in zip(sections, results)}
+        page_data["degraded"] = sorted(degraded)
+        return page_data
+
+page_service = PageService()
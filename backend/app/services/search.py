@@ -1,7 +1,7 @@
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 
-from app.search.meilisearch import meilisearch_client
+from app.core.tracing import traced
 from app.models.region import Region
 from app.models.country import Country
 from app.models.activity import Activity
@@ -18,12 +18,16 @@ class SearchService:
     Service for handling search functionality using Meilisearch.
     """
     
-    def __init__(self):
+    @property
+    def meilisearch_client(self):
         """
-        Initialize the SearchService with a reference to the meilisearch_client.
+        The shared Meilisearch client.
+        
+        Imported on first use, so the meilisearch package (and requests) isn't
+        loaded at startup.
         """
         from app.search.meilisearch import meilisearch_client
-        self.meilisearch_client = meilisearch_client
+        return meilisearch_client
     
     # Define index names for each entity type
     REGION_INDEX = 'regions'
@@ -108,6 +112,7 @@ class SearchService:
         }
     }
     
+    @traced()
     def initialize_indexes(self) -> bool:
         """
         Initialize all search indexes with their settings.
@@ -129,6 +134,7 @@ class SearchService:
         
         return success
     
+    @traced()
     def index_regions(self, db: Session) -> bool:
         """
         Index all active regions.
@@ -153,6 +159,7 @@ class SearchService:
         
         return self.meilisearch_client.add_documents(self.REGION_INDEX, documents)
     
+    @traced()
     def index_countries(self, db: Session) -> bool:
         """
         Index all active countries.
@@ -178,6 +185,7 @@ class SearchService:
         
         return self.meilisearch_client.add_documents(self.COUNTRY_INDEX, documents)
     
+    @traced()
     def index_activities(self, db: Session) -> bool:
         """
         Index all active activities.
@@ -202,6 +210,7 @@ class SearchService:
         
         return self.meilisearch_client.add_documents(self.ACTIVITY_INDEX, documents)
     
+    @traced()
     def index_attractions(self, db: Session) -> bool:
         """
         Index all active attractions.
@@ -228,6 +237,7 @@ class SearchService:
         
         return self.meilisearch_client.add_documents(self.ATTRACTION_INDEX, documents)
     
+    @traced()
     def index_accommodations(self, db: Session) -> bool:
         """
         Index all active accommodations.
@@ -256,6 +266,7 @@ class SearchService:
         
         return self.meilisearch_client.add_documents(self.ACCOMMODATION_INDEX, documents)
     
+    @traced()
     def index_packages(self, db: Session) -> bool:
         """
         Index all active packages.
@@ -299,6 +310,7 @@ class SearchService:
         
         return self.meilisearch_client.add_documents(self.PACKAGE_INDEX, documents)
     
+    @traced()
     def index_group_trips(self, db: Session) -> bool:
         """
         Index all active group trips.
@@ -342,6 +354,7 @@ class SearchService:
         
         return self.meilisearch_client.add_documents(self.GROUP_TRIP_INDEX, documents)
     
+    @traced()
     def index_blog_posts(self, db: Session) -> bool:
         """
         Index all active blog posts.
@@ -369,6 +382,7 @@ class SearchService:
         
         return self.meilisearch_client.add_documents(self.BLOG_POST_INDEX, documents)
     
+    @traced()
     def index_hotel_types(self, db: Session) -> bool:
         """
         Index all active hotel types.
@@ -393,6 +407,7 @@ class SearchService:
         
         return self.meilisearch_client.add_documents(self.HOTEL_TYPE_INDEX, documents)
     
+    @traced()
     def index_all(self, db: Session) -> Dict[str, bool]:
         """
         Index all entities.
@@ -403,20 +418,28 @@ class SearchService:
         Returns:
             dict: Dictionary with index names as keys and success status as values
         """
-        return {
-            self.REGION_INDEX: self.index_regions(db),
-            self.COUNTRY_INDEX: self.index_countries(db),
-            self.ACTIVITY_INDEX: self.index_activities(db),
-            self.ATTRACTION_INDEX: self.index_attractions(db),
-            self.ACCOMMODATION_INDEX: self.index_accommodations(db),
-            self.PACKAGE_INDEX: self.index_packages(db),
-            self.GROUP_TRIP_INDEX: self.index_group_trips(db),
-            self.BLOG_POST_INDEX: self.index_blog_posts(db),
-            self.HOTEL_TYPE_INDEX: self.index_hotel_types(db),
-            self.INCLUSION_INDEX: self.index_inclusions(db),
-            self.EXCLUSION_INDEX: self.index_exclusions(db)
+        indexers = {
+            self.REGION_INDEX: self.index_regions,
+            self.COUNTRY_INDEX: self.index_countries,
+            self.ACTIVITY_INDEX: self.index_activities,
+            self.ATTRACTION_INDEX: self.index_attractions,
+            self.ACCOMMODATION_INDEX: self.index_accommodations,
+            self.PACKAGE_INDEX: self.index_packages,
+            self.GROUP_TRIP_INDEX: self.index_group_trips,
+            self.BLOG_POST_INDEX: self.index_blog_posts,
+            self.HOTEL_TYPE_INDEX: self.index_hotel_types,
+            self.INCLUSION_INDEX: self.index_inclusions,
+            self.EXCLUSION_INDEX: self.index_exclusions
         }
+        results = {}
+        for index_name, indexer in indexers.items():
+            results[index_name] = indexer(db)
+            # Release the loaded entities so the session's identity map doesn't
+            # hold every table at once
+            db.expunge_all()
+        return results
     
+    @traced()
     def update_region(self, region: Region) -> bool:
         """
         Update a region in the search index.
@@ -437,6 +460,7 @@ class SearchService:
         
         return self.meilisearch_client.update_documents(self.REGION_INDEX, [document])
     
+    @traced()
     def update_country(self, country: Country) -> bool:
         """
         Update a country in the search index.
@@ -458,6 +482,7 @@ class SearchService:
         
         return self.meilisearch_client.update_documents(self.COUNTRY_INDEX, [document])
     
+    @traced()
     def update_hotel_type(self, hotel_type: HotelType) -> bool:
         """
         Update a hotel type in the search index.
@@ -478,6 +503,7 @@ class SearchService:
         
         return self.meilisearch_client.update_documents(self.HOTEL_TYPE_INDEX, [document])
     
+    @traced()
     def search(self, query: str, index_name: Optional[str] = None, limit: int = 20, offset: int = 0,
               filter: Optional[str] = None, sort: Optional[List[str]] = None) -> Dict[str, Any]:
         """
@@ -504,6 +530,7 @@ class SearchService:
         
         return results
     
+    @traced()
     def delete_from_index(self, index_name: str, document_id: int) -> bool:
         """
         Delete a document from a search index.
@@ -517,6 +544,7 @@ class SearchService:
         """
         return self.meilisearch_client.delete_document(index_name, document_id)
 
+    @traced()
     def index_inclusions(self, db: Session) -> bool:
         """
         Index all active inclusions.
@@ -542,6 +570,7 @@ class SearchService:
         
         return self.meilisearch_client.add_documents(self.INCLUSION_INDEX, documents)
     
+    @traced()
     def index_exclusions(self, db: Session) -> bool:
         """
         Index all active exclusions.
@@ -567,6 +596,7 @@ class SearchService:
         
         return self.meilisearch_client.add_documents(self.EXCLUSION_INDEX, documents)
     
+    @traced()
     def update_inclusion(self, inclusion: Inclusion) -> bool:
         """
         Update an inclusion in the search index.
@@ -588,6 +618,7 @@ class SearchService:
         
         return self.meilisearch_client.update_documents(self.INCLUSION_INDEX, [document])
     
+    @traced()
     def update_exclusion(self, exclusion: Exclusion) -> bool:
         """
         Update an exclusion in the search index.
@@ -0,0 +1,246 @@
+"""
+Platform statistics from in-memory entity counters.
+
+`/stats` used to run a COUNT(*) per entity type on every call, including inactive
+rows. Active counts, in total and per country, are now kept per worker:
+
+- A reconcile loads them with one GROUP BY query per entity type. It runs on the
+  first read and again once the counts are older than STATS_RECONCILE_SECONDS,
+  which picks up changes made by other workers or by bulk updates that bypass
+  the ORM.
+- Between reconciles, ORM flushes that insert, delete, activate, deactivate or
+  move an entity to another country record deltas on the session, which are
+  applied when the transaction commits and dropped when it rolls back. Changes
+  whose previous values aren't known force a reconcile on the next read.
+"""
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event, func, inspect
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.accommodation import Accommodation
+from app.models.activity import Activity
+from app.models.attraction import Attraction
+from app.models.country import Country
+from app.models.group_trip import GroupTrip
+from app.models.hotel import Hotel
+from app.models.package import Package
+
+logger = logging.getLogger(__name__)
+
+# Counted entity types by name
+COUNTED_ENTITIES: Dict[str, Any] = {
+    "group_trips": GroupTrip,
+    "activities": Activity,
+    "hotels": Hotel,
+    "attractions": Attraction,
+    "packages": Package,
+    "accommodations": Accommodation,
+    "countries": Country,
+}
+
+# Entity types also counted per country (those with a country_id column)
+COUNTRY_ENTITIES = ("group_trips", "hotels", "attractions", "packages", "accommodations")
+
+_ENTITY_NAMES = {model: name for name, model in COUNTED_ENTITIES.items()}
+
+# Session.info key of the deltas of the session's current transaction
+_DELTAS_KEY = "entity_counter_deltas"
+
+_UNKNOWN = object()
+
+class EntityCounters:
+    """
+    Active entity counts, in total and per country.
+    """
+
+    def __init__(self, reconcile_seconds: float):
+        """
+        Initialize the counters.
+
+        Args:
+            reconcile_seconds: Maximum age of the counts before they are reloaded
+        """
+        self.reconcile_seconds = reconcile_seconds
+        self._totals: Dict[str, int] = {}
+        self._by_country: Dict[int, Dict[str, int]] = {}
+        self._loaded_at: Optional[float] = None
+        # Incremented whenever deltas are applied or the counts are invalidated
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> Tuple[Dict[str, int], Dict[int, Dict[str, int]]]:
+        """
+        Get the active counts, reconciling them first if they are stale.
+
+        Args:
+            db: Database session used for reconciling
+
+        Returns:
+            Counts by entity type, and counts by entity type for each country
+            with at least one active entity
+        """
+        with self._lock:
+            loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self.reconcile_seconds:
+            self.reconcile(db)
+        with self._lock:
+            return dict(self._totals), {
+                country_id: dict(counts) for country_id, counts in self._by_country.items()
+            }
+
+    def reconcile(self, db: Session) -> None:
+        """
+        Reload the counts from the database.
+        """
+        with self._lock:
+            version = self._version
+        totals = {name: 0 for name in COUNTED_ENTITIES}
+        by_country: Dict[int, Dict[str, int]] = {}
+        for name, model in COUNTED_ENTITIES.items():
+            if name in COUNTRY_ENTITIES:
+                rows = db.query(model.country_id, func.count(model.id)).filter(
+                    model.is_active == True
+                ).group_by(model.country_id).all()
+                for country_id, count in rows:
+                    by_country.setdefault(country_id, {})[name] = count
+                    totals[name] += count
+            else:
+                totals[name] = db.query(func.count(model.id)).filter(model.is_active == True).scalar()
+
+        # Counts read in a transaction with flushed changes include them before
+        # they are committed (or rolled back)
+        current = self._version == version and not db.info.get(_DELTAS_KEY)
+        with self._lock:
+            if self._loaded_at is not None and current and totals != self._totals:
+                logger.info("Entity counters drifted from the database and were reconciled")
+            self._totals = totals
+            self._by_country = by_country
+            # Deltas committed while reloading may or may not be in the counts
+            self._loaded_at = time.monotonic() if current and self._version == version else None
+
+    def apply(self, deltas: Counter) -> None:
+        """
+        Apply committed changes to the counts.
+
+        Args:
+            deltas: Count changes by (entity type, country ID or None for the total)
+        """
+        with self._lock:
+            self._version += 1
+            if self._loaded_at is None:
+                return
+            for (name, country_id), delta in deltas.items():
+                if country_id is None:
+                    self._totals[name] = self._totals.get(name, 0) + delta
+                else:
+                    counts = self._by_country.setdefault(country_id, {})
+                    counts[name] = counts.get(name, 0) + delta
+                    if counts[name] == 0:
+                        del counts[name]
+                        if not counts:
+                            del self._by_country[country_id]
+
+    def invalidate(self) -> None:
+        """
+        Reload the counts on the next read.
+        """
+        with self._lock:
+            self._version += 1
+            self._loaded_at = None
+
+entity_counters = EntityCounters(reconcile_seconds=settings.STATS_RECONCILE_SECONDS)
+
+def _previous(state: Any, key: str) -> Any:
+    """
+    Get an attribute's value before the flush, or _UNKNOWN if it was never loaded.
+    """
+    history = state.attrs[key].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return _UNKNOWN
+
+def _add(deltas: Counter, name: str, country_id: Optional[int], delta: int) -> None:
+    deltas[(name, None)] += delta
+    if name in COUNTRY_ENTITIES and country_id is not None:
+        deltas[(name, country_id)] += delta
+
+@event.listens_for(Session, "after_flush")
+def _record_count_changes(session: Session, flush_context: Any) -> None:
+    deltas: Counter = session.info.setdefault(_DELTAS_KEY, Counter())
+    for obj in session.new:
+        name = _ENTITY_NAMES.get(type(obj))
+        if name is not None and obj.is_active:
+            _add(deltas, name, getattr(obj, "country_id", None), 1)
+    for obj in session.deleted:
+        name = _ENTITY_NAMES.get(type(obj))
+        if name is not None:
+            state = inspect(obj)
+            was_active = _previous(state, "is_active")
+            old_country = _previous(state, "country_id") if name in COUNTRY_ENTITIES else None
+            if was_active is _UNKNOWN or old_country is _UNKNOWN:
+                entity_counters.invalidate()
+            elif was_active:
+                _add(deltas, name, old_country, -1)
+    for obj in session.dirty:
+        name = _ENTITY_NAMES.get(type(obj))
+        if name is None:
+            continue
+        state = inspect(obj)
+        keys = ("is_active", "country_id") if name in COUNTRY_ENTITIES else ("is_active",)
+        if not any(state.attrs[key].history.has_changes() for key in keys):
+            continue
+        was_active = _previous(state, "is_active")
+        old_country = _previous(state, "country_id") if name in COUNTRY_ENTITIES else None
+        if was_active is _UNKNOWN or old_country is _UNKNOWN:
+            entity_counters.invalidate()
+            continue
+        if was_active:
+            _add(deltas, name, old_country, -1)
+        if obj.is_active:
+            _add(deltas, name, getattr(obj, "country_id", None), 1)
+
+@event.listens_for(Session, "after_commit")
+def _apply_count_changes(session: Session) -> None:
+    deltas = session.info.pop(_DELTAS_KEY, None)
+    if deltas:
+        entity_counters.apply(Counter({key: delta for key, delta in deltas.items() if delta}))
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_count_changes(session: Session, previous_transaction: Any) -> None:
+    deltas = session.info.pop(_DELTAS_KEY, None)
+    if deltas and previous_transaction.nested:
+        # Deltas of the enclosing transaction can't be told apart from the
+        # savepoint's, so reload the counts instead of guessing
+        entity_counters.invalidate()
+
+class StatsService:
+    def get_stats(self, db: Session) -> Dict[str, int]:
+        """
+        Get the number of active entities of each type.
+        """
+        totals, _ = entity_counters.get(db)
+        return totals
+
+    def get_country_stats(self, db: Session) -> Dict[int, Dict[str, int]]:
+        """
+        Get the number of active entities of each type per country.
+
+        Returns:
+            Counts by entity type (all of COUNTRY_ENTITIES) by country ID, for
+            countries with at least one active entity
+        """
+        _, by_country = entity_counters.get(db)
+        return {
+            country_id: {name: counts.get(name, 0) for name in COUNTRY_ENTITIES}
+            for country_id, counts in by_country.items()
+        }
+
+stats_service = StatsService()
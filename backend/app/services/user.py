@@ -2,6 +2,7 @@ from typing import List, Optional, Dict, Any
 
 from sqlalchemy.orm import Session
 
+from app.auth.principal_cache import principal_cache
 from app.models.user import User, Role, Permission
 from app.schemas.user import UserCreate, UserUpdate
 from app.auth.security import get_password_hash
@@ -60,6 +61,7 @@ class UserService:
             setattr(db_user, key, value)
         
         db.commit()
+        principal_cache.invalidate_user(user_id)
         db.refresh(db_user)
         return db_user
     
@@ -73,6 +75,7 @@ class UserService:
         
         db.delete(db_user)
         db.commit()
+        principal_cache.invalidate_user(user_id)
         return True
     
     def assign_role_to_user(self, db: Session, user_id: int, role_id: int) -> Optional[User]:
@@ -87,6 +90,7 @@ class UserService:
         
         db_user.roles.append(db_role)
         db.commit()
+        principal_cache.invalidate_user(user_id)
         db.refresh(db_user)
         return db_user
     
@@ -103,6 +107,7 @@ class UserService:
         if db_role in db_user.roles:
             db_user.roles.remove(db_role)
             db.commit()
+            principal_cache.invalidate_user(user_id)
             db.refresh(db_user)
         
         return db_user
@@ -150,6 +155,8 @@ class RoleService:
             db_role.description = description
         
         db.commit()
+        if name is not None:
+            principal_cache.invalidate_all()
         db.refresh(db_role)
         return db_role
     
@@ -163,6 +170,7 @@ class RoleService:
         
         db.delete(db_role)
         db.commit()
+        principal_cache.invalidate_all()
         return True
     
     def assign_permission_to_role(self, db: Session, role_id: int, permission_id: int) -> Optional[Role]:
@@ -177,6 +185,7 @@ class RoleService:
         
         db_role.permissions.append(db_permission)
         db.commit()
+        principal_cache.invalidate_all()
         db.refresh(db_role)
         return db_role
     
@@ -193,6 +202,7 @@ class RoleService:
         if db_permission in db_role.permissions:
             db_role.permissions.remove(db_permission)
             db.commit()
+            principal_cache.invalidate_all()
             db.refresh(db_role)
         
         return db_role
@@ -240,6 +250,8 @@ class PermissionService:
             db_permission.description = description
         
         db.commit()
+        if name is not None:
+            principal_cache.invalidate_all()
         db.refresh(db_permission)
         return db_permission
     
@@ -253,6 +265,7 @@ class PermissionService:
         
         db.delete(db_permission)
         db.commit()
+        principal_cache.invalidate_all()
         return True
 
 user_service = UserService()
@@ -1,12 +1,19 @@
+import asyncio
 import logging
-import aiohttp
+import httpx
 import io
 import os
 import uuid
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.media import MediaAsset
 from app.services.media import media_service
+from app.services.cloudflare_images import cloudflare_images_service
+from app.media import variants
+from app.media.image_info import get_image_size, HEADER_READ_SIZE, HEADER_READ_LIMIT
 from app.media.r2 import r2_client
 
 logger = logging.getLogger(__name__)
@@ -74,62 +81,236 @@ async def download_and_upload_external_media(db: Session, external_url: str,
     logger.info(f"Downloading media from external URL: {external_url}")
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(external_url) as response:
-                if response.status != 200:
-                    logger.error(f"Failed to download media from {external_url}: {response.status}")
-                    return None
-                
-                # Get content type and filename
-                content_type = response.headers.get("Content-Type", "application/octet-stream")
-                content_disposition = response.headers.get("Content-Disposition", "")
-                filename = None
-                
-                # Try to extract filename from Content-Disposition header
-                if "filename=" in content_disposition:
-                    filename = content_disposition.split("filename=")[1].strip('"')
-                
-                # If filename not found, extract from URL
-                if not filename:
-                    filename = external_url.split("/")[-1].split("?")[0]
-                
-                # If still no filename, use a generic one
-                if not filename:
-                    filename = f"downloaded_media_{content_type.replace('/', '_')}"
-                
-                # Read content
-                content = await response.read()
-                content_io = io.BytesIO(content)
-                
-                # Upload to R2
-                storage_key = f"{uuid.uuid4()}{os.path.splitext(filename)[1]}"
-                upload_success = r2_client.upload_file(
-                    content_io,
-                    storage_key,
-                    content_type
-                )
-                
-                if not upload_success:
-                    logger.error(f"Failed to upload media to R2: {storage_key}")
-                    return None
-                
-                # Create media asset record in database
-                media_asset = media_service.confirm_upload(
-                    db, storage_key, filename, len(content), content_type, 
-                    entity_type, entity_id, alt_text, title
-                )
-                
-                # Generate presigned URL for the media asset
-                url = media_service.get_presigned_url(db, media_asset.id)
-                
-                return {
-                    "id": media_asset.id,
-                    "filename": media_asset.filename,
-                    "storage_key": media_asset.storage_key,
-                    "mime_type": media_asset.mime_type,
-                    "size_bytes": media_asset.size_bytes,
-                    "url": url
-                }
+        async with httpx.AsyncClient(follow_redirects=True, timeout=60.0) as session:
+            response = await session.get(external_url)
+            if response.status_code != 200:
+                logger.error(f"Failed to download media from {external_url}: {response.status_code}")
+                return None
+            
+            # Get content type and filename
+            content_type = response.headers.get("Content-Type", "application/octet-stream")
+            content_disposition = response.headers.get("Content-Disposition", "")
+            filename = None
+            
+            # Try to extract filename from Content-Disposition header
+            if "filename=" in content_disposition:
+                filename = content_disposition.split("filename=")[1].strip('"')
+            
+            # If filename not found, extract from URL
+            if not filename:
+                filename = external_url.split("/")[-1].split("?")[0]
+            
+            # If still no filename, use a generic one
+            if not filename:
+                filename = f"downloaded_media_{content_type.replace('/', '_')}"
+            
+            # Read content
+            content = response.content
+            content_io = io.BytesIO(content)
+            
+            # Upload to R2
+            storage_key = f"{uuid.uuid4()}{os.path.splitext(filename)[1]}"
+            upload_success = await r2_client.upload_file_async(
+                content_io,
+                storage_key,
+                content_type
+            )
+            
+            if not upload_success:
+                logger.error(f"Failed to upload media to R2: {storage_key}")
+                return None
+            
+            # Create media asset record in database
+            media_asset = media_service.confirm_upload(
+                db, storage_key, filename, len(content), content_type, 
+                entity_type, entity_id, alt_text, title
+            )
+            
+            # Generate presigned URL for the media asset
+            url = media_service.get_presigned_url(db, media_asset.id)
+            
+            return {
+                "id": media_asset.id,
+                "filename": media_asset.filename,
+                "storage_key": media_asset.storage_key,
+                "mime_type": media_asset.mime_type,
+                "size_bytes": media_asset.size_bytes,
+                "url": url
+            }
     except Exception as e:
         logger.exception(f"Error downloading and uploading external media: {e}")
         return None
+
+async def _read_image_head(media_asset: MediaAsset, size: int) -> Optional[bytes]:
+    """
+    Read the leading bytes of a media asset from wherever it is stored.
+    """
+    if media_asset.file_path.startswith("cloudflare://"):
+        return await cloudflare_images_service.read_image_head_async(media_asset.storage_key, size)
+    return await r2_client.read_file_range_async(media_asset.storage_key, 0, size - 1)
+
+async def read_media_dimensions(media_asset: MediaAsset) -> Optional[Tuple[int, int]]:
+    """
+    Read the width and height of an image asset from its headers.
+    
+    Only the start of the file is fetched; the read size is grown for images whose
+    headers are pushed back by large metadata blocks.
+    
+    Args:
+        media_asset: Media asset to inspect
+        
+    Returns:
+        (width, height) tuple or None if the dimensions couldn't be determined
+    """
+    size = HEADER_READ_SIZE
+    while size <= HEADER_READ_LIMIT:
+        data = await _read_image_head(media_asset, size)
+        if not data:
+            return None
+        dimensions = get_image_size(data)
+        if dimensions or len(data) < size:
+            return dimensions
+        size *= 4
+    return None
+
+async def _read_original(media_asset: MediaAsset) -> Optional[bytes]:
+    """
+    Download the original file of a media asset.
+    """
+    if media_asset.file_path.startswith("cloudflare://"):
+        return await cloudflare_images_service.get_image_blob_async(media_asset.storage_key)
+    return await r2_client.read_file_async(media_asset.storage_key)
+
+async def generate_media_variants(media_asset: MediaAsset) -> Optional[Dict[str, Any]]:
+    """
+    Render resized variants of an image asset and upload them to R2.
+    
+    Args:
+        media_asset: Media asset to generate variants for
+        
+    Returns:
+        Variant manifest or None if no variants were generated
+    """
+    data = await _read_original(media_asset)
+    if not data:
+        return None
+    
+    rendered = await variants.render_variants_async(data)
+    
+    async def upload(variant: Dict[str, Any]) -> Dict[str, Any]:
+        key = variants.variant_key(media_asset.id, variant["width"], variant["format"])
+        uploaded = await r2_client.upload_file_async(
+            io.BytesIO(variant["data"]),
+            key,
+            variants.VARIANT_CONTENT_TYPES[variant["format"]]
+        )
+        if not uploaded:
+            raise RuntimeError(f"Failed to upload variant {key}")
+        return {
+            "key": key,
+            "width": variant["width"],
+            "height": variant["height"],
+            "format": variant["format"],
+            "size": len(variant["data"])
+        }
+    
+    entries: List[Dict[str, Any]] = await asyncio.gather(*(upload(variant) for variant in rendered))
+    return {
+        "width": media_asset.width,
+        "height": media_asset.height,
+        "variants": entries
+    }
+
+def is_image(media_asset: MediaAsset) -> bool:
+    """
+    Check whether a media asset is an image the processing stage can handle.
+    """
+    return bool(media_asset.content_type and media_asset.content_type.startswith("image/"))
+
+async def process_media_image(media_id: int) -> Optional[dict]:
+    """
+    Image processing stage for a newly stored media asset.
+    
+    Populates width and height from the image headers and, when enabled, generates
+    resized variants into R2 and stores their manifest on the asset. Runs outside
+    the request, so it uses its own database session.
+    
+    Args:
+        media_id: ID of the media asset
+        
+    Returns:
+        Dictionary with the dimensions and variant count, or None if processing failed
+    """
+    db = SessionLocal()
+    try:
+        media_asset = db.query(MediaAsset).filter(MediaAsset.id == media_id).first()
+        if not media_asset or not media_asset.storage_key:
+            logger.warning(f"Media asset {media_id} not found for image processing")
+            return None
+        if not is_image(media_asset):
+            logger.info(f"Skipping image processing of non-image media asset {media_id}")
+            return None
+        
+        if media_asset.width is None or media_asset.height is None:
+            # Counted before reading so assets that keep failing (or crash the
+            # task) drop out of process_unprocessed_media after a few runs
+            media_asset.processing_attempts = (media_asset.processing_attempts or 0) + 1
+            db.commit()
+            dimensions = await read_media_dimensions(media_asset)
+            if not dimensions:
+                logger.warning(f"Could not determine dimensions of media asset {media_id}")
+                return None
+            media_asset.width, media_asset.height = dimensions
+            db.commit()
+        
+        if settings.MEDIA_VARIANTS_ENABLED and variants.is_available() and r2_client.is_configured():
+            manifest = await generate_media_variants(media_asset)
+            if manifest is not None:
+                media_asset.variant_manifest = manifest
+                db.commit()
+        
+        logger.info(f"Processed media asset {media_id}: {media_asset.width}x{media_asset.height}")
+        return {
+            "id": media_id,
+            "width": media_asset.width,
+            "height": media_asset.height,
+            "variants": len((media_asset.variant_manifest or {}).get("variants", []))
+        }
+    except Exception as e:
+        logger.exception(f"Error processing media asset {media_id}: {e}")
+        return None
+    finally:
+        db.close()
+
+async def process_unprocessed_media(limit: int = 500) -> dict:
+    """
+    Run the image processing stage for image assets that have no dimensions yet.
+    
+    Assets are taken in ID order; ones that already failed
+    MEDIA_PROCESSING_MAX_ATTEMPTS times are left out.
+    
+    Args:
+        limit: Maximum number of assets to process
+        
+    Returns:
+        Dictionary with the number of assets processed and failed
+    """
+    db = SessionLocal()
+    try:
+        media_ids = [
+            media_id for (media_id,) in db.query(MediaAsset.id).filter(
+                MediaAsset.is_active == True,
+                MediaAsset.width.is_(None),
+                MediaAsset.content_type.like("image/%"),
+                MediaAsset.processing_attempts < settings.MEDIA_PROCESSING_MAX_ATTEMPTS
+            ).order_by(MediaAsset.id).limit(limit).all()
+        ]
+    finally:
+        db.close()
+    
+    processed = 0
+    for media_id in media_ids:
+        if await process_media_image(media_id):
+            processed += 1
+    
+    return {"processed": processed, "failed": len(media_ids) - processed}
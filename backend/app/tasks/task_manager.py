@@ -1,21 +1,33 @@
 import logging
 import asyncio
-from typing import Dict, Any, Callable, Awaitable, List, Optional
+from typing import Dict, Any, Callable, Awaitable, List, Optional, Set
 from datetime import datetime
 import uuid
 
+from app.core.config import settings
+from app.core.metrics import BACKGROUND_TASKS_TRACKED
+
 logger = logging.getLogger(__name__)
 
 class TaskManager:
     """
     Task manager for handling background tasks.
+    
+    Finished tasks are kept for status queries, up to `max_kept`; beyond that the
+    oldest finished tasks are dropped.
     """
     
-    def __init__(self):
+    def __init__(self, max_kept: int = 1000):
         """
         Initialize the task manager.
+        
+        Args:
+            max_kept: Maximum number of finished tasks kept
         """
         self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.max_kept = max_kept
+        # The event loop only keeps weak references to tasks
+        self._running: Set[asyncio.Task] = set()
     
     async def add_task(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> str:
         """
@@ -46,8 +58,11 @@ class TaskManager:
         self.tasks[task_id] = task_info
         
         # Create and start the task
-        asyncio.create_task(self._run_task(task_id, func, *args, **kwargs))
+        task = asyncio.create_task(self._run_task(task_id, func, *args, **kwargs))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
         
+        self._prune()
         return task_id
     
     async def _run_task(self, task_id: str, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> None:
@@ -117,6 +132,22 @@ class TaskManager:
             del self.tasks[task_id]
         
         return len(completed_task_ids)
+    
+    def _prune(self) -> None:
+        """
+        Drop the oldest finished tasks beyond `max_kept`.
+        """
+        excess = len(self.tasks) - self.max_kept
+        if excess <= 0:
+            return
+        # Tasks are stored in creation order
+        finished_task_ids = [
+            task_id for task_id, task in self.tasks.items()
+            if task["status"] in ["completed", "failed"]
+        ][:excess]
+        for task_id in finished_task_ids:
+            del self.tasks[task_id]
 
 # Create a singleton instance
-task_manager = TaskManager()
+task_manager = TaskManager(max_kept=settings.TASKS_MAX_KEPT)
+BACKGROUND_TASKS_TRACKED.set_function(lambda: len(task_manager.tasks))
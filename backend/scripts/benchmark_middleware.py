@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Script to benchmark the request middleware stack.
+
+Compares a bare app, the previous stack of BaseHTTPMiddleware-based request
+logging, Prometheus and correlation-ID middlewares, and the fused
+RequestContextMiddleware. Requests are sent straight to the ASGI app (no network)
+and logs are written to /dev/null with the app's JSON formatter, so the numbers
+reflect middleware cost only.
+
+Usage:
+    python scripts/benchmark_middleware.py [--requests 20000]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI, Request
+from prometheus_client import CollectorRegistry, Counter, Histogram
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.logging import JSONFormatter, request_id_var
+from app.core.middleware import RequestContextMiddleware
+
+# Separate registry so the legacy middleware doesn't clash with the app metrics
+legacy_registry = CollectorRegistry()
+LEGACY_COUNT = Counter("legacy_requests_total", "Requests", ["method", "endpoint", "status_code"],
+                       registry=legacy_registry)
+LEGACY_LATENCY = Histogram("legacy_request_duration_seconds", "Latency", ["method", "endpoint"],
+                           registry=legacy_registry)
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous request logging middleware, for comparison."""
+
+    async def dispatch(self, request: Request, call_next):
+        logger = logging.getLogger("api.request")
+        request_id = str(uuid.uuid4())
+        request_id_var.set(request_id)
+        start_time = time.time()
+        logger.info(
+            f"Request started: {request.method} {request.url.path}",
+            extra={"request": {
+                "id": request_id,
+                "method": request.method,
+                "path": request.url.path,
+                "query": str(request.query_params),
+                "headers": dict(request.headers),
+                "client": request.client.host if request.client else None,
+            }},
+        )
+        response = await call_next(request)
+        logger.info(
+            f"Request completed: {request.method} {request.url.path} {response.status_code}",
+            extra={"response": {
+                "status_code": response.status_code,
+                "duration": time.time() - start_time,
+                "headers": dict(response.headers),
+            }},
+        )
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+class LegacyPrometheusMiddleware(BaseHTTPMiddleware):
+    """The previous Prometheus middleware, for comparison."""
+
+    async def dispatch(self, request: Request, call_next):
+        method = request.method
+        path = request.url.path
+        start_time = time.time()
+        response = await call_next(request)
+        LEGACY_COUNT.labels(method=method, endpoint=path, status_code=response.status_code).inc()
+        LEGACY_LATENCY.labels(method=method, endpoint=path).observe(time.time() - start_time)
+        return response
+
+async def legacy_correlation_id(request: Request, call_next):
+    """The previous correlation ID middleware, for comparison."""
+    response = await call_next(request)
+    response.headers["X-Correlation-ID"] = request.headers.get("X-Correlation-ID", "")
+    return response
+
+def create_app(stack: str) -> FastAPI:
+    """Create a minimal app with a parameterised JSON route and the given middleware stack."""
+    app = FastAPI()
+    if stack == "legacy":
+        app.add_middleware(LegacyRequestLoggingMiddleware)
+        app.add_middleware(LegacyPrometheusMiddleware)
+        app.middleware("http")(legacy_correlation_id)
+    elif stack == "fused":
+        app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id, "name": f"Item {item_id}"}
+
+    return app
+
+async def run(app, requests: int) -> float:
+    """Send requests straight to the ASGI app and return the elapsed seconds."""
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for i in range(requests):
+        received = False
+
+        async def receive():
+            # Deliver the (empty) body once, then report the client as gone
+            nonlocal received
+            if received:
+                return {"type": "http.disconnect"}
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/items/{i}",
+            "raw_path": f"/items/{i}".encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"localhost"), (b"x-correlation-id", b"benchmark")],
+            "client": ("127.0.0.1", 12345),
+            "server": ("localhost", 80),
+        }
+        await app(scope, receive, send)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the request middleware stack")
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per variant")
+    args = parser.parse_args()
+
+    handler = logging.StreamHandler(open(os.devnull, "w"))
+    handler.setFormatter(JSONFormatter())
+    logging.getLogger().addHandler(handler)
+    logging.getLogger().setLevel(logging.INFO)
+
+    variants = [
+        ("no middleware", create_app("none")),
+        ("legacy stack", create_app("legacy")),
+        ("fused ASGI", create_app("fused")),
+    ]
+
+    results = {}
+    for name, app in variants:
+        # Warm up routing and label caches
+        asyncio.run(run(app, 200))
+        results[name] = asyncio.run(run(app, args.requests))
+
+    baseline = results["no middleware"] / args.requests
+    print(f"{'variant':<20} {'req/s':>10} {'us/req':>10} {'overhead us':>12}")
+    for name, elapsed in results.items():
+        per_request = elapsed / args.requests
+        print(f"{name:<20} {args.requests / elapsed:>10.0f} {per_request * 1e6:>10.1f} "
+              f"{(per_request - baseline) * 1e6:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Script to benchmark response serialization of package lists.
+
+Compares returning ORM objects through `response_model` (validated and dumped by
+FastAPI) with pre-rendered responses from app.core.serialization, with and
+without FAST_SERIALIZATION. The packages (each with a country, holiday types,
+inclusions and exclusions) are loaded once from an in-memory SQLite database and
+requests are sent straight to the ASGI app, so the numbers reflect serialization
+cost only.
+
+Usage:
+    python scripts/benchmark_serialization.py [--items 100] [--requests 500]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+# Add the parent directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.main  # noqa: F401 - registers all models and their relationships
+from app.core.serialization import render_orm
+from app.db.database import Base
+from app.models.country import Country
+from app.models.holiday_type import HolidayType
+from app.models.inclusion_exclusion import Exclusion, Inclusion
+from app.models.package import Package
+from app.models.region import Region
+from app.schemas.package import PackageWithCountryResponse
+from app.services.package import package_service
+
+def load_packages(items: int) -> list:
+    """Create packages in an in-memory database and load them with their relationships."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    region = Region(name="Region", slug="region")
+    db.add(region)
+    db.flush()
+    country = Country(name="Country", slug="country", region_id=region.id)
+    db.add(country)
+    db.flush()
+    holiday_types = [HolidayType(name=f"Holiday Type {i}", slug=f"holiday-type-{i}") for i in range(3)]
+    inclusions = [Inclusion(name=f"Inclusion {i}", description="Included") for i in range(5)]
+    exclusions = [Exclusion(name=f"Exclusion {i}", description="Excluded") for i in range(3)]
+    for i in range(items):
+        db.add(Package(
+            name=f"Package {i}", slug=f"package-{i}", country_id=country.id,
+            summary="A short summary of the package", description="A longer description " * 20,
+            duration_days=7, price=1999.99, itinerary="Day 1: Arrival\nDay 2: Safari",
+            holiday_types=holiday_types, inclusion_items=inclusions, exclusion_items=exclusions,
+        ))
+    db.commit()
+    db.expunge_all()
+    return package_service.get_packages(db, limit=items)
+
+def create_app(packages: list) -> FastAPI:
+    """Create an app serving the same packages through both serialization paths."""
+    app = FastAPI()
+
+    @app.get("/response-model", response_model=List[PackageWithCountryResponse])
+    def response_model():
+        return packages
+
+    @app.get("/prerendered", response_model=List[PackageWithCountryResponse])
+    def prerendered():
+        return render_orm(packages, PackageWithCountryResponse)
+
+    return app
+
+async def run(app: FastAPI, path: str, requests: int) -> float:
+    """Send requests straight to the ASGI app and return the elapsed seconds."""
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        received = False
+
+        async def receive():
+            nonlocal received
+            if received:
+                return {"type": "http.disconnect"}
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"localhost")],
+            "client": ("127.0.0.1", 12345),
+            "server": ("localhost", 80),
+        }
+        await app(scope, receive, send)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark package list serialization")
+    parser.add_argument("--items", type=int, default=100, help="Packages per response")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per variant")
+    args = parser.parse_args()
+
+    app = create_app(load_packages(args.items))
+    variants = [
+        ("response_model", "/response-model", True),
+        ("prerendered (validated)", "/prerendered", False),
+        ("prerendered (orjson)", "/prerendered", True),
+    ]
+
+    results = {}
+    for name, path, fast in variants:
+        with patch("app.core.serialization.settings.FAST_SERIALIZATION", fast):
+            asyncio.run(run(app, path, 20))
+            results[name] = asyncio.run(run(app, path, args.requests))
+
+    baseline = results["response_model"]
+    print(f"{args.items} packages per response, {args.requests} requests per variant")
+    print(f"{'variant':<26} {'req/s':>8} {'ms/req':>8} {'speedup':>8}")
+    for name, elapsed in results.items():
+        print(f"{name:<26} {args.requests / elapsed:>8.0f} {elapsed / args.requests * 1000:>8.2f} "
+              f"{baseline / elapsed:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Script to check that the hot read paths use indexes.
+
+Runs each service call in app.db.query_plans.HOT_PATHS, explains the queries it
+makes and exits with status 1 if any of them scans a hot table. By default the
+schema is created in an in-memory SQLite database and seeded with a catalog
+(several countries with packages, group trips and departures, price charts,
+hotels, attractions, accommodations, media and blog posts), then analyzed so
+the planner has table statistics. `--database-url` checks an existing database
+instead; nothing is written to it.
+
+Usage:
+    python scripts/check_query_plans.py [--countries 10] [--per-country 20] [--database-url URL] [--verbose]
+"""
+import argparse
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import app.main  # noqa: F401 - registers all models and their relationships
+from app.db.database import Base
+from app.db.query_plans import HOT_PATHS, capture_statements, check_query_plans, explain
+from app.models.accommodation import Accommodation
+from app.models.attraction import Attraction
+from app.models.blog import BlogPost
+from app.models.country import Country
+from app.models.group_trip import GroupTrip, GroupTripDeparture
+from app.models.hotel import Hotel
+from app.models.media import MediaAsset
+from app.models.package import Package
+from app.models.package_price_chart import PackagePriceChart
+from app.models.region import Region
+from app.models.user import User
+
+def seed(db: Session, countries: int, per_country: int) -> None:
+    """Create a catalog where about 10% of the rows are featured and 10% inactive."""
+    rng = random.Random(42)
+    start = datetime(2026, 1, 1)
+    user = User(email="seed@example.com", hashed_password="x")
+    region = Region(name="Region", slug="region")
+    db.add_all([user, region])
+    db.flush()
+
+    for c in range(countries):
+        country = Country(name=f"Country {c}", slug=f"country-{c}", region_id=region.id)
+        db.add(country)
+        db.flush()
+        for i in range(per_country):
+            key = f"{c}-{i}"
+            flags = {"is_active": rng.random() > 0.1, "is_featured": rng.random() < 0.1}
+            media = [MediaAsset(filename=f"{key}.jpg", file_path=f"media/{key}.jpg", created_by_id=user.id,
+                                entity_type="package", entity_id=i) for _ in range(2)]
+            package = Package(name=f"Package {key}", slug=f"package-{key}", country_id=country.id,
+                              created_at=start - timedelta(days=rng.randrange(365)), media_assets=media, **flags)
+            package.price_charts = [
+                PackagePriceChart(title=f"Season {s}", start_date=start + timedelta(days=90 * s),
+                                  end_date=start + timedelta(days=90 * s + 89), price=1000 + 100 * s)
+                for s in range(4)
+            ]
+            group_trip = GroupTrip(name=f"Group Trip {key}", slug=f"group-trip-{key}", country_id=country.id, **flags)
+            group_trip.departures = [
+                GroupTripDeparture(start_date=start + timedelta(days=30 * d), end_date=start + timedelta(days=30 * d + 10),
+                                   available_slots=12)
+                for d in range(6)
+            ]
+            db.add_all([
+                package,
+                group_trip,
+                Hotel(name=f"Hotel {key}", slug=f"hotel-{key}", country_id=country.id, is_active=flags["is_active"],
+                      media_assets=[MediaAsset(filename=f"hotel-{key}.jpg", file_path=f"media/hotel-{key}.jpg",
+                                               created_by_id=user.id)]),
+                Attraction(name=f"Attraction {key}", slug=f"attraction-{key}", country_id=country.id,
+                           is_active=flags["is_active"]),
+                Accommodation(name=f"Accommodation {key}", slug=f"accommodation-{key}", country_id=country.id,
+                              is_active=flags["is_active"]),
+                BlogPost(title=f"Post {key}", slug=f"post-{key}", content="Content", author_id=user.id,
+                         is_published=rng.random() > 0.2),
+            ])
+    db.commit()
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the hot read paths use indexes")
+    parser.add_argument("--countries", type=int, default=10, help="Countries to seed")
+    parser.add_argument("--per-country", type=int, default=20, help="Rows of each entity type per country")
+    parser.add_argument("--database-url", help="Check an existing database instead of a seeded SQLite one")
+    parser.add_argument("--verbose", action="store_true", help="Print the plan of every query")
+    args = parser.parse_args()
+
+    if args.database_url:
+        engine = create_engine(args.database_url)
+    else:
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as db:
+            seed(db, args.countries, args.per_country)
+            db.execute(text("ANALYZE"))
+            db.commit()
+
+    with Session(engine) as db:
+        if args.verbose:
+            for path in HOT_PATHS:
+                with capture_statements(db) as statements:
+                    path.run(db)
+                for statement, parameters in statements:
+                    print(f"[{path.name}] {' '.join(statement.split())[:120]}")
+                    for line in explain(db.connection(), statement, parameters):
+                        print(f"    {line}")
+        failures = check_query_plans(db)
+        db.rollback()
+
+    for name, problems in failures.items():
+        for problem in problems:
+            print(f"FAIL {name}: {problem}")
+    print(f"{len(HOT_PATHS) - len(failures)}/{len(HOT_PATHS)} hot paths use indexes on {engine.dialect.name}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Script to profile the application's startup (import) time.
+
+Imports a module (app.main by default) in fresh interpreters with
+`python -X importtime` and prints the wall-clock import time, the slowest
+packages and application modules by self time, and which optional heavy
+dependencies were loaded at import.
+
+Usage:
+    python scripts/profile_startup.py [--module app.main] [--runs 3] [--top 15]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Dependencies that should only be loaded when the feature using them is used
+OPTIONAL_MODULES = [
+    "boto3",
+    "botocore.client",
+    "meilisearch",
+    "requests",
+    "aiohttp",
+    "opentelemetry",
+    "opentelemetry.sdk",
+    "opentelemetry.exporter.otlp",
+    "grpc",
+]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+def run_import(module: str) -> Tuple[float, List[Tuple[str, int, int]], Dict[str, bool]]:
+    """
+    Import a module in a fresh interpreter.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Tuple of wall-clock seconds, (module, self us, cumulative us) rows and
+        which optional modules were loaded
+    """
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print('import-seconds', time.perf_counter() - start)\n"
+        f"print('optional-loaded', ','.join(m for m in {OPTIONAL_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        # Keep the app's startup logs out of the output
+        env={**os.environ, "LOG_LEVEL": "WARNING"},
+    )
+    if result.returncode != 0:
+        sys.exit(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    output = dict(line.partition(" ")[::2] for line in result.stdout.splitlines()
+                  if line.startswith(("import-seconds ", "optional-loaded ")))
+    loaded = set(filter(None, output["optional-loaded"].split(",")))
+    rows = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            rows.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return float(output["import-seconds"]), rows, {name: name in loaded for name in OPTIONAL_MODULES}
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile application import time")
+    parser.add_argument("--module", default="app.main", help="Module to import")
+    parser.add_argument("--runs", type=int, default=3, help="Number of fresh interpreters")
+    parser.add_argument("--top", type=int, default=15, help="Number of rows per table")
+    args = parser.parse_args()
+
+    # The first run also warms the bytecode cache
+    run_import(args.module)
+    timings = []
+    for _ in range(args.runs):
+        seconds, rows, loaded = run_import(args.module)
+        timings.append(seconds)
+
+    print(f"Import of {args.module}: median {statistics.median(timings) * 1000:.0f}ms "
+          f"over {args.runs} runs (min {min(timings) * 1000:.0f}ms)")
+
+    packages: Counter = Counter()
+    for name, self_us, _ in rows:
+        packages[name.split(".")[0]] += self_us
+    print(f"\nSlowest packages by self time (last run):")
+    for name, self_us in packages.most_common(args.top):
+        print(f"  {self_us / 1000:8.1f}ms  {name}")
+
+    print(f"\nSlowest application modules by self time (last run):")
+    app_rows = sorted((row for row in rows if row[0].split(".")[0] == "app"), key=lambda row: -row[1])
+    for name, self_us, cumulative_us in app_rows[:args.top]:
+        print(f"  {self_us / 1000:8.1f}ms  {name} (cumulative {cumulative_us / 1000:.1f}ms)")
+
+    print("\nOptional dependencies loaded at import:")
+    for name, is_loaded in loaded.items():
+        print(f"  {'yes' if is_loaded else 'no ':3}  {name}")
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,15 @@
 
 echo "Running database migrations..."
 
+# Apply the committed migrations first: autogenerate needs an up-to-date database
+echo "Applying migrations..."
+alembic upgrade head
+
 # Generate new migration if there are model changes
 echo "Checking for model changes..."
 alembic revision --autogenerate -m "Auto-generated migration"
 
-# Apply all migrations
-echo "Applying migrations..."
+# Apply the generated migration, if any
 alembic upgrade head
 
 echo "Migrations completed successfully!"
@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
@@ -89,3 +90,61 @@ def test_refresh_token(client: TestClient, token_headers):
     assert "access_token" in tokens
     assert "refresh_token" in tokens
     assert tokens["token_type"] == "bearer"
+
+def test_permission_changes_invalidate_cached_principal(client: TestClient, db: Session, test_user, token_headers):
+    """Test that granting and revoking permissions takes effect immediately."""
+    from app.services.user import permission_service, role_service, user_service
+
+    url = f"{settings.API_V1_STR}/diagnostics/slow-requests"
+    assert client.get(url, headers=token_headers).status_code == 403
+
+    role = role_service.create_role(db, "operator")
+    permission = permission_service.create_permission(db, "system:diagnostics")
+    user_service.assign_role_to_user(db, test_user["id"], role.id)
+    assert client.get(url, headers=token_headers).status_code == 403
+
+    role_service.assign_permission_to_role(db, role.id, permission.id)
+    assert client.get(url, headers=token_headers).status_code == 200
+
+    role_service.remove_permission_from_role(db, role.id, permission.id)
+    assert client.get(url, headers=token_headers).status_code == 403
+
+def test_authorization_uses_cached_principal(client: TestClient, superuser_token_headers):
+    """Test that repeated authorized requests only load the user row."""
+    url = f"{settings.API_V1_STR}/diagnostics/slow-requests"
+    with patch("app.core.middleware.settings.DEBUG", True):
+        client.get(url, headers=superuser_token_headers)
+        response = client.get(url, headers=superuser_token_headers)
+
+    assert response.status_code == 200
+    assert '"1 queries"' in response.headers["Server-Timing"]
+
+def test_login_rehashes_outdated_password_hash(client: TestClient, db: Session, test_user):
+    """Test that a hash with a different bcrypt cost factor is replaced on login."""
+    from app.auth.security import pwd_context
+
+    user = db.get(User, test_user["id"])
+    user.hashed_password = pwd_context.hash("password", rounds=4)
+    db.commit()
+
+    response = client.post(
+        f"{settings.API_V1_STR}/auth/login",
+        data={"username": test_user["email"], "password": "password"},
+    )
+    assert response.status_code == 200
+
+    db.refresh(user)
+    assert user.hashed_password.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+    assert pwd_context.verify("password", user.hashed_password)
+
+def test_login_rejected_when_password_hash_pool_is_full(client: TestClient, test_user):
+    """Test that logins fail fast with 503 when the hashing pool is saturated."""
+    from app.auth.password_hashing import password_hash_pool
+
+    with patch.object(password_hash_pool, "max_pending", 0):
+        response = client.post(
+            f"{settings.API_V1_STR}/auth/login",
+            data={"username": test_user["email"], "password": "password"},
+        )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,60 @@
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.attraction import Attraction
+from tests.api.test_query_counts import count_queries, create_catalog
+
+def test_read_packages_by_ids(client: TestClient, db: Session):
+    """Test fetching packages by ID in the order requested, formatted as single packages."""
+    ids = create_catalog(db, count=3)
+    first_id = ids["package_id"]
+
+    response = client.get(f"{settings.API_V1_STR}/packages/?ids={first_id + 2},{first_id},999&slugs=trip-1,trip-0")
+    assert response.status_code == 200
+    packages = response.json()
+    assert [package["id"] for package in packages] == [first_id + 2, first_id, first_id + 1]
+
+    single = client.get(f"{settings.API_V1_STR}/packages/{first_id}").json()
+    assert packages[1] == single
+
+def test_batch_reads_run_one_query_per_type(client: TestClient, db: Session):
+    """Test that batch reads run as many queries as a single-item read."""
+    ids = create_catalog(db, count=5)
+    package_ids = ",".join(str(ids["package_id"] + i) for i in range(5))
+    assert count_queries(client, f"/packages/?ids={package_ids}") == 4
+    assert count_queries(client, "/group-trips/?slugs=trip-0,trip-1,trip-2,trip-3,trip-4") == 3
+
+def test_batch_get_mixed_types(client: TestClient, db: Session):
+    """Test fetching entities of several types in one request."""
+    ids = create_catalog(db, count=2)
+    db.add(Attraction(name="Test Attraction", slug="test-attraction", country_id=ids["country_id"]))
+    db.commit()
+
+    response = client.post(f"{settings.API_V1_STR}/batch/get", json={
+        "packages": {"ids": [ids["package_id"]]},
+        "group_trips": {"slugs": ["trip-1", "missing"]},
+        "attractions": {"slugs": ["test-attraction"]},
+        "hotels": {"ids": [999]},
+    })
+    assert response.status_code == 200
+    result = response.json()
+    assert set(result) == {"packages", "group_trips", "attractions", "hotels"}
+    assert result["packages"][0]["country"]["name"] == "Test Country"
+    assert [trip["slug"] for trip in result["group_trips"]] == ["trip-1"]
+    assert result["attractions"][0]["gallery_images"] == []
+    assert result["hotels"] == []
+
+def test_batch_reads_reject_invalid_keys(client: TestClient):
+    """Test that non-integer IDs and too many keys are rejected."""
+    response = client.get(f"{settings.API_V1_STR}/packages/?ids=1,abc")
+    assert response.status_code == 400
+
+    with patch("app.api.api_v1.endpoints.batch.settings.BATCH_MAX_KEYS", 2):
+        response = client.get(f"{settings.API_V1_STR}/hotels/?ids=1,2,3")
+        assert response.status_code == 400
+        response = client.post(f"{settings.API_V1_STR}/batch/get", json={
+            "packages": {"ids": [1, 2]}, "countries": {"slugs": ["kenya"]},
+        })
+        assert response.status_code == 400
@@ -0,0 +1,144 @@
+import asyncio
+import pytest
+import httpx
+from unittest.mock import patch
+
+from app.services.cloudflare_images import CloudflareImagesService, _endpoint_label
+
+def make_service(handler) -> CloudflareImagesService:
+    """Create a service whose HTTP clients are backed by a mock transport."""
+    service = CloudflareImagesService()
+    service.retry_backoff = 0
+    service._client = httpx.Client(
+        base_url=service._account_url(),
+        transport=httpx.MockTransport(handler),
+    )
+    return service
+
+def test_make_request_retries_rate_limited_requests():
+    """Test that 429 responses are retried honoring Retry-After."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "2"})
+        return httpx.Response(200, json={"success": True, "result": {"id": "abc"}})
+
+    service = make_service(handler)
+    with patch("app.services.cloudflare_images.time.sleep") as mock_sleep:
+        response = service.get_image("abc")
+
+    assert response["result"]["id"] == "abc"
+    assert len(calls) == 2
+    mock_sleep.assert_called_once_with(2.0)
+
+def test_make_request_gives_up_after_max_retries():
+    """Test that persistent server errors are raised once retries are exhausted."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503)
+
+    service = make_service(handler)
+    service.max_retries = 2
+    with pytest.raises(httpx.HTTPStatusError):
+        service.list_variants()
+
+    assert len(calls) == 3
+
+def test_make_request_does_not_retry_uploads_on_server_errors():
+    """Test that a 5xx or a dropped connection on an upload is not retried."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    service = make_service(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        service.upload_image(b"image-bytes", "photo.jpg")
+    with pytest.raises(httpx.ReadTimeout):
+        service.upload_image(b"image-bytes", "photo.jpg")
+
+    assert len(calls) == 2
+
+def test_make_request_retries_uploads_that_were_not_processed():
+    """Test that uploads are retried on 429 and on connect errors."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429)
+        if len(calls) == 2:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"success": True, "result": {"id": "img-1"}})
+
+    service = make_service(handler)
+    response = service.upload_image(b"image-bytes", "photo.jpg")
+
+    assert response["result"]["id"] == "img-1"
+    assert len(calls) == 3
+
+def test_upload_image_async_sends_multipart_form():
+    """Test that async uploads send the file and form fields."""
+    captured = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured["path"] = request.url.path
+        captured["body"] = request.read()
+        return httpx.Response(200, json={"success": True, "result": {"id": "img-1"}})
+
+    service = CloudflareImagesService()
+
+    async def upload():
+        service._async_client = httpx.AsyncClient(
+            base_url=service._account_url(),
+            transport=httpx.MockTransport(handler),
+        )
+        service._async_client_loop = asyncio.get_running_loop()
+        try:
+            return await service.upload_image_async(b"image-bytes", "photo.jpg", require_signed_urls=False)
+        finally:
+            await service.aclose()
+
+    response = asyncio.run(upload())
+
+    assert response["result"]["id"] == "img-1"
+    assert captured["path"].endswith("/images/v1")
+    assert b"image-bytes" in captured["body"]
+    assert b"requireSignedURLs" in captured["body"]
+
+def test_endpoint_label_collapses_ids():
+    """Test that metric labels do not include image or variant IDs."""
+    assert _endpoint_label("images/v1/abc-123") == "images/v1/{id}"
+    assert _endpoint_label("images/v1/variants/thumbnail") == "images/v1/variants/{id}"
+    assert _endpoint_label("images/v2/direct_upload") == "images/v2/direct_upload"
+
+def test_generate_signed_urls_batches_with_bucketed_expiry():
+    """Test that batch signing shares one window-aligned expiry and is cached."""
+    from app.core.cloudflare_config import cloudflare_settings
+    from app.services.cloudflare_images import _sign_url
+    
+    service = CloudflareImagesService()
+    service.delivery_url = "https://imagedelivery.net/hash"
+    service.signing_key = "secret"
+    images = [("img-1", "medium"), ("img-2", "thumbnail")]
+    
+    with patch("app.services.cloudflare_images.time.time", return_value=1_000_000):
+        first = service.generate_signed_urls(images, expires_in=3600)
+    with patch("app.services.cloudflare_images.time.time", return_value=1_000_010):
+        second = service.generate_signed_urls(images, expires_in=3600)
+        single = service.generate_signed_url("img-1", "medium")
+    
+    window = cloudflare_settings.signed_url_window_seconds
+    expiry = ((1_000_000 + 3600) // window + 1) * window
+    assert first == second
+    assert single == first[("img-1", "medium")]
+    assert first[("img-1", "medium")].startswith(f"https://imagedelivery.net/hash/img-1/medium?exp={expiry}&sig=")
+    assert expiry - 1_000_000 >= 3600
+    assert _sign_url.cache_info().hits >= 2
@@ -0,0 +1,93 @@
+import gzip
+
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.compression import negotiate_encoding
+from app.core.config import settings
+from app.core.response_cache import response_cache
+from app.models.country import Country
+from app.models.package import Package
+from app.models.region import Region
+
+def create_package(db: Session, description: str = "A long description. " * 200) -> Package:
+    region = Region(name="Test Region", description="Test Description", slug="test-region")
+    db.add(region)
+    db.flush()
+    country = Country(name="Test Country", description="Test Description", slug="test-country", region_id=region.id)
+    db.add(country)
+    db.flush()
+    package = Package(name="Test Package", slug="test-package", description=description, country_id=country.id)
+    db.add(package)
+    db.commit()
+    return package
+
+def test_negotiate_encoding():
+    """Test Accept-Encoding negotiation with q-values and wildcards."""
+    encodings = ["zstd", "br", "gzip"]
+    assert negotiate_encoding("gzip, br", encodings) == "br"
+    assert negotiate_encoding("br;q=0, gzip", encodings) == "gzip"
+    assert negotiate_encoding("*", encodings) == "zstd"
+    assert negotiate_encoding("identity", encodings) is None
+    assert negotiate_encoding("", encodings) is None
+
+def test_large_responses_are_compressed(client: TestClient, db: Session):
+    """Test that large JSON responses are gzipped and small ones are not."""
+    create_package(db)
+
+    response = client.get(f"{settings.API_V1_STR}/packages/", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json()[0]["slug"] == "test-package"
+
+    response = client.get(f"{settings.API_V1_STR}/packages/?fields=id", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+    response = client.get(f"{settings.API_V1_STR}/packages/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+
+def test_package_details_are_precompressed_and_invalidated(client: TestClient, db: Session, superuser_token_headers):
+    """Test that cached package details are compressed once and dropped on update."""
+    package = create_package(db)
+    url = f"{settings.API_V1_STR}/packages/details/test-package"
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    etag = response.headers["etag"]
+
+    # Served from the cache, compressed when it was first requested
+    with patch("app.core.response_cache.compress") as compress, \
+            patch("app.services.package.package_service.get_package_details_by_slug") as get_details:
+        response = client.get(url, headers={"Accept-Encoding": "gzip"})
+        compress.assert_not_called()
+        get_details.assert_not_called()
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["name"] == "Test Package"
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = client.put(
+        f"{settings.API_V1_STR}/packages/{package.id}",
+        headers=superuser_token_headers,
+        json={"summary": "Updated summary"},
+    )
+    assert response.status_code == 200
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["summary"] == "Updated summary"
+
+def test_cached_body_decompresses_to_raw_json(db: Session):
+    """Test that the precompressed body matches the rendered JSON."""
+    entry = response_cache.get_or_build("test", lambda: {"items": list(range(1000))}, {"packages"})
+    assert gzip.decompress(entry.encoded("gzip")) == entry.body
+
+    response_cache.invalidate_tables({"countries"})
+    assert response_cache.get_or_build("test", lambda: None, {"packages"}) is entry
+    response_cache.invalidate_tables({"packages"})
+    assert response_cache.get_or_build("test", lambda: None, {"packages"}) is None
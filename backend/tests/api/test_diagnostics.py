@@ -0,0 +1,128 @@
+import threading
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.core.config import settings
+from app.core.latency_budget import get_latency_budget
+
+def busy_loop(stop: threading.Event) -> None:
+    """Burn CPU until stopped so the profiler has something to sample."""
+    while not stop.is_set():
+        sum(range(1000))
+
+def test_profile_worker_returns_collapsed_stacks(client: TestClient, superuser_token_headers):
+    """Test that the worker profiler returns collapsed stacks of running code."""
+    stop = threading.Event()
+    thread = threading.Thread(target=busy_loop, args=(stop,))
+    thread.start()
+    try:
+        response = client.post(
+            f"{settings.API_V1_STR}/diagnostics/profile",
+            params={"seconds": 0.3, "interval_ms": 2},
+            headers=superuser_token_headers,
+        )
+    finally:
+        stop.set()
+        thread.join()
+
+    assert response.status_code == 200
+    assert int(response.headers["X-Profile-Samples"]) > 0
+    lines = response.text.splitlines()
+    assert any("busy_loop (" in line for line in lines)
+    stack, count = lines[0].rsplit(" ", 1)
+    assert ";" in stack and int(count) > 0
+
+def test_profile_worker_requires_permission(client: TestClient, token_headers):
+    """Test that profiling is restricted to users with the system:profile permission."""
+    response = client.post(
+        f"{settings.API_V1_STR}/diagnostics/profile",
+        params={"seconds": 0.1},
+        headers=token_headers,
+    )
+
+    assert response.status_code == 403
+
+def test_request_profiling_with_signed_token(client: TestClient, superuser_token_headers):
+    """Test that requests carrying a valid profile token are profiled."""
+    response = client.post(f"{settings.API_V1_STR}/diagnostics/profile/token", headers=superuser_token_headers)
+    assert response.status_code == 200
+    token = response.json()["token"]
+
+    response = client.get("/health", headers={"X-Profile-Token": token})
+    profile_id = response.headers["X-Profile-ID"]
+    assert profile_id == response.headers["X-Request-ID"]
+
+    response = client.get(
+        f"{settings.API_V1_STR}/diagnostics/profile/requests/{profile_id}",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+
+    response = client.get("/health", headers={"X-Profile-Token": "not-a-valid-token"})
+    assert "X-Profile-ID" not in response.headers
+
+def test_slow_requests_are_captured(client: TestClient, superuser_token_headers):
+    """Test that requests over their latency budget are counted and captured."""
+    get_latency_budget.cache_clear()
+    try:
+        with patch("app.core.latency_budget.settings.ROUTE_LATENCY_BUDGETS", "/health=0"):
+            before = REGISTRY.get_sample_value(
+                "http_latency_budget_violations_total", {"method": "GET", "endpoint": "/health"}
+            ) or 0
+            request_id = client.get("/health").headers["X-Request-ID"]
+            after = REGISTRY.get_sample_value(
+                "http_latency_budget_violations_total", {"method": "GET", "endpoint": "/health"}
+            )
+    finally:
+        get_latency_budget.cache_clear()
+
+    assert after == before + 1
+    response = client.get(
+        f"{settings.API_V1_STR}/diagnostics/slow-requests",
+        params={"sort": "recent"},
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    capture = next(c for c in response.json()["requests"] if c["request_id"] == request_id)
+    assert capture["route"] == "/health"
+    assert capture["budget_ms"] == 0
+    assert capture["duration_ms"] > 0
+
+def test_latency_budget_defaults():
+    """Test that routes without their own budget use the default budget."""
+    get_latency_budget.cache_clear()
+    try:
+        with patch("app.core.latency_budget.settings.ROUTE_LATENCY_BUDGETS", "/a=250, /b/{id}=50"):
+            assert get_latency_budget("/a") == 0.25
+            assert get_latency_budget("/b/{id}") == 0.05
+            assert get_latency_budget("/c") == settings.LATENCY_BUDGET_DEFAULT_MS / 1000
+    finally:
+        get_latency_budget.cache_clear()
+
+def test_memory_allocation_diff(client: TestClient, superuser_token_headers):
+    """Test that allocation tracing reports growth since the baseline."""
+    url = f"{settings.API_V1_STR}/diagnostics/memory"
+    response = client.get(f"{url}/allocations", headers=superuser_token_headers)
+    assert response.status_code == 409
+
+    response = client.post(f"{url}/tracing", headers=superuser_token_headers)
+    assert response.status_code == 200
+    assert response.json()["tracemalloc_enabled"] is True
+    try:
+        leak = [bytearray(1024) for _ in range(1000)]
+        response = client.get(f"{url}/allocations", params={"diff": True}, headers=superuser_token_headers)
+    finally:
+        client.delete(f"{url}/tracing", headers=superuser_token_headers)
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["diff"] is True
+    top = report["allocations"][0]
+    assert "test_diagnostics.py" in top["traceback"][0]
+    assert top["size_diff_bytes"] >= len(leak) * 1024
+
+    summary = client.get(url, headers=superuser_token_headers).json()
+    assert summary["tracemalloc_enabled"] is False
+    assert summary["peak_rss_bytes"] > 0
@@ -0,0 +1,58 @@
+import asyncio
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.core.health import HealthProber
+
+def make_prober(**checks) -> HealthProber:
+    """Create a prober with the given checks that requires the database."""
+    prober = HealthProber(interval=60, timeout=0.5, required={"database"})
+    for name, check in checks.items():
+        prober.register(name, check)
+    return prober
+
+def test_liveness(client: TestClient):
+    """Test that the liveness probe always answers."""
+    response = client.get("/health/live")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+def test_readiness_uses_cached_probe_results(client: TestClient):
+    """Test that readiness reflects the last probe round and draining."""
+    calls = []
+    prober = make_prober(database=lambda: calls.append(1) or True, search=lambda: None)
+
+    with patch("app.main.health_prober", prober):
+        assert client.get("/health/ready").json()["status"] == "starting"
+
+        asyncio.run(prober.probe())
+        response = client.get("/health/ready")
+        client.get("/health/ready")
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ready"
+        assert body["checks"]["search"]["status"] == "not_configured"
+        assert len(calls) == 1
+
+        prober.start_draining()
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "draining"
+
+def test_readiness_fails_on_failing_or_hanging_dependency():
+    """Test that failing and timed out checks make the service not ready."""
+    def fail():
+        raise ConnectionError("connection refused")
+
+    prober = make_prober(database=fail)
+    asyncio.run(prober.probe())
+    status_code, _ = prober.ready_response()
+    assert status_code == 503
+    assert "connection refused" in prober._results["database"]["error"]
+
+    prober = make_prober(database=lambda: __import__("time").sleep(1) or True)
+    asyncio.run(prober.probe())
+    assert prober._results["database"]["error"].startswith("Timed out")
+    assert prober.ready_response()[0] == 503
@@ -0,0 +1,78 @@
+import json
+import logging
+import queue
+import sys
+from unittest.mock import patch
+
+from prometheus_client import REGISTRY
+
+from app.core.logging import JSONFormatter, NonBlockingQueueHandler, get_sample_rate, is_sampled
+
+def make_record(extra=None) -> logging.LogRecord:
+    """Create a log record as a logger call with the given extra fields would."""
+    record = logging.LogRecord("api.request", logging.INFO, __file__, 1, "Request completed", None, None)
+    if extra is not None:
+        record.extra = extra
+    return record
+
+def test_formatter_redacts_sensitive_headers():
+    """Test that authorization and cookie values never reach the output."""
+    record = make_record({"request": {"headers": {
+        "Authorization": "Bearer secret-token",
+        "cookie": "session=abc",
+        "accept": "application/json",
+    }}})
+
+    output = JSONFormatter().format(record)
+
+    assert "secret-token" not in output
+    assert "session=abc" not in output
+    headers = json.loads(output)["request"]["headers"]
+    assert headers["Authorization"] == "[REDACTED]"
+    assert headers["accept"] == "application/json"
+
+def test_sample_rates_use_most_specific_logger():
+    """Test per-logger sampling rates and that warnings are always kept."""
+    get_sample_rate.cache_clear()
+    try:
+        with patch("app.core.logging.settings.LOG_SAMPLE_RATES", "api=0.5,api.request=0"):
+            assert get_sample_rate("api.request") == 0
+            assert get_sample_rate("api.other") == 0.5
+            assert get_sample_rate("app.services") == 1.0
+            assert not is_sampled("api.request", logging.INFO)
+            assert is_sampled("api.request", logging.WARNING)
+    finally:
+        get_sample_rate.cache_clear()
+
+def test_queue_handler_drops_records_when_full():
+    """Test that a full log queue drops and counts records instead of blocking."""
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    before = REGISTRY.get_sample_value("log_records_dropped_total", {"reason": "queue_full"}) or 0
+
+    handler.handle(make_record())
+    handler.handle(make_record())
+
+    assert handler.queue.qsize() == 1
+    assert REGISTRY.get_sample_value("log_records_dropped_total", {"reason": "queue_full"}) == before + 1
+
+def test_queue_handler_queues_rendered_records():
+    """Test that queued records carry the rendered message and exception, not live objects."""
+    handler = NonBlockingQueueHandler(queue.Queue())
+    payload = {"status": "pending"}
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("app", logging.ERROR, __file__, 1, "Job %s", (payload,), sys.exc_info())
+    record.extra = {"job": payload}
+
+    handler.handle(record)
+    payload["status"] = "done"
+    queued = handler.queue.get_nowait()
+
+    assert queued.args is None
+    assert queued.exc_info is None
+    assert queued.getMessage() == "Job {'status': 'pending'}"
+    output = json.loads(JSONFormatter().format(queued))
+    assert output["message"] == "Job {'status': 'pending'}"
+    assert output["job"] == {"status": "pending"}
+    assert "ValueError: boom" in output["exception"]
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import io
 from unittest.mock import patch, MagicMock
@@ -6,7 +7,16 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.models.media import MediaAsset
+from app.models.user import Permission, Role, User
 from app.services.media import media_service
+from app.tasks.media_tasks import process_media_image, process_unprocessed_media
+from tests.conftest import TestingSessionLocal
+
+def grant_permission(db: Session, email: str, permission: str) -> None:
+    """Give a user a role with the given permission."""
+    user = db.query(User).filter(User.email == email).first()
+    user.roles.append(Role(name=f"{permission} role", permissions=[Permission(name=permission)]))
+    db.commit()
 
 def test_get_media_assets(client: TestClient, db: Session, token_headers):
     """Test get media assets endpoint."""
@@ -378,3 +388,223 @@ def test_delete_media_asset(client: TestClient, db: Session, token_headers):
     finally:
         # Restore the original function
         media_service.delete_media_asset = original_delete
+
+def test_direct_upload_flow(client: TestClient, db: Session, token_headers):
+    """Test issuing a direct upload ticket and confirming the upload."""
+    grant_permission(db, "test@example.com", "media:create")
+    direct_upload_response = {
+        "success": True,
+        "result": {"id": "cf-image-1", "uploadURL": "https://upload.imagedelivery.net/cf-image-1"}
+    }
+    image_response = {"success": True, "result": {"id": "cf-image-1", "draft": False}}
+    
+    with patch('app.services.media.cloudflare_images_service.get_direct_upload_url_async') as mock_direct_upload:
+        mock_direct_upload.return_value = direct_upload_response
+        
+        response = client.post(
+            f"{settings.API_V1_STR}/media/direct-upload",
+            headers=token_headers,
+            json={
+                "filename": "beach.jpg",
+                "content_type": "image/jpeg",
+                "entity_type": "package",
+                "alt_text": "Beach"
+            }
+        )
+    
+    assert response.status_code == 200
+    upload = response.json()
+    assert upload["provider"] == "cloudflare"
+    assert upload["method"] == "POST"
+    assert upload["upload_url"] == "https://upload.imagedelivery.net/cf-image-1"
+    assert upload["storage_key"] == "cf-image-1"
+    
+    with patch('app.services.media.cloudflare_images_service.get_image') as mock_get_image, \
+            patch('app.api.api_v1.endpoints.media.process_media_image') as mock_extract:
+        mock_get_image.return_value = image_response
+        
+        response = client.post(
+            f"{settings.API_V1_STR}/media/direct-upload/confirm",
+            headers=token_headers,
+            json={"ticket": upload["ticket"]}
+        )
+        
+        assert response.status_code == 200
+        asset = response.json()
+        assert asset["storage_key"] == "cf-image-1"
+        assert asset["file_path"] == "cloudflare://cf-image-1"
+        assert asset["filename"] == "beach.jpg"
+        assert asset["alt_text"] == "Beach"
+        mock_extract.assert_called_once_with(asset["id"])
+    
+    media = db.query(MediaAsset).filter(MediaAsset.storage_key == "cf-image-1").all()
+    assert len(media) == 1
+
+def test_uploads_schedule_image_processing(client: TestClient, db: Session, token_headers):
+    """Test that server-side uploads run the image processing stage like direct uploads."""
+    media_asset = MediaAsset(
+        filename="test.jpg", file_path="media/test.jpg", storage_key="media/test.jpg",
+        content_type="image/jpeg", created_by_id=1
+    )
+    db.add(media_asset)
+    db.commit()
+    db.refresh(media_asset)
+    
+    with patch('app.services.media.media_service.create_media_asset', return_value=media_asset), \
+            patch('app.services.media.media_service.associate_media_with_entity'), \
+            patch('app.services.media.media_service.get_presigned_url', return_value=None), \
+            patch('app.api.api_v1.endpoints.media.process_media_image') as mock_process:
+        response = client.post(
+            f"{settings.API_V1_STR}/media/upload",
+            headers=token_headers,
+            files={"file": ("test.jpg", io.BytesIO(b"test"), "image/jpeg")},
+            data={"entity_type": "attraction", "entity_id": "1"}
+        )
+        
+        assert response.status_code == 200
+        mock_process.assert_called_once_with(media_asset.id)
+    
+    with patch('app.services.cloudflare_images.cloudflare_images_service.upload_image_async') as mock_upload, \
+            patch('app.api.api_v1.endpoints.cloudflare_images.process_media_image') as mock_process:
+        mock_upload.return_value = {"success": True, "result": {"id": "cf-image-3"}}
+        
+        response = client.post(
+            f"{settings.API_V1_STR}/cloudflare/images/upload-and-create-media",
+            headers=token_headers,
+            files={"file": ("photo.jpg", io.BytesIO(b"test"), "image/jpeg")},
+            data={"entity_type": "activity"}
+        )
+        
+        assert response.status_code == 200
+        mock_process.assert_called_once_with(response.json()["media_asset"]["id"])
+
+def test_confirm_direct_upload_rejects_invalid_ticket(client: TestClient, db: Session, token_headers):
+    """Test that confirming with a forged ticket fails."""
+    grant_permission(db, "test@example.com", "media:create")
+    response = client.post(
+        f"{settings.API_V1_STR}/media/direct-upload/confirm",
+        headers=token_headers,
+        json={"ticket": "not-a-ticket"}
+    )
+    
+    assert response.status_code == 400
+
+def test_confirm_direct_upload_requires_completed_upload(client: TestClient, db: Session, token_headers):
+    """Test that a ticket can't be confirmed before the browser has uploaded the file."""
+    grant_permission(db, "test@example.com", "media:create")
+    with patch('app.services.media.cloudflare_images_service.get_direct_upload_url_async') as mock_direct_upload:
+        mock_direct_upload.return_value = {
+            "success": True,
+            "result": {"id": "cf-image-2", "uploadURL": "https://upload.imagedelivery.net/cf-image-2"}
+        }
+        ticket = client.post(
+            f"{settings.API_V1_STR}/media/direct-upload",
+            headers=token_headers,
+            json={"filename": "draft.jpg", "content_type": "image/jpeg"}
+        ).json()["ticket"]
+    
+    with patch('app.services.media.cloudflare_images_service.get_image') as mock_get_image:
+        mock_get_image.return_value = {"success": True, "result": {"id": "cf-image-2", "draft": True}}
+        
+        response = client.post(
+            f"{settings.API_V1_STR}/media/direct-upload/confirm",
+            headers=token_headers,
+            json={"ticket": ticket}
+        )
+    
+    assert response.status_code == 400
+    assert db.query(MediaAsset).filter(MediaAsset.storage_key == "cf-image-2").first() is None
+
+def test_direct_upload_requires_permission_and_ticket_owner(client: TestClient, db: Session, token_headers,
+                                                            superuser_token_headers):
+    """Test that direct uploads need media:create and can only be confirmed by the ticket's user."""
+    upload_in = {"filename": "beach.jpg", "content_type": "image/jpeg"}
+    response = client.post(f"{settings.API_V1_STR}/media/direct-upload", headers=token_headers, json=upload_in)
+    assert response.status_code == 403
+    
+    with patch('app.services.media.cloudflare_images_service.get_direct_upload_url_async') as mock_direct_upload:
+        mock_direct_upload.return_value = {
+            "success": True,
+            "result": {"id": "cf-image-4", "uploadURL": "https://upload.imagedelivery.net/cf-image-4"}
+        }
+        ticket = client.post(
+            f"{settings.API_V1_STR}/media/direct-upload", headers=superuser_token_headers, json=upload_in
+        ).json()["ticket"]
+    
+    grant_permission(db, "test@example.com", "media:create")
+    with patch('app.services.media.cloudflare_images_service.get_image') as mock_get_image:
+        mock_get_image.return_value = {"success": True, "result": {"id": "cf-image-4", "draft": False}}
+        
+        response = client.post(
+            f"{settings.API_V1_STR}/media/direct-upload/confirm",
+            headers=token_headers,
+            json={"ticket": ticket}
+        )
+    
+    assert response.status_code == 403
+    assert db.query(MediaAsset).filter(MediaAsset.storage_key == "cf-image-4").first() is None
+
+def test_render_variants_and_srcset():
+    """Test local variant rendering and srcset generation."""
+    Image = pytest.importorskip("PIL.Image")
+    from app.media.variants import render_variants, build_srcset, variant_key
+    from app.media.image_info import get_image_size
+    
+    buffer = io.BytesIO()
+    Image.new("RGB", (1200, 800)).save(buffer, "JPEG")
+    data = buffer.getvalue()
+    assert get_image_size(data) == (1200, 800)
+    
+    rendered = render_variants(data, [320, 640, 1600], ["webp"], 80)
+    
+    # Widths larger than the original are skipped
+    assert [(variant["width"], variant["height"]) for variant in rendered] == [(320, 213), (640, 427)]
+    assert get_image_size(rendered[0]["data"]) == (320, 213)
+    
+    manifest = {
+        "variants": [
+            {"key": variant_key(7, variant["width"], variant["format"]), "width": variant["width"],
+             "height": variant["height"], "format": variant["format"]}
+            for variant in rendered
+        ]
+    }
+    srcset = build_srcset(manifest, "https://media.example.com/")
+    assert srcset == {
+        "webp": "https://media.example.com/variants/7/320w.webp 320w, "
+                "https://media.example.com/variants/7/640w.webp 640w"
+    }
+
+def test_process_unprocessed_media_skips_non_images_and_gives_up(db: Session):
+    """Test that batch processing only picks images, in ID order, until they fail too often."""
+    assets = [
+        MediaAsset(filename=name, file_path=f"media/{name}", storage_key=f"media/{name}",
+                   content_type=content_type, created_by_id=1)
+        for name, content_type in [
+            ("broken.jpg", "image/jpeg"),
+            ("guide.pdf", "application/pdf"),
+            ("photo.png", "image/png"),
+        ]
+    ]
+    db.add_all(assets)
+    db.commit()
+    broken, pdf, photo = [asset.id for asset in assets]
+    read = []
+
+    async def read_media_dimensions(media_asset):
+        read.append(media_asset.id)
+        return (640, 480) if media_asset.id == photo else None
+
+    with patch('app.tasks.media_tasks.SessionLocal', TestingSessionLocal), \
+            patch('app.tasks.media_tasks.read_media_dimensions', read_media_dimensions), \
+            patch.object(settings, 'MEDIA_PROCESSING_MAX_ATTEMPTS', 2):
+        assert asyncio.run(process_unprocessed_media()) == {"processed": 1, "failed": 1}
+        assert asyncio.run(process_unprocessed_media()) == {"processed": 0, "failed": 1}
+        assert asyncio.run(process_unprocessed_media()) == {"processed": 0, "failed": 0}
+        # Non-images scheduled by the upload endpoints are skipped too
+        assert asyncio.run(process_media_image(pdf)) is None
+
+    assert read == [broken, photo, broken]
+    db.expire_all()
+    assert db.get(MediaAsset, broken).processing_attempts == 2
+    assert db.get(MediaAsset, pdf).processing_attempts == 0
+    assert (db.get(MediaAsset, photo).width, db.get(MediaAsset, photo).height) == (640, 480)
@@ -0,0 +1,48 @@
+import asyncio
+import signal
+from unittest.mock import patch
+
+from app.core.memory import WorkerRecycler
+from app.tasks.task_manager import TaskManager
+
+def test_task_manager_drops_oldest_finished_tasks():
+    """Test that only the most recent finished tasks are kept."""
+    async def run():
+        manager = TaskManager(max_kept=3)
+
+        async def noop():
+            return None
+
+        task_ids = [await manager.add_task(noop) for _ in range(5)]
+        await asyncio.sleep(0)
+        # Pruning happens when tasks are added
+        blocker = asyncio.Event()
+        task_ids.append(await manager.add_task(blocker.wait))
+        blocker.set()
+        await asyncio.sleep(0)
+        return manager, task_ids
+
+    manager, task_ids = asyncio.run(run())
+
+    assert list(manager.tasks) == task_ids[-3:]
+
+def test_worker_recycled_after_max_requests():
+    """Test that the worker is sent SIGTERM once after max_requests."""
+    recycler = WorkerRecycler(max_requests=3)
+
+    with patch("app.core.memory.os.kill") as kill:
+        for _ in range(5):
+            recycler.on_request()
+
+    kill.assert_called_once()
+    assert kill.call_args.args[1] == signal.SIGTERM
+
+def test_worker_recycled_above_max_rss():
+    """Test that the worker is recycled when its RSS exceeds the limit."""
+    recycler = WorkerRecycler(max_rss_mb=1)
+
+    with patch("app.core.memory.os.kill") as kill:
+        for _ in range(WorkerRecycler.RSS_CHECK_INTERVAL):
+            recycler.on_request()
+
+    kill.assert_called_once()
@@ -0,0 +1,42 @@
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.core.config import settings
+from app.core.metrics import UNMATCHED_ROUTE
+
+def get_request_count(endpoint: str, status_code: str = "200") -> float:
+    """Get the recorded request count for a route template."""
+    value = REGISTRY.get_sample_value(
+        "http_requests_total",
+        {"method": "GET", "endpoint": endpoint, "status_code": status_code},
+    )
+    return value or 0.0
+
+def test_metrics_are_labelled_by_route_template(client: TestClient):
+    """Test that request metrics use the route template instead of the raw path."""
+    template = f"{settings.API_V1_STR}/countries/region/{{region_id}}"
+    before = get_request_count(template)
+
+    client.get(f"{settings.API_V1_STR}/countries/region/1")
+    client.get(f"{settings.API_V1_STR}/countries/region/2")
+
+    assert get_request_count(template) == before + 2
+    assert get_request_count(f"{settings.API_V1_STR}/countries/region/1") == 0
+
+def test_metrics_distinguish_routes_sharing_an_endpoint(client: TestClient):
+    """Test that an endpoint registered under several paths is labelled by the matched path."""
+    template = f"{settings.API_V1_STR}/countries"
+    before = get_request_count(template)
+
+    client.get(template)
+
+    assert get_request_count(template) == before + 1
+
+def test_metrics_collapse_unmatched_paths(client: TestClient):
+    """Test that unknown paths do not create a time series per URL."""
+    before = get_request_count(UNMATCHED_ROUTE, "404")
+
+    client.get("/does-not-exist/12345")
+
+    assert get_request_count(UNMATCHED_ROUTE, "404") == before + 1
+    assert get_request_count("/does-not-exist/12345", "404") == 0
@@ -0,0 +1,40 @@
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.db.query_stats import classify_statement
+
+def test_request_and_correlation_ids_are_added(client: TestClient):
+    """Test that responses carry a request ID and echo the correlation ID."""
+    response = client.get("/health", headers={"X-Correlation-ID": "abc-123"})
+
+    assert response.status_code == 200
+    assert response.headers["X-Correlation-ID"] == "abc-123"
+    assert len(response.headers["X-Request-ID"]) == 32
+
+def test_correlation_id_defaults_to_request_id(client: TestClient):
+    """Test that the request ID is used as correlation ID when none is sent."""
+    response = client.get("/health")
+
+    assert response.headers["X-Correlation-ID"] == response.headers["X-Request-ID"]
+
+def test_server_timing_reports_queries_in_debug_mode(client: TestClient):
+    """Test that debug mode exposes the request's query count and DB time."""
+    with patch("app.core.middleware.settings.DEBUG", True):
+        response = client.get(f"{settings.API_V1_STR}/countries/")
+
+    assert response.status_code == 200
+    server_timing = response.headers["Server-Timing"]
+    assert server_timing.startswith("db;dur=")
+    assert '"1 queries"' in server_timing
+
+    assert "Server-Timing" not in client.get(f"{settings.API_V1_STR}/countries/").headers
+
+def test_classify_statement():
+    """Test that statements are labelled by operation and main table."""
+    assert classify_statement('SELECT packages.id FROM "packages" WHERE packages.id = ?') == ("select", "packages")
+    assert classify_statement("INSERT INTO media_assets (url) VALUES (?)") == ("insert", "media_assets")
+    assert classify_statement("UPDATE users SET is_active=?") == ("update", "users")
+    assert classify_statement("DELETE FROM reviews WHERE id = ?") == ("delete", "reviews")
+    assert classify_statement("PRAGMA table_info(users)") == ("other", "other")
@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
@@ -7,6 +8,7 @@ from app.models.package import Package, PackageHolidayType
 from app.models.holiday_type import HolidayType
 from app.models.country import Country
 from app.models.region import Region
+from app.models.inclusion_exclusion import Inclusion, Exclusion
 
 def test_create_package(client: TestClient, db: Session, superuser_token_headers):
     """Test create package endpoint."""
@@ -525,3 +527,30 @@ def test_add_remove_holiday_type(client: TestClient, db: Session, superuser_toke
         PackageHolidayType.holiday_type_id == holiday_type.id
     ).first()
     assert db_package_holiday_type is None
+
+def test_fast_serialization_matches_response_model(client: TestClient, db: Session):
+    """Test that pre-rendered package lists match the validated response model output."""
+    region = Region(name="Test Region", description="Test Description", slug="test-region")
+    db.add(region)
+    db.commit()
+    country = Country(name="Test Country", description="Test Description", slug="test-country", region_id=region.id)
+    db.add(country)
+    db.commit()
+    db.add(Package(
+        name="Package 1", slug="package-1", country_id=country.id, price=999.99, duration_days=5,
+        holiday_types=[HolidayType(name="Safari", slug="safari")],
+        inclusion_items=[Inclusion(name="Breakfast")],
+        exclusion_items=[Exclusion(name="Flights")],
+    ))
+    db.commit()
+
+    url = f"{settings.API_V1_STR}/packages/"
+    fast = client.get(url)
+    with patch("app.core.serialization.settings.FAST_SERIALIZATION", False):
+        validated = client.get(url)
+
+    assert fast.status_code == validated.status_code == 200
+    assert fast.headers["content-type"] == "application/json"
+    assert fast.json() == validated.json()
+    assert fast.json()[0]["price"] == 999.99
+    assert fast.json()[0]["inclusion_items"][0]["name"] == "Breakfast"
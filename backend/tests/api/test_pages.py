@@ -0,0 +1,118 @@
+import asyncio
+import time
+
+from unittest.mock import AsyncMock, patch
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.api_v1.endpoints.pages import get_home_page
+from app.core.config import settings
+from app.core.response_cache import CachedResponse
+from app.services.pages import HOME_SECTIONS
+from tests.api.test_query_counts import create_catalog
+
+def get_section(name: str):
+    return next(section for section in HOME_SECTIONS if section.name == name)
+
+def test_home_page(client: TestClient, db: Session):
+    """Test that the home page returns every section."""
+    create_catalog(db, count=3)
+
+    response = client.get(f"{settings.API_V1_STR}/pages/home?limit=2")
+    assert response.status_code == 200
+    page = response.json()
+    assert page["degraded"] == []
+    assert len(page["featured_packages"]) == 2
+    assert page["featured_packages"][0]["country"]["name"] == "Test Country"
+    assert len(page["featured_group_trips"]) == 2
+    assert page["trending_destinations"][0]["slug"] == "test-country"
+    assert page["stats"]["group_trips"] == 3
+    assert page["recommended_hotels"] == []
+    assert page["blog_posts"] == []
+
+def test_home_page_section_fallbacks(client: TestClient, db: Session):
+    """Test that slow and failing sections are replaced by their fallback."""
+    create_catalog(db, count=1)
+
+    def slow(db, limit):
+        time.sleep(0.5)
+        return []
+
+    def failing(db, limit):
+        raise RuntimeError("boom")
+
+    with patch.object(get_section("trending_destinations"), "load", slow), \
+            patch.object(get_section("trending_destinations"), "timeout", 0.05), \
+            patch.object(get_section("stats"), "load", failing):
+        response = client.get(f"{settings.API_V1_STR}/pages/home")
+        assert response.status_code == 200
+        page = response.json()
+        assert page["degraded"] == ["stats", "trending_destinations"]
+        assert page["stats"] is None
+        assert page["trending_destinations"] == []
+        assert len(page["featured_packages"]) == 1
+
+    # Degraded pages aren't cached
+    response = client.get(f"{settings.API_V1_STR}/pages/home")
+    assert response.json()["degraded"] == []
+
+def test_home_page_cached_as_unit(client: TestClient, db: Session, superuser_token_headers):
+    """Test that the assembled page is cached and dropped when its data changes."""
+    ids = create_catalog(db, count=1)
+    url = f"{settings.API_V1_STR}/pages/home"
+    assert client.get(url).status_code == 200
+
+    with patch("app.services.pages.page_service.assemble") as assemble:
+        response = client.get(url)
+        assemble.assert_not_called()
+    assert response.json()["featured_packages"][0]["summary"] is None
+
+    response = client.put(
+        f"{settings.API_V1_STR}/packages/{ids['package_id']}",
+        headers=superuser_token_headers,
+        json={"summary": "Updated summary"},
+    )
+    assert response.status_code == 200
+    assert client.get(url).json()["featured_packages"][0]["summary"] == "Updated summary"
+
+def test_home_page_compresses_off_the_event_loop():
+    """Test that compressing a cold cache entry doesn't block the event loop."""
+    entry = CachedResponse(b"x" * 4096, time.monotonic() + 60, frozenset())
+    request = Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")],
+    })
+
+    def slow_compress(body, encoding):
+        time.sleep(0.3)
+        return b"compressed"
+
+    async def run():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        try:
+            response = await get_home_page(request, limit=8, db=None)
+        finally:
+            ticker.cancel()
+        return response, ticks
+
+    with patch("app.api.api_v1.endpoints.pages.response_cache.get_or_build_async",
+               AsyncMock(return_value=entry)), \
+            patch("app.core.response_cache.compress", slow_compress):
+        response, ticks = asyncio.run(run())
+
+    assert response.body == b"compressed"
+    assert response.headers["Content-Encoding"] == "gzip"
+    # The loop kept running other tasks while the body was compressed
+    assert ticks >= 10
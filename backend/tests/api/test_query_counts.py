@@ -0,0 +1,112 @@
+import re
+
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.country import Country
+from app.models.group_trip import GroupTrip
+from app.models.holiday_type import HolidayType
+from app.models.inclusion_exclusion import Exclusion, Inclusion
+from app.models.package import Package
+from app.models.region import Region
+
+# Expected queries per endpoint, independent of the number of rows returned
+ENDPOINT_QUERY_COUNTS = [
+    # Packages joined with their country, then one query per collection
+    ("/packages/", 4),
+    ("/packages/?popular=true", 4),
+    ("/packages/?country=Test Country", 5),
+    ("/packages/country/{country_id}", 4),
+    ("/packages/featured", 4),
+    ("/packages/{package_id}", 4),
+    ("/packages/slug/trip-0", 4),
+    ("/group-trips/", 3),
+    ("/group-trips/?featured=true", 3),
+    ("/group-trips/?country_id={country_id}", 3),
+    ("/group-trips/{group_trip_id}", 3),
+    ("/group-trips/slug/trip-0", 3),
+    # Sparse fieldsets only load the requested relationships
+    ("/packages/?fields=id,name,slug,price", 1),
+    ("/packages/?fields=id,name,country,holiday_types", 2),
+    ("/group-trips/?fields=id,name,inclusion_items", 2),
+]
+
+def create_catalog(db: Session, count: int) -> dict:
+    """
+    Create packages and group trips that each have holiday types, inclusions and exclusions.
+    """
+    region = Region(name="Test Region", description="Test Description", slug="test-region")
+    db.add(region)
+    db.flush()
+    country = Country(name="Test Country", description="Test Description", slug="test-country", region_id=region.id)
+    db.add(country)
+    db.flush()
+
+    packages, group_trips = [], []
+    for i in range(count):
+        holiday_type = HolidayType(name=f"Holiday Type {i}", slug=f"holiday-type-{i}")
+        inclusion = Inclusion(name=f"Inclusion {i}")
+        exclusion = Exclusion(name=f"Exclusion {i}")
+        packages.append(Package(
+            name=f"Package {i}", slug=f"trip-{i}", country_id=country.id, is_featured=True,
+            holiday_types=[holiday_type], inclusion_items=[inclusion], exclusion_items=[exclusion],
+        ))
+        group_trips.append(GroupTrip(
+            name=f"Group Trip {i}", slug=f"trip-{i}", country_id=country.id, is_featured=True,
+            holiday_types=[holiday_type], inclusion_items=[inclusion], exclusion_items=[exclusion],
+        ))
+    db.add_all(packages + group_trips)
+    db.commit()
+
+    ids = {"country_id": country.id, "package_id": packages[0].id, "group_trip_id": group_trips[0].id}
+    # Serialize from freshly loaded objects, as in a real request
+    db.expunge_all()
+    return ids
+
+def count_queries(client: TestClient, url: str) -> int:
+    """
+    Request a URL and return the number of database queries it ran.
+    """
+    with patch("app.core.middleware.settings.DEBUG", True):
+        response = client.get(f"{settings.API_V1_STR}{url}")
+    assert response.status_code == 200, response.text
+    return int(re.search(r'"(\d+) queries"', response.headers["Server-Timing"]).group(1))
+
+@pytest.mark.parametrize("url, expected", ENDPOINT_QUERY_COUNTS)
+def test_endpoint_query_count(client: TestClient, db: Session, url: str, expected: int):
+    """Test that list and detail endpoints run a fixed number of queries."""
+    ids = create_catalog(db, count=5)
+    assert count_queries(client, url.format(**ids)) == expected
+
+def test_sparse_fieldset_only_selects_requested_columns(client: TestClient, db: Session):
+    """Test that `fields=` limits both the response and the selected columns."""
+    from tests.conftest import engine
+
+    create_catalog(db, count=2)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get(f"{settings.API_V1_STR}/packages/?fields=id,name,slug,country")
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    packages = response.json()
+    assert set(packages[0]) == {"id", "name", "slug", "country"}
+    assert packages[0]["country"]["name"] == "Test Country"
+    package_selects = [statement for statement in statements if "FROM packages" in statement]
+    assert package_selects and all("packages.description" not in statement for statement in package_selects)
+
+def test_sparse_fieldset_rejects_unknown_fields(client: TestClient):
+    """Test that unknown fields are rejected."""
+    response = client.get(f"{settings.API_V1_STR}/packages/?fields=id,secret")
+    assert response.status_code == 400
+    assert "secret" in response.json()["detail"]
@@ -0,0 +1,20 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db.query_plans import HOT_PATHS, check_query_plans
+from tests.api.test_query_counts import create_catalog
+
+def test_hot_paths_use_indexes(db: Session):
+    """Test that no hot path scans its tables."""
+    create_catalog(db, count=3)
+    assert check_query_plans(db) == {}
+
+def test_missing_index_is_reported(db: Session):
+    """Test that a hot path whose index is missing fails the check."""
+    db.execute(text("DROP INDEX ix_group_trip_departures_group_trip_id_start_date"))
+    db.commit()
+
+    paths = [path for path in HOT_PATHS if path.name == "group_trip_departures"]
+    failures = check_query_plans(db, paths)
+    assert list(failures) == ["group_trip_departures"]
+    assert "full scan of group_trip_departures" in failures["group_trip_departures"][0]
@@ -0,0 +1,135 @@
+import asyncio
+import contextvars
+import io
+import threading
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+from prometheus_client import REGISTRY
+
+from app.core.config import settings
+from app.media.r2 import MB, CloudflareR2
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+def make_r2(client=None) -> CloudflareR2:
+    """Create a configured R2 client backed by a stubbed boto3 client."""
+    r2 = CloudflareR2()
+    r2.endpoint = "https://account.r2.cloudflarestorage.com"
+    r2.access_key = "access"
+    r2.secret_key = "secret"
+    r2.bucket_name = "bucket"
+    r2._client = client or MagicMock()
+    return r2
+
+def get_bytes(operation: str, direction: str) -> float:
+    """Get the recorded R2 byte count for an operation."""
+    value = REGISTRY.get_sample_value(
+        "external_api_bytes_total",
+        {"service": "r2", "operation": operation, "direction": direction},
+    )
+    return value or 0.0
+
+def test_client_uses_pool_and_timeouts():
+    """Test that the S3 client is built once with the pool, timeout and retry settings."""
+    r2 = make_r2()
+    r2._client = None
+
+    with patch("boto3.client") as mock_client:
+        assert r2.client is mock_client.return_value
+        assert r2.client is mock_client.return_value
+
+    mock_client.assert_called_once()
+    args, kwargs = mock_client.call_args
+    assert args == ("s3",)
+    assert kwargs["endpoint_url"] == r2.endpoint
+    assert kwargs["region_name"] == "auto"
+    config = kwargs["config"]
+    assert config.max_pool_connections == settings.R2_MAX_POOL_CONNECTIONS
+    assert config.connect_timeout == settings.R2_CONNECT_TIMEOUT
+    assert config.read_timeout == settings.R2_READ_TIMEOUT
+    assert config.retries == {"max_attempts": settings.R2_MAX_ATTEMPTS, "mode": "adaptive"}
+
+def test_client_is_not_built_when_unconfigured():
+    """Test that no S3 client is built without credentials."""
+    r2 = CloudflareR2()
+    r2.endpoint = None
+
+    with patch("boto3.client") as mock_client:
+        assert r2.client is None
+        assert r2.upload_file(io.BytesIO(b"data"), "key", "image/jpeg") is False
+
+    mock_client.assert_not_called()
+
+def test_upload_file_uses_transfer_config_and_counts_bytes():
+    """Test that uploads go through the multipart transfer config and count sent bytes."""
+    client = MagicMock()
+    client.upload_fileobj.side_effect = lambda *args, **kwargs: kwargs["Callback"](2048)
+    r2 = make_r2(client)
+    before = get_bytes("upload", "upload")
+
+    assert r2.upload_file(io.BytesIO(b"data"), "media/photo.jpg", "image/jpeg") is True
+
+    args, kwargs = client.upload_fileobj.call_args
+    assert args[1:] == ("bucket", "media/photo.jpg")
+    assert kwargs["ExtraArgs"]["ContentType"] == "image/jpeg"
+    config = kwargs["Config"]
+    assert config is r2.transfer_config
+    assert config.multipart_threshold == settings.R2_MULTIPART_THRESHOLD_MB * MB
+    assert config.multipart_chunksize == settings.R2_MULTIPART_CHUNKSIZE_MB * MB
+    assert config.max_concurrency == settings.R2_MAX_CONCURRENCY
+    assert get_bytes("upload", "upload") == before + 2048
+
+def test_upload_file_returns_false_on_client_error():
+    """Test that a failed upload is reported instead of raised."""
+    client = MagicMock()
+    client.upload_fileobj.side_effect = ClientError({"Error": {"Code": "500"}}, "PutObject")
+    r2 = make_r2(client)
+
+    assert r2.upload_file(io.BytesIO(b"data"), "media/photo.jpg", "image/jpeg") is False
+
+def test_read_file_counts_downloaded_bytes():
+    """Test that downloads and range reads count received bytes."""
+    client = MagicMock()
+    client.get_object.side_effect = lambda **kwargs: {"Body": io.BytesIO(b"x" * 10)}
+    r2 = make_r2(client)
+    before = get_bytes("download", "download")
+    before_range = get_bytes("download_range", "download")
+
+    assert r2.read_file("media/photo.jpg") == b"x" * 10
+    assert r2.read_file_range("media/photo.jpg", 0, 9) == b"x" * 10
+
+    assert client.get_object.call_args.kwargs["Range"] == "bytes=0-9"
+    assert get_bytes("download", "download") == before + 10
+    assert get_bytes("download_range", "download") == before_range + 10
+
+def test_async_methods_run_on_dedicated_executor():
+    """Test that the async wrappers run on the R2 thread pool in the caller's context."""
+    seen = {}
+
+    def head_object(**kwargs):
+        seen["thread"] = threading.current_thread().name
+        seen["request_id"] = request_id.get()
+        return {"ContentLength": 42, "ContentType": "image/jpeg", "ETag": '"abc"'}
+
+    client = MagicMock()
+    client.head_object.side_effect = head_object
+    client.list_objects_v2.return_value = {}
+    r2 = make_r2(client)
+
+    async def run():
+        request_id.set("req-1")
+        info = await r2.get_file_info_async("media/photo.jpg")
+        files = await r2.list_files_async("media/")
+        return info, files
+
+    try:
+        info, files = asyncio.run(run())
+    finally:
+        r2.shutdown()
+
+    assert info == {"key": "media/photo.jpg", "size": 42, "content_type": "image/jpeg", "etag": "abc"}
+    assert files == []
+    assert seen["thread"].startswith("r2")
+    assert seen["request_id"] == "req-1"
+    assert r2._executor is None
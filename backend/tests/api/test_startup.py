@@ -0,0 +1,36 @@
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent.parent
+
+def test_optional_clients_are_not_loaded_at_import():
+    """Test that importing the app doesn't load boto3, Meilisearch or OpenTelemetry."""
+    code = (
+        "import sys\n"
+        "import app.main\n"
+        "print('loaded:', [m for m in ('boto3', 'meilisearch', 'requests', 'opentelemetry')"
+        " if m in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "loaded: []" in result.stdout.splitlines()
+
+def test_r2_client_is_created_on_first_use():
+    """Test that the R2 client is only built when it is first needed."""
+    from app.media.r2 import CloudflareR2
+
+    r2 = CloudflareR2()
+    r2.endpoint, r2.access_key, r2.secret_key = "http://localhost:9000", "key", "secret"
+    assert r2._client is None
+
+    client = r2.client
+    assert client is r2.client
+    assert client.meta.endpoint_url == "http://localhost:9000"
@@ -0,0 +1,65 @@
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.group_trip import GroupTrip
+from app.models.hotel import Hotel
+from app.models.package import Package
+from app.services.stats import entity_counters
+from tests.api.test_query_counts import count_queries, create_catalog
+
+def test_stats_count_active_entities(client: TestClient, db: Session):
+    """Test that stats count active entities, in total and per country."""
+    ids = create_catalog(db, count=3)
+    db.add(Hotel(name="Inactive Hotel", slug="inactive-hotel", country_id=ids["country_id"], is_active=False))
+    db.add(Hotel(name="Test Hotel", slug="test-hotel", country_id=ids["country_id"]))
+    db.commit()
+
+    response = client.get(f"{settings.API_V1_STR}/stats/?by_country=true")
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["packages"] == 3
+    assert stats["group_trips"] == 3
+    assert stats["hotels"] == 1
+    assert stats["countries"] == 1
+    assert stats["by_country"][str(ids["country_id"])] == {
+        "packages": 3, "group_trips": 3, "hotels": 1, "attractions": 0, "accommodations": 0,
+    }
+    assert "by_country" not in client.get(f"{settings.API_V1_STR}/stats/").json()
+
+def test_stats_follow_committed_changes_without_queries(client: TestClient, db: Session):
+    """Test that committed changes update the counters and reads don't query."""
+    ids = create_catalog(db, count=2)
+    assert count_queries(client, "/stats/") > 0
+    assert count_queries(client, "/stats/") == 0
+
+    db.add(Package(name="New Package", slug="new-package", country_id=ids["country_id"]))
+    group_trip = db.get(GroupTrip, ids["group_trip_id"])
+    group_trip.is_active = False
+    db.delete(db.get(Package, ids["package_id"]))
+    db.commit()
+
+    # Flushed but rolled back changes are dropped
+    db.add(Package(name="Rolled Back", slug="rolled-back", country_id=ids["country_id"]))
+    db.flush()
+    db.rollback()
+
+    assert count_queries(client, "/stats/") == 0
+    stats = client.get(f"{settings.API_V1_STR}/stats/?by_country=true").json()
+    assert stats["packages"] == 2
+    assert stats["group_trips"] == 1
+    assert stats["by_country"][str(ids["country_id"])]["group_trips"] == 1
+
+def test_stats_reconcile_periodically(client: TestClient, db: Session):
+    """Test that the counters are reloaded once they are older than the reconcile interval."""
+    create_catalog(db, count=1)
+    client.get(f"{settings.API_V1_STR}/stats/")
+
+    # Bulk updates bypass the ORM events
+    db.query(Package).update({Package.is_active: False})
+    db.commit()
+    assert client.get(f"{settings.API_V1_STR}/stats/").json()["packages"] == 1
+
+    with patch.object(entity_counters, "reconcile_seconds", 0):
+        assert client.get(f"{settings.API_V1_STR}/stats/").json()["packages"] == 0
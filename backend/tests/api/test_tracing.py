@@ -0,0 +1,69 @@
+import pytest
+from unittest.mock import patch
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import StatusCode
+
+from app.core.trace_sampling import TailSamplingSpanProcessor
+from app.core.tracing import traced
+
+def make_tracer(sample_rate: float = 0.0, slow_threshold_ms: float = 1000):
+    """Create a tracer whose spans go through the tail sampler to an in-memory exporter."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(TailSamplingSpanProcessor(
+        SimpleSpanProcessor(exporter),
+        sample_rate=sample_rate,
+        slow_threshold_ms=slow_threshold_ms,
+    ))
+    return provider.get_tracer("test"), exporter
+
+def test_tail_sampler_keeps_errored_traces_and_drops_fast_ones():
+    """Test that whole traces are kept when a child span failed and dropped otherwise."""
+    tracer, exporter = make_tracer(sample_rate=0.0)
+
+    with tracer.start_as_current_span("fast-request"):
+        with tracer.start_as_current_span("child"):
+            pass
+    assert exporter.get_finished_spans() == ()
+
+    with tracer.start_as_current_span("failing-request"):
+        with pytest.raises(ValueError):
+            with tracer.start_as_current_span("child"):
+                raise ValueError("boom")
+
+    assert [span.name for span in exporter.get_finished_spans()] == ["child", "failing-request"]
+
+def test_tail_sampler_keeps_slow_traces():
+    """Test that traces whose root span exceeds the threshold are kept."""
+    tracer, exporter = make_tracer(sample_rate=0.0, slow_threshold_ms=0)
+
+    with tracer.start_as_current_span("slow-request"):
+        pass
+
+    assert [span.name for span in exporter.get_finished_spans()] == ["slow-request"]
+
+def test_traced_decorator_records_spans_and_errors():
+    """Test that decorated functions run in spans that record exceptions."""
+    tracer, exporter = make_tracer(sample_rate=1.0)
+
+    @traced("work")
+    def work(fail: bool) -> str:
+        if fail:
+            raise RuntimeError("failed")
+        return "done"
+
+    # Disabled tracing calls straight through
+    assert work(False) == "done"
+
+    with patch("app.core.tracing._tracing_enabled", True), patch("app.core.tracing.tracer", tracer):
+        assert work(False) == "done"
+        with pytest.raises(RuntimeError):
+            work(True)
+
+    spans = exporter.get_finished_spans()
+    assert [span.name for span in spans] == ["work", "work"]
+    assert spans[1].status.status_code == StatusCode.ERROR
+    assert spans[1].events[0].name == "exception"
@@ -7,6 +7,9 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
+from app.auth.principal_cache import principal_cache
+from app.core.response_cache import response_cache
+from app.services.stats import entity_counters
 from app.db.database import Base, get_db
 from app.core.config import settings
 
@@ -40,6 +43,12 @@ def db() -> Generator[Session, None, None]:
         
     # Drop the database tables
     Base.metadata.drop_all(bind=engine)
+    
+    # User IDs are reused by the next test
+    principal_cache.invalidate_all()
+    # Dropping the tables doesn't go through a session flush
+    response_cache.clear()
+    entity_counters.invalidate()
 
 @pytest.fixture(scope="function")
 def client(db: Session) -> Generator[TestClient, None, None]: